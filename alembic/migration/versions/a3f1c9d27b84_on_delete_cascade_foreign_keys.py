@@ -0,0 +1,49 @@
+"""On delete cascade foreign keys
+
+Revision ID: a3f1c9d27b84
+Revises: 5d80f1d16c2e
+Create Date: 2026-10-19 10:12:41.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d27b84'
+down_revision: Union[str, None] = '5d80f1d16c2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEYS = (
+    ('categories', 'parent_slug', 'categories', 'slug'),
+    ('products', 'category_slug', 'categories', 'slug'),
+    ('products', 'user_username', 'users', 'username'),
+    ('reviews', 'product_slug', 'products', 'slug'),
+    ('reviews', 'user_username', 'users', 'username'),
+)
+
+
+def _recreate_foreign_keys(ondelete: str | None) -> None:
+    """Пересоздание внешних ключей с указанным поведением при удалении."""
+    for table, column, referent_table, referent_column in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(
+            name,
+            table,
+            referent_table,
+            [column],
+            [referent_column],
+            ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_foreign_keys(None)
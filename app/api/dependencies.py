@@ -0,0 +1,82 @@
+"""Модуль для создания общих зависимостей маршрутов."""
+
+from typing import Callable
+
+from fastapi import Header, Query, Response
+from pydantic import BaseModel
+
+from app.core.deadlines import request_deadline
+from app.core.exceptions import ValidationError
+from app.crud import ModelType
+
+
+async def get_if_match_version(
+    if_match: str | None = Header(default=None)
+) -> int | None:
+    """
+    Зависимость для получения ожидаемой версии объекта.
+
+    Заголовок If-Match может содержать ETag ("3", W/"3") или версию (3).
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+    value = if_match.strip().removeprefix('W/').strip('"')
+    if not value.isdigit():
+        raise ValidationError('Невалидный заголовок If-Match.')
+    return int(value)
+
+
+def get_fields(schema: type[BaseModel]) -> Callable:
+    """
+    Функция для создания зависимости получения полей ответа.
+
+    Параметр fields содержит поля схемы чтения через запятую.
+    Поля возвращаются в порядке схемы, чтобы набор полей
+    однозначно определял схему ответа.
+    """
+    async def get_schema_fields(
+        fields: str | None = Query(
+            default=None,
+            description='Поля ответа через запятую.'
+        )
+    ) -> tuple[str, ...] | None:
+        """Зависимость для получения запрошенных полей ответа."""
+        if fields is None:
+            return None
+        requested = {field.strip() for field in fields.split(',')} - {''}
+        unknown = requested - schema.model_fields.keys()
+        if not requested or unknown:
+            raise ValidationError(
+                f'Неизвестные поля: {", ".join(sorted(unknown)) or fields}.'
+            )
+        return tuple(field for field in schema.model_fields
+                     if field in requested)
+
+    return get_schema_fields
+
+
+def set_deadline(seconds: float) -> Callable:
+    """
+    Функция для создания зависимости установки срока обработки запроса.
+
+    Зависимость роутера задает срок по умолчанию, зависимость маршрута
+    выполняется после нее и переопределяет срок.
+    """
+    async def set_request_deadline() -> None:
+        """Зависимость для установки срока обработки запроса."""
+        deadline = request_deadline.get()
+        if deadline is not None:
+            deadline.set(seconds)
+
+    return set_request_deadline
+
+
+def get_etag(model_obj: ModelType) -> str:
+    """Функция для получения ETag по версии объекта."""
+    return f'"{model_obj.version}"'
+
+
+def set_etag(response: Response, model_obj: ModelType) -> ModelType:
+    """Функция для установки заголовка ETag по версии объекта."""
+    response.headers['ETag'] = get_etag(model_obj)
+    return model_obj
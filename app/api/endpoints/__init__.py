@@ -1,6 +1,9 @@
 """Файл для инициализации пакета."""
 
+from .admin import router as admin_router
 from .categories import router as category_router
+from .leaderboards import router as leaderboard_router
+from .metrics import router as metrics_router
 from .products import router as product_router
 from .reviews import router as review_router
 from .users import auth_router, user_router
@@ -0,0 +1,122 @@
+"""Модуль создания служебных маршрутов для администратора."""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.permissions import check_admin_permission
+from app.api.routing import DeadlineRoute
+from app.core.exceptions import NotFoundError
+from app.core.instrumentation import slow_query_log
+from app.core.jobs import job_runner
+from app.core.leaderboards import leaderboard_refresher
+from app.core.profiling import profile_store
+from app.crud import rating_histogram_crud
+from app.models import User
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+@router.get(
+    '/jobs/',
+    response_model=dict[str, float]
+)
+async def get_jobs_metrics(
+    user: User = Depends(check_admin_permission)
+):
+    """Маршрут для получения глубины очереди и времени фоновых задач."""
+    return job_runner.get_metrics()
+
+
+@router.get(
+    '/slow-queries/',
+    response_model=list[dict[str, str | int | float]]
+)
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal[
+        'total_seconds', 'count', 'p95_seconds', 'max_seconds'
+    ] = 'total_seconds',
+    user: User = Depends(check_admin_permission)
+):
+    """
+    Маршрут для получения отпечатков SQL-запросов
+    с наибольшей нагрузкой на БД.
+    """
+    return slow_query_log.get_top(limit, order_by)
+
+
+@router.delete(
+    '/slow-queries/',
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None
+)
+async def reset_slow_queries(
+    user: User = Depends(check_admin_permission)
+):
+    """Маршрут для очистки статистики SQL-запросов."""
+    slow_query_log.reset()
+
+
+@router.get(
+    '/profiles/',
+    response_model=list[dict]
+)
+async def get_profiles(
+    user: User = Depends(check_admin_permission)
+):
+    """
+    Маршрут для получения последних профилей запросов
+    с временем по категориям.
+    """
+    return profile_store.list()
+
+
+@router.get(
+    '/profiles/collapsed/',
+    response_class=PlainTextResponse
+)
+async def get_profile(
+    profile_id: str,
+    user: User = Depends(check_admin_permission)
+):
+    """Маршрут для получения профиля запроса в свернутом формате."""
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise NotFoundError('Профиль не найден.')
+    return profile.collapsed
+
+
+@router.post(
+    '/rating-histograms/rebuild/',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=None
+)
+async def rebuild_rating_histograms(
+    user: User = Depends(check_admin_permission)
+):
+    """
+    Маршрут для пересчета гистограмм оценок всех продуктов по отзывам.
+
+    Пересчет выполняется фоновой задачей одним запросом с GROUP BY.
+    """
+    await job_runner.enqueue(rating_histogram_crud.rebuild)
+
+
+@router.post(
+    '/leaderboards/refresh/',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=None
+)
+async def refresh_leaderboards(
+    full: bool = False,
+    user: User = Depends(check_admin_permission)
+):
+    """
+    Маршрут для пересчета рейтингов таблиц лидеров.
+
+    Пересчет выполняется фоновой задачей. По умолчанию пересчитываются
+    только продукты с измененными отзывами, full пересчитывает все.
+    """
+    await job_runner.enqueue(leaderboard_refresher.refresh, full=full)
@@ -1,9 +1,17 @@
 """Модуль создания маршрутов для категорий."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies import (
+    get_etag,
+    get_fields,
+    get_if_match_version,
+    set_etag
+)
 from app.api.permissions import RequestContext, is_admin_permission
+from app.api.responses import SchemaResponse, get_adapter, get_list_adapter
+from app.api.routing import NegotiatedRoute
 from app.core.db import db_session
 from app.core.validators import (
     check_cant_change_parent_category,
@@ -17,7 +25,7 @@ from app.schemas import (
     CategoryUpdateSchema
 )
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -26,16 +34,22 @@ router = APIRouter()
 )
 async def get_categories(
     parent_slug: str = None,
+    fields: tuple[str, ...] | None = Depends(get_fields(CategoryReadSchema)),
     session: AsyncSession = Depends(db_session)
 ):
     """
     Маршрут для получения всех категорий.
 
     Так же можно отсортировать категории по родительской категории.
+    Параметр fields ограничивает поля ответа и колонки запроса.
     """
-    return await category_crud.get_subcategories_by_category_or_all(
+    categories = await category_crud.get_subcategories_by_category_or_all(
         parent_slug,
-        session
+        session,
+        fields
+    )
+    return SchemaResponse(
+        get_list_adapter(CategoryReadSchema, fields), categories
     )
 
 
@@ -45,10 +59,20 @@ async def get_categories(
 )
 async def get_category(
     category_slug: str,
+    fields: tuple[str, ...] | None = Depends(get_fields(CategoryReadSchema)),
     session: AsyncSession = Depends(db_session)
 ):
-    """Маршрут для получения категории."""
-    return await get_category_or_not_found(category_slug, session)
+    """
+    Маршрут для получения категории.
+
+    Параметр fields ограничивает поля ответа и колонки запроса.
+    """
+    category = await get_category_or_not_found(category_slug, session, fields)
+    return SchemaResponse(
+        get_adapter(CategoryReadSchema, fields),
+        category,
+        headers={'ETag': get_etag(category)}
+    )
 
 
 @router.post(
@@ -74,12 +98,21 @@ async def create_category(
 async def update_category(
     category_slug: str,
     schema: CategoryUpdateSchema,
+    response: Response,
+    version: int | None = Depends(get_if_match_version),
     cxt: RequestContext = Depends(is_admin_permission)
 ):
-    """Маршрут для изменения категории."""
+    """
+    Маршрут для изменения категории.
+
+    С заголовком If-Match категория изменяется только при совпадении версии.
+    """
     await check_cant_change_parent_category(category_slug, cxt['session'])
     await check_category_already_exists(schema.slug, cxt['session'])
-    return await category_crud.update(cxt['model_obj'], schema, cxt['session'])
+    category = await category_crud.update(
+        cxt['model_obj'], schema, cxt['session'], version
+    )
+    return set_etag(response, category)
 
 
 @router.delete(
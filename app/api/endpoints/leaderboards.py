@@ -0,0 +1,79 @@
+"""
+Модуль создания маршрутов для таблиц лидеров.
+
+Рейтинги заранее пересчитываются фоновой задачей, а первые места
+кэшируются в памяти воркера на LEADERBOARD_CACHE_TTL секунд.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import SchemaResponse, get_list_adapter
+from app.api.routing import NegotiatedRoute
+from app.core.config import settings
+from app.core.db import db_session
+from app.core.leaderboards import leaderboard_cache
+from app.core.validators import get_category_or_not_found
+from app.crud import product_ranking_crud
+from app.schemas import ProductRankingReadSchema
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+CACHE_CONTROL = f'public, max-age={int(settings.LEADERBOARD_CACHE_TTL)}'
+
+
+@router.get(
+    '/top-rated/',
+    response_model=list[ProductRankingReadSchema]
+)
+async def get_top_rated(
+    category_slug: str = None,
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(db_session)
+):
+    """
+    Маршрут для получения продуктов с наибольшим байесовским рейтингом.
+
+    Если у категории есть подкатегории, продукты из них тоже будут включены.
+    """
+    key = ('top-rated', category_slug, limit)
+    rankings = leaderboard_cache.get(key)
+    if rankings is None:
+        if category_slug:
+            await get_category_or_not_found(category_slug, session)
+        rankings = leaderboard_cache.set(
+            key,
+            await product_ranking_crud.get_top_rated(
+                category_slug, limit, session
+            )
+        )
+    return SchemaResponse(
+        get_list_adapter(ProductRankingReadSchema),
+        rankings,
+        headers={'Cache-Control': CACHE_CONTROL}
+    )
+
+
+@router.get(
+    '/trending/',
+    response_model=list[ProductRankingReadSchema]
+)
+async def get_trending(
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(db_session)
+):
+    """
+    Маршрут для получения продуктов с наибольшим байесовским рейтингом
+    по отзывам за последние LEADERBOARD_TRENDING_DAYS дней.
+    """
+    key = ('trending', limit)
+    rankings = leaderboard_cache.get(key)
+    if rankings is None:
+        rankings = leaderboard_cache.set(
+            key, await product_ranking_crud.get_trending(limit, session)
+        )
+    return SchemaResponse(
+        get_list_adapter(ProductRankingReadSchema),
+        rankings,
+        headers={'Cache-Control': CACHE_CONTROL}
+    )
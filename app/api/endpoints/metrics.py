@@ -0,0 +1,36 @@
+"""
+Модуль создания маршрута для метрик Prometheus.
+
+Под production-сервером с несколькими воркерами (задан
+PROMETHEUS_MULTIPROC_DIR) метрики собираются из файлов всех воркеров.
+"""
+
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess
+)
+
+router = APIRouter()
+
+
+def get_registry() -> CollectorRegistry:
+    """Функция для получения реестра метрик процесса или всех воркеров."""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@router.get('/metrics', include_in_schema=False)
+async def get_metrics():
+    """Маршрут для получения метрик в текстовом формате Prometheus."""
+    return Response(
+        generate_latest(get_registry()), media_type=CONTENT_TYPE_LATEST
+    )
@@ -1,27 +1,36 @@
 """Модуль создания маршрутов для продуктов."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies import (
+    get_etag,
+    get_fields,
+    get_if_match_version,
+    set_etag
+)
 from app.api.permissions import (
     RequestContext,
     is_supplier_or_admin_permission,
     is_supplier_owner_or_admin_permission
 )
+from app.api.responses import SchemaResponse, get_adapter, get_list_adapter
+from app.api.routing import NegotiatedRoute
 from app.core.db import db_session
 from app.core.validators import (
     check_product_already_exists,
     get_category_or_not_found,
     get_product_or_not_found
 )
-from app.crud import product_crud
+from app.crud import product_crud, similar_product_crud
 from app.schemas import (
     ProductCreateSchema,
     ProductReadSchema,
-    ProductUpdateSchema
+    ProductUpdateSchema,
+    SimilarProductReadSchema
 )
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -31,17 +40,23 @@ router = APIRouter()
 async def get_products(
     category_slug: str = None,
     is_active: bool = False,
+    fields: tuple[str, ...] | None = Depends(get_fields(ProductReadSchema)),
     session: AsyncSession = Depends(db_session)
 ):
     """
     Маршрут для получения всех продуктов по фильтру категории и наличии товара.
 
     Если у категории есть подкатегории, продукты из них тоже будут включены.
+    Параметр fields ограничивает поля ответа и колонки запроса.
     """
-    return await product_crud.get_products_by_category_or_is_active_or_all(
+    products = await product_crud.get_products_by_category_or_is_active_or_all(
         category_slug,
         is_active,
-        session
+        session,
+        fields
+    )
+    return SchemaResponse(
+        get_list_adapter(ProductReadSchema, fields), products
     )
 
 
@@ -51,10 +66,44 @@ async def get_products(
 )
 async def get_product(
     product_slug: str,
+    fields: tuple[str, ...] | None = Depends(get_fields(ProductReadSchema)),
     session: AsyncSession = Depends(db_session)
 ):
-    """Маршрут для получения продукта."""
-    return await get_product_or_not_found(product_slug, session)
+    """
+    Маршрут для получения продукта.
+
+    Параметр fields ограничивает поля ответа и колонки запроса.
+    """
+    product = await get_product_or_not_found(product_slug, session, fields)
+    return SchemaResponse(
+        get_adapter(ProductReadSchema, fields),
+        product,
+        headers={'ETag': get_etag(product)}
+    )
+
+
+@router.get(
+    '/{product_slug}/similar/',
+    response_model=list[SimilarProductReadSchema]
+)
+async def get_similar_products(
+    product_slug: str,
+    limit: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(db_session)
+):
+    """
+    Маршрут для получения продуктов, которые оценили пользователи,
+    оставившие отзыв на продукт.
+
+    Похожие продукты заранее рассчитываются командой
+    build-similar-products, маршрут читает их одним запросом по индексу.
+    """
+    similar = await similar_product_crud.get_for_product(
+        product_slug, limit, session
+    )
+    if not similar:
+        await get_product_or_not_found(product_slug, session, ('slug',))
+    return SchemaResponse(get_list_adapter(SimilarProductReadSchema), similar)
 
 
 @router.post(
@@ -79,10 +128,19 @@ async def create_product(
 async def update_product(
     product_slug: str,
     schema: ProductUpdateSchema,
+    response: Response,
+    version: int | None = Depends(get_if_match_version),
     cxt: RequestContext = Depends(is_supplier_owner_or_admin_permission),
 ):
-    """Маршрут для изменения продукта."""
-    return await product_crud.update(cxt['model_obj'], schema, cxt['session'])
+    """
+    Маршрут для изменения продукта.
+
+    С заголовком If-Match продукт изменяется только при совпадении версии.
+    """
+    product = await product_crud.update(
+        cxt['model_obj'], schema, cxt['session'], version
+    )
+    return set_etag(response, product)
 
 
 @router.delete(
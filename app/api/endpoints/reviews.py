@@ -1,26 +1,41 @@
 """Модуль создания маршрутов для отзывов."""
 
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies import (
+    get_etag,
+    get_fields,
+    get_if_match_version,
+    set_etag
+)
+from app.api.pagination import decode_cursor, encode_cursor, get_next_link
 from app.api.permissions import RequestContext, is_owner_or_admin_permission
+from app.api.responses import SchemaResponse, get_adapter, get_list_adapter
+from app.api.routing import NegotiatedRoute
+from app.core.constants import REVIEW_GRADES
 from app.core.db import db_session
 from app.core.security import get_current_user
 from app.core.validators import (
     check_cant_review_own_product,
     check_review_already_exists,
     get_product_or_not_found,
-    get_review_or_not_found
+    get_rating_histogram_or_not_found,
+    get_review_for_product_or_not_found
 )
 from app.crud import review_crud
+from app.crud.reviews import REVIEW_SORT_COLUMNS, ReviewSort
 from app.models import User
 from app.schemas import (
+    RatingHistogramReadSchema,
     ReviewCreateSchema,
     ReviewReadSchema,
     ReviewUpdateSchema
 )
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get(
@@ -29,15 +44,92 @@ router = APIRouter()
 )
 async def get_reviews(
     product_slug: str = None,
+    fields: tuple[str, ...] | None = Depends(get_fields(ReviewReadSchema)),
     session: AsyncSession = Depends(db_session),
 ):
-    """Маршрут для получения всех отзывов или по фильтру продукта."""
-    return await review_crud.get_reviews_by_product_or_all(
+    """
+    Маршрут для получения всех отзывов или по фильтру продукта.
+
+    Параметр fields ограничивает поля ответа и колонки запроса.
+    """
+    reviews = await review_crud.get_reviews_by_product_or_all(
         product_slug,
-        session
+        session,
+        fields
+    )
+    return SchemaResponse(get_list_adapter(ReviewReadSchema, fields), reviews)
+
+
+@router.get(
+    '/products/{product_slug}/reviews/',
+    response_model=list[ReviewReadSchema]
+)
+async def get_product_reviews(
+    request: Request,
+    product_slug: str,
+    sort: ReviewSort = 'newest',
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = Depends(get_fields(ReviewReadSchema)),
+    session: AsyncSession = Depends(db_session),
+):
+    """
+    Маршрут для получения страницы отзывов продукта.
+
+    Отзывы сортируются по дате (newest) или оценке (highest, lowest),
+    ссылка на следующую страницу возвращается в заголовке Link.
+    Параметр fields ограничивает поля ответа и колонки запроса.
+    """
+    column = REVIEW_SORT_COLUMNS[sort]
+    after = None
+    if cursor is not None:
+        after = decode_cursor(
+            cursor, datetime.fromisoformat if column == 'created_at' else int,
+            int
+        )
+    reviews = await review_crud.get_page_for_product(
+        product_slug, sort, limit, after, session, fields
+    )
+    if not reviews:
+        await get_product_or_not_found(product_slug, session, ('slug',))
+    headers = {}
+    if len(reviews) == limit:
+        last_review = reviews[-1]
+        next_cursor = encode_cursor(
+            getattr(last_review, column), last_review.id
+        )
+        headers['Link'] = get_next_link(request, next_cursor)
+    return SchemaResponse(
+        get_list_adapter(ReviewReadSchema, fields), reviews, headers=headers
     )
 
 
+@router.get(
+    '/products/{product_slug}/rating-histogram/',
+    response_model=RatingHistogramReadSchema
+)
+async def get_rating_histogram(
+    product_slug: str,
+    session: AsyncSession = Depends(db_session),
+):
+    """
+    Маршрут для получения количества отзывов продукта по оценкам.
+
+    Счетчики хранятся в таблице rating_histograms и изменяются вместе
+    с отзывами, поэтому маршрут не читает сами отзывы.
+    """
+    histogram = await get_rating_histogram_or_not_found(product_slug, session)
+    grades = (
+        histogram.get_grades() if histogram is not None
+        else dict.fromkeys(REVIEW_GRADES, 0)
+    )
+    return {
+        'product_slug': product_slug,
+        'grades': grades,
+        'total': sum(grades.values())
+    }
+
+
 @router.get(
     '/products/{product_slug}/reviews/{review_id}/',
     response_model=ReviewReadSchema
@@ -45,11 +137,22 @@ async def get_reviews(
 async def get_review(
     product_slug: str,
     review_id: int,
+    fields: tuple[str, ...] | None = Depends(get_fields(ReviewReadSchema)),
     session: AsyncSession = Depends(db_session),
 ):
-    """Маршрут для получения отзыва."""
-    await get_product_or_not_found(product_slug, session)
-    return await get_review_or_not_found(review_id, session)
+    """
+    Маршрут для получения отзыва.
+
+    Параметр fields ограничивает поля ответа и колонки запроса.
+    """
+    review = await get_review_for_product_or_not_found(
+        product_slug, review_id, session, fields
+    )
+    return SchemaResponse(
+        get_adapter(ReviewReadSchema, fields),
+        review,
+        headers={'ETag': get_etag(review)}
+    )
 
 
 @router.post(
@@ -78,10 +181,19 @@ async def update_review(
     product_slug: str,
     review_id: int,
     schema: ReviewUpdateSchema,
+    response: Response,
+    version: int | None = Depends(get_if_match_version),
     cxt: RequestContext = Depends(is_owner_or_admin_permission),
 ):
-    """Маршрут для изменения отзыва."""
-    return await review_crud.update(cxt['model_obj'], schema, cxt['session'])
+    """
+    Маршрут для изменения отзыва.
+
+    С заголовком If-Match отзыв изменяется только при совпадении версии.
+    """
+    review = await review_crud.update(
+        cxt['model_obj'], schema, cxt['session'], version
+    )
+    return set_etag(response, review)
 
 
 @router.delete(
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import DeadlineRoute, NegotiatedRoute
 from app.core.config import settings
 from app.core.db import db_session
 from app.core.security import (
@@ -16,8 +17,8 @@ from app.crud import user_crud
 from app.models import User
 from app.schemas import UserCreateSchema, UserReadSchema, UserUpdateSchema
 
-auth_router = APIRouter()
-user_router = APIRouter()
+auth_router = APIRouter(route_class=DeadlineRoute)
+user_router = APIRouter(route_class=NegotiatedRoute)
 
 
 @auth_router.post(
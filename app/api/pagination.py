@@ -0,0 +1,42 @@
+"""
+Модуль для постраничной выдачи по ключу (keyset pagination).
+
+Курсор - это значения ключа сортировки последнего объекта страницы,
+упакованные в JSON и base64. Следующая страница запрашивается
+после этого ключа, поэтому ее стоимость не зависит от номера.
+Ссылка на следующую страницу возвращается в заголовке Link
+(rel="next"), тело ответа остается списком.
+"""
+
+import base64
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(*values: Any) -> str:
+    """Функция для упаковки ключа объекта в курсор."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """
+    Функция для распаковки курсора в ключ.
+
+    Каждое значение ключа приводится функцией из types.
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor))
+        if len(values) != len(types):
+            raise ValueError
+        return tuple(type_(value) for type_, value in zip(types, values))
+    except (ValueError, TypeError):
+        raise ValidationError('Невалидный курсор.')
+
+
+def get_next_link(request: Request, cursor: str) -> str:
+    """Функция для получения заголовка Link на следующую страницу."""
+    return f'<{request.url.include_query_params(cursor=cursor)}>; rel="next"'
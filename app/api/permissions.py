@@ -7,11 +7,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenError
 from app.core.db import db_session
+from app.core.instrumentation import timed
+from app.core.tracing import traced
 from app.core.security import get_current_user
 from app.core.validators import (
     get_category_or_not_found,
     get_product_or_not_found,
-    get_review_or_not_found
+    get_review_for_product_or_not_found
 )
 from app.crud import ModelType
 from app.models import Product, Review, RoleEnum, User
@@ -32,6 +34,8 @@ class BasePermission:
         """Магический метод для инициализации объекта."""
         self.allowed_roles = allowed_roles
 
+    @traced()
+    @timed('permission')
     async def __call__(
         self,
         request: Request,
@@ -45,6 +49,7 @@ class BasePermission:
         await self.has_object_permission(user, model_obj)
         return RequestContext(user=user, session=session, model_obj=model_obj)
 
+    @traced()
     async def has_permission(self, user: User) -> True:
         """Разрешение на уровне запроса."""
         if user.role not in self.allowed_roles:
@@ -52,6 +57,7 @@ class BasePermission:
         return True
 
     @staticmethod
+    @traced()
     async def has_object_permission(user: User, obj: ModelType) -> True:
         """Разрешение на уровне объекта."""
         if not (user.role == RoleEnum.ADMIN or
@@ -60,6 +66,7 @@ class BasePermission:
         return True
 
     @staticmethod
+    @traced()
     async def get_object(params: dict, session: AsyncSession) -> ModelType:
         """Метод для получения объекта модели."""
 
@@ -72,12 +79,14 @@ class IsAdminPermission(BasePermission):
         super().__init__(RoleEnum.ADMIN)
 
     @staticmethod
+    @traced()
     async def get_object(params: dict, session: AsyncSession) -> ModelType:
         """Метод для получения объекта модели категории."""
         category_slug = params.get('category_slug')
         return await get_category_or_not_found(category_slug, session)
 
     @staticmethod
+    @traced()
     async def has_object_permission(user: User, obj: ModelType) -> True:
         """Разрешение на уровне объекта."""
         if not user.role == RoleEnum.ADMIN:
@@ -100,6 +109,7 @@ class IsSupplierOwnerOrAdminPermission(IsSupplierOrAdminPermission):
     """Разрешение для владельца продукта или же для администратора."""
 
     @staticmethod
+    @traced()
     async def get_object(params: dict, session: AsyncSession) -> Product:
         """Метод для получения объекта модели продукта."""
         product_slug = params.get('product_slug')
@@ -116,15 +126,28 @@ class IsOwnerOrAdminPermission(BasePermission):
                          RoleEnum.ADMIN)
 
     @staticmethod
+    @traced()
     async def get_object(params: dict, session: AsyncSession) -> Review:
         """Метод для получения объекта модели отзыва."""
-        product_slug = params.get('product_slug')
-        await get_product_or_not_found(product_slug, session)
-        review_id = params.get('review_id')
-        return await get_review_or_not_found(int(review_id), session)
+        return await get_review_for_product_or_not_found(
+            params.get('product_slug'), int(params.get('review_id')), session
+        )
 
 
 is_admin_permission = IsAdminPermission()
 is_supplier_or_admin_permission = IsSupplierOrAdminPermission()
 is_supplier_owner_or_admin_permission = IsSupplierOwnerOrAdminPermission()
 is_owner_or_admin_permission = IsOwnerOrAdminPermission()
+
+
+@traced()
+@timed('permission')
+async def check_admin_permission(
+    user: User = Depends(get_current_user)
+) -> User:
+    """
+    Функция для проверки прав администратора на служебных маршрутах,
+    которые не изменяют объект.
+    """
+    await is_admin_permission.has_permission(user)
+    return user
@@ -0,0 +1,152 @@
+"""
+Модуль для быстрой сериализации ответов.
+
+Списки ORM-объектов валидируются заранее собранными TypeAdapter
+один раз и сразу сериализуются в байты JSON без повторной проверки
+по response_model и без json.dumps.
+
+С параметром ?fields= используется схема только с запрошенными полями,
+адаптеры для каждого набора полей собираются один раз и кэшируются.
+
+Формат ответа (JSON или MessagePack) выбирается по заголовку Accept
+классом маршрута NegotiatedRoute и хранится в контекстной переменной.
+"""
+
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+import msgpack
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from app.core.instrumentation import measure
+from app.schemas import (
+    CategoryReadSchema,
+    ProductReadSchema,
+    ReviewReadSchema
+)
+
+
+@lru_cache
+def get_fields_schema(
+    schema: type[BaseModel],
+    fields: tuple[str, ...] | None = None
+) -> type[BaseModel]:
+    """Функция для получения схемы только с запрошенными полями."""
+    if fields is None:
+        return schema
+    return create_model(
+        f'{schema.__name__}Fields',
+        **{
+            name: (schema.model_fields[name].annotation,
+                   schema.model_fields[name])
+            for name in fields
+        }
+    )
+
+
+@lru_cache
+def get_adapter(
+    schema: type[BaseModel],
+    fields: tuple[str, ...] | None = None
+) -> TypeAdapter:
+    """Функция для получения адаптера схемы объекта."""
+    return TypeAdapter(get_fields_schema(schema, fields))
+
+
+@lru_cache
+def get_list_adapter(
+    schema: type[BaseModel],
+    fields: tuple[str, ...] | None = None
+) -> TypeAdapter:
+    """Функция для получения адаптера схемы списка объектов."""
+    return TypeAdapter(list[get_fields_schema(schema, fields)])
+
+
+category_list_adapter = get_list_adapter(CategoryReadSchema)
+product_list_adapter = get_list_adapter(ProductReadSchema)
+review_list_adapter = get_list_adapter(ReviewReadSchema)
+
+
+def build_adapters() -> None:
+    """
+    Функция для сборки адаптеров схем объектов до первого запроса.
+
+    Адаптеры списков собираются при импорте, адаптеры одного объекта -
+    при первом обращении, поэтому их нужно собрать при запуске.
+    """
+    for schema in (CategoryReadSchema, ProductReadSchema, ReviewReadSchema):
+        get_adapter(schema)
+        get_list_adapter(schema).dump_json([])
+
+
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, 'application/x-msgpack')
+
+response_media_type: ContextVar[str] = ContextVar(
+    'response_media_type', default=JSON_MEDIA_TYPE
+)
+
+
+def negotiate_media_type(accept: str) -> str:
+    """
+    Функция для выбора формата ответа по заголовку Accept.
+
+    MessagePack выбирается, только если клиент явно предпочитает его JSON.
+    """
+    qualities = {}
+    for item in accept.lower().split(','):
+        media_type, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        qualities[media_type.strip()] = quality
+    msgpack_quality = max(
+        qualities.get(media_type, 0) for media_type in MSGPACK_MEDIA_TYPES
+    )
+    json_quality = qualities.get(JSON_MEDIA_TYPE, 0)
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+class NegotiatedResponse(ORJSONResponse):
+    """Ответ в формате JSON или MessagePack по заголовку Accept запроса."""
+
+    def __init__(self, content: Any = None, **kwargs):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.media_type = response_media_type.get()
+        super().__init__(content, **kwargs)
+        self.headers.add_vary_header('Accept')
+
+    def render(self, content: Any) -> bytes:
+        """Метод для сериализации содержимого ответа."""
+        with measure('serialization'):
+            if self.media_type == MSGPACK_MEDIA_TYPE:
+                return msgpack.packb(content)
+            return super().render(content)
+
+
+class SchemaResponse(Response):
+    """Ответ с уже сериализованным по схеме телом JSON или MessagePack."""
+
+    def __init__(self, adapter: TypeAdapter, data: Any, **kwargs):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.media_type = response_media_type.get()
+        with measure('serialization'):
+            validated = adapter.validate_python(data, from_attributes=True)
+            if self.media_type == MSGPACK_MEDIA_TYPE:
+                content = msgpack.packb(
+                    adapter.dump_python(validated, mode='json')
+                )
+            else:
+                content = adapter.dump_json(validated)
+        super().__init__(content=content, **kwargs)
+        self.headers.add_vary_header('Accept')
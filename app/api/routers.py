@@ -1,25 +1,68 @@
-"""Модуль для создания основного маршрута."""
+"""
+Модуль для создания основного маршрута.
 
-from fastapi import APIRouter
+Каждый роутер задает срок обработки своих запросов по умолчанию,
+маршрут может переопределить его зависимостью set_deadline.
+"""
 
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import set_deadline
 from app.api.endpoints import (
+    admin_router,
     auth_router,
     category_router,
+    leaderboard_router,
+    metrics_router,
     product_router,
     review_router,
     user_router
 )
+from app.core.config import settings
+
+catalog_deadline = Depends(set_deadline(settings.CATALOG_DEADLINE))
+account_deadline = Depends(set_deadline(settings.ACCOUNT_DEADLINE))
+admin_deadline = Depends(set_deadline(settings.ADMIN_DEADLINE))
 
 main_router = APIRouter(prefix='/api/v1')
 
 main_router.include_router(
-    category_router, prefix='/categories', tags=['Category']
+    category_router,
+    prefix='/categories',
+    tags=['Category'],
+    dependencies=[catalog_deadline]
+)
+main_router.include_router(
+    product_router,
+    prefix='/products',
+    tags=['Product'],
+    dependencies=[catalog_deadline]
+)
+main_router.include_router(
+    review_router, tags=['Review'], dependencies=[catalog_deadline]
+)
+main_router.include_router(
+    leaderboard_router,
+    prefix='/leaderboards',
+    tags=['Leaderboard'],
+    dependencies=[catalog_deadline]
 )
 main_router.include_router(
-    product_router, prefix='/products', tags=['Product']
+    auth_router, prefix='/auth', tags=['Auth'], dependencies=[account_deadline]
 )
 main_router.include_router(
-    review_router, tags=['Review']
+    user_router,
+    prefix='/users',
+    tags=['Users'],
+    dependencies=[account_deadline]
 )
-main_router.include_router(auth_router, prefix='/auth', tags=['Auth'])
-main_router.include_router(user_router, prefix='/users', tags=['Users'])
+main_router.include_router(
+    admin_router,
+    prefix='/admin',
+    tags=['Admin'],
+    dependencies=[admin_deadline]
+)
+
+service_router = APIRouter()
+
+service_router.include_router(metrics_router, tags=['Service'])
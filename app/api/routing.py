@@ -0,0 +1,157 @@
+"""
+Модуль с классами маршрутов API.
+
+Маршрут ограничивает время обработки запроса сроком, который задают
+зависимости роутера или маршрута (set_deadline). По истечении срока
+или при отмене SQL-запроса по statement_timeout возвращается 504.
+
+Маршрут с согласованием формата выбирает формат ответа по заголовку
+Accept и принимает тело запроса в формате MessagePack наравне с JSON.
+
+С заголовком X-Profile: 1 запрос администратора выполняется
+под сэмплирующим профилировщиком, идентификатор сохраненного профиля
+и время по категориям возвращаются в заголовках ответа.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, Callable, Coroutine
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import DBAPIError
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.api.permissions import check_admin_permission
+from app.api.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    negotiate_media_type,
+    response_media_type
+)
+from app.core.deadlines import Deadline, is_query_canceled, request_deadline
+from app.core.exceptions import GatewayTimeoutError
+from app.core.profiling import Profile, SamplingProfiler, profile_store
+
+PROFILE_HEADER = 'x-profile'
+PROFILE_HEADER_VALUE = '1'
+DEADLINE_EXCEEDED = 'Время обработки запроса истекло.'
+
+
+class MsgPackRequest(Request):
+    """
+    Запрос с телом в формате MessagePack.
+
+    FastAPI разбирает тело через request.json() только для JSON,
+    поэтому запрос отдает тип содержимого как JSON, а json()
+    распаковывает MessagePack.
+    """
+
+    @property
+    def headers(self) -> Headers:
+        """Заголовки запроса с типом содержимого JSON."""
+        if not hasattr(self, '_headers'):
+            headers = MutableHeaders(raw=list(self.scope['headers']))
+            headers['content-type'] = JSON_MEDIA_TYPE
+            self._headers = Headers(raw=headers.raw)
+        return self._headers
+
+    async def json(self) -> Any:
+        """Метод для распаковки тела запроса."""
+        if not hasattr(self, '_json'):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+profiling_dependant = get_dependant(path='', call=check_admin_permission)
+
+
+class DeadlineRoute(APIRoute):
+    """Класс маршрута с ограничением времени обработки запроса."""
+
+    def get_route_handler(
+        self
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Метод для получения обработчика запроса."""
+        route_handler = super().get_route_handler()
+
+        async def deadline_route_handler(request: Request) -> Response:
+            deadline = Deadline()
+            token = request_deadline.set(deadline)
+            try:
+                return await route_handler(request)
+            except asyncio.CancelledError:
+                if not deadline.expired:
+                    raise
+                if hasattr(deadline.task, 'uncancel'):
+                    deadline.task.uncancel()
+                raise GatewayTimeoutError(DEADLINE_EXCEEDED)
+            except DBAPIError as error:
+                if not is_query_canceled(error):
+                    raise
+                raise GatewayTimeoutError(DEADLINE_EXCEEDED)
+            finally:
+                deadline.cancel()
+                request_deadline.reset(token)
+
+        return deadline_route_handler
+
+
+class NegotiatedRoute(DeadlineRoute):
+    """Класс маршрута с поддержкой MessagePack в запросе и ответе."""
+
+    def get_route_handler(
+        self
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Метод для получения обработчика запроса."""
+        route_handler = super().get_route_handler()
+
+        async def negotiated_route_handler(request: Request) -> Response:
+            content_type = request.headers.get('content-type', '')
+            if content_type.split(';')[0].strip() in MSGPACK_MEDIA_TYPES:
+                request = MsgPackRequest(request.scope, request.receive)
+            token = response_media_type.set(
+                negotiate_media_type(request.headers.get('accept', ''))
+            )
+            try:
+                profile = request.headers.get(PROFILE_HEADER)
+                if profile == PROFILE_HEADER_VALUE:
+                    return await self.profile(route_handler, request)
+                return await route_handler(request)
+            finally:
+                response_media_type.reset(token)
+
+        return negotiated_route_handler
+
+    async def profile(
+        self,
+        route_handler: Callable[[Request], Coroutine[Any, Any, Response]],
+        request: Request
+    ) -> Response:
+        """
+        Метод для выполнения запроса под профилировщиком.
+
+        Право проверяется теми же зависимостями, что и у маршрутов
+        администратора, с учетом их переопределений.
+        """
+        async with AsyncExitStack() as stack:
+            solved = await solve_dependencies(
+                request=request,
+                dependant=profiling_dependant,
+                dependency_overrides_provider=(
+                    self.dependency_overrides_provider
+                ),
+                async_exit_stack=stack,
+                embed_body_fields=False
+            )
+            await check_admin_permission(**solved.values)
+        with SamplingProfiler() as profiler:
+            response = await route_handler(request)
+        profile = profile_store.add(
+            Profile(request.method, self.path, profiler)
+        )
+        response.headers['X-Profile-Id'] = profile.id
+        response.headers['X-Profile-Breakdown'] = profile.format_breakdown()
+        return response
@@ -0,0 +1,250 @@
+"""
+Модуль для запуска команд управления.
+
+Пример:
+    python -m app.cli import-products products.csv --username supplier
+    python -m app.cli seed --products 1000000 --reviews 20000000
+    python -m app.cli rebuild-rating-histograms
+    python -m app.cli refresh-leaderboards --full
+    python -m app.cli build-similar-products --top-k 10 --processes 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.cli import seed, similar_products
+from app.cli.import_products import DEFAULT_BATCH_SIZE, import_products
+from app.core.config import settings
+from app.core.leaderboards import leaderboard_refresher
+from app.crud import rating_histogram_crud
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Функция для создания парсера аргументов командной строки."""
+    parser = argparse.ArgumentParser(prog='python -m app.cli')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser(
+        'import-products',
+        help='Потоковый импорт продуктов из CSV или NDJSON файла.'
+    )
+    import_parser.add_argument('path', help='Путь к .csv или .ndjson файлу.')
+    import_parser.add_argument(
+        '--username',
+        required=True,
+        help='Имя пользователя-владельца новых продуктов.'
+    )
+    import_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help='Количество строк в одной пачке загрузки.'
+    )
+    import_parser.add_argument(
+        '--rejects',
+        default=None,
+        help='CSV файл для отклоненных строк (по умолчанию stderr).'
+    )
+
+    seed_parser = commands.add_parser(
+        'seed',
+        help='Заполнение пустой БД синтетическим каталогом.'
+    )
+    plan = seed.SeedPlan()
+    for name in ('customers', 'suppliers', 'root_categories', 'depth',
+                 'max_fanout', 'products', 'reviews', 'passwords',
+                 'batch_size', 'seed'):
+        seed_parser.add_argument(
+            f'--{name.replace("_", "-")}',
+            type=int,
+            default=getattr(plan, name)
+        )
+    seed_parser.add_argument(
+        '--zipf',
+        type=float,
+        default=plan.zipf,
+        help='Показатель закона Ципфа для популярности.'
+    )
+    seed_parser.add_argument(
+        '--processes',
+        type=int,
+        default=os.cpu_count(),
+        help='Процессов генерации (0 - без пула процессов).'
+    )
+    seed_parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Параллельных соединений для загрузки.'
+    )
+
+    commands.add_parser(
+        'rebuild-rating-histograms',
+        help='Пересчет гистограмм оценок продуктов по отзывам.'
+    )
+
+    leaderboards_parser = commands.add_parser(
+        'refresh-leaderboards',
+        help='Пересчет рейтингов продуктов для таблиц лидеров.'
+    )
+    leaderboards_parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Пересчитать все рейтинги, а не только измененные.'
+    )
+
+    similar_parser = commands.add_parser(
+        'build-similar-products',
+        help='Расчет похожих продуктов по отзывам одних пользователей.'
+    )
+    similar_parser.add_argument(
+        '--top-k',
+        type=int,
+        default=similar_products.DEFAULT_TOP_K,
+        help='Количество похожих продуктов для продукта.'
+    )
+    similar_parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=similar_products.DEFAULT_CHUNK_SIZE,
+        help='Количество продуктов в одной пачке расчета.'
+    )
+    similar_parser.add_argument(
+        '--fetch-size',
+        type=int,
+        default=similar_products.DEFAULT_FETCH_SIZE,
+        help='Количество отзывов, читаемых из БД за раз.'
+    )
+    similar_parser.add_argument(
+        '--processes',
+        type=int,
+        default=os.cpu_count(),
+        help=(
+            'Процессов расчета (0 - без пула процессов). Процессы '
+            'разделяют матрицу отзывов с родительским через fork.'
+        )
+    )
+    return parser
+
+
+async def run_import_products(args: argparse.Namespace) -> int:
+    """Функция для запуска команды импорта продуктов."""
+    engine = create_async_engine(settings.db_url)
+    rejects = (
+        open(args.rejects, 'w', newline='', encoding='utf-8')
+        if args.rejects else sys.stderr
+    )
+    try:
+        report = await import_products(
+            args.path,
+            args.username,
+            engine,
+            rejects,
+            batch_size=args.batch_size
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    finally:
+        if rejects is not sys.stderr:
+            rejects.close()
+        await engine.dispose()
+    print(report)
+    return 0 if not report.rejected else 1
+
+
+async def run_seed(args: argparse.Namespace) -> int:
+    """Функция для запуска команды заполнения БД каталогом."""
+    engine = create_async_engine(settings.db_url)
+    plan = seed.SeedPlan(
+        customers=args.customers,
+        suppliers=args.suppliers,
+        root_categories=args.root_categories,
+        depth=args.depth,
+        max_fanout=args.max_fanout,
+        products=args.products,
+        reviews=args.reviews,
+        zipf=args.zipf,
+        passwords=args.passwords,
+        batch_size=args.batch_size,
+        seed=args.seed
+    )
+    try:
+        report = await seed.seed_catalog(
+            engine, plan, processes=args.processes, workers=args.workers
+        )
+    finally:
+        await engine.dispose()
+    print(report)
+    return 0
+
+
+async def run_rebuild_rating_histograms(args: argparse.Namespace) -> int:
+    """Функция для запуска команды пересчета гистограмм оценок."""
+    engine = create_async_engine(settings.db_url)
+    try:
+        async with AsyncSession(engine) as session:
+            rows = await rating_histogram_crud.rebuild(session)
+    finally:
+        await engine.dispose()
+    print(f'rating_histograms: {rows}')
+    return 0
+
+
+async def run_refresh_leaderboards(args: argparse.Namespace) -> int:
+    """
+    Функция для запуска команды пересчета рейтингов.
+
+    Процесс команды не хранит время прошлого пересчета, поэтому
+    рейтинги за все время пересчитываются полностью.
+    """
+    engine = create_async_engine(settings.db_url)
+    try:
+        async with AsyncSession(engine) as session:
+            report = await leaderboard_refresher.refresh(
+                session, full=args.full
+            )
+    finally:
+        await engine.dispose()
+    print(', '.join(f'{name}: {rows}' for name, rows in report.items()))
+    return 0
+
+
+async def run_build_similar_products(args: argparse.Namespace) -> int:
+    """Функция для запуска команды расчета похожих продуктов."""
+    engine = create_async_engine(settings.db_url)
+    try:
+        report = await similar_products.build_similar_products(
+            engine,
+            top_k=args.top_k,
+            chunk_size=args.chunk_size,
+            processes=args.processes,
+            fetch_size=args.fetch_size
+        )
+    finally:
+        await engine.dispose()
+    print(report)
+    return 0
+
+
+COMMANDS = {
+    'import-products': run_import_products,
+    'seed': run_seed,
+    'rebuild-rating-histograms': run_rebuild_rating_histograms,
+    'refresh-leaderboards': run_refresh_leaderboards,
+    'build-similar-products': run_build_similar_products,
+}
+
+
+def main() -> int:
+    """Точка входа для команд управления."""
+    args = create_parser().parse_args()
+    return asyncio.run(COMMANDS[args.command](args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
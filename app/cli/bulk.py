@@ -0,0 +1,32 @@
+"""
+Модуль для пакетной загрузки строк в таблицу.
+
+Для PostgreSQL используется COPY, для остальных БД - многострочный
+INSERT. Строки передаются кортежами в порядке колонок.
+"""
+
+from typing import Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def load_records(
+    conn: AsyncConnection,
+    table: Table,
+    columns: Sequence[str],
+    records: list[tuple]
+) -> None:
+    """Функция для загрузки пачки строк в таблицу."""
+    if conn.dialect.name == 'postgresql':
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=list(columns)
+        )
+        return
+    await conn.execute(
+        insert(table),
+        [dict(zip(columns, record)) for record in records]
+    )
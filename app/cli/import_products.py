@@ -0,0 +1,303 @@
+"""
+Модуль для потокового импорта продуктов из CSV или NDJSON файла.
+
+Строки файла читаются и валидируются по одной, пачками загружаются
+во временную таблицу (через COPY для PostgreSQL и многострочный INSERT
+для SQLite), после чего категории разрешаются и продукты вставляются
+или обновляются одним запросом INSERT ... SELECT ... ON CONFLICT.
+Память расходуется только на одну пачку строк.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    FromClause,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    func,
+    literal,
+    select
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
+
+from app.cli.bulk import load_records
+from app.models import Category, Product, User
+from app.schemas import ProductImportSchema
+
+DEFAULT_BATCH_SIZE = 10_000
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+staging_metadata = MetaData()
+
+staging_table = Table(
+    'products_import',
+    staging_metadata,
+    Column('line_no', Integer, primary_key=True, autoincrement=False),
+    Column('name', String),
+    Column('slug', String),
+    Column('description', Text),
+    Column('price', Float),
+    Column('image_url', String),
+    Column('stock', Integer),
+    Column('category_slug', String),
+    prefixes=['TEMPORARY']
+)
+staging_slug_index = Index(
+    'ix_products_import_slug',
+    staging_table.c.slug,
+    staging_table.c.line_no
+)
+
+STAGING_COLUMNS = tuple(column.name for column in staging_table.columns)
+UPSERT_COLUMNS = (
+    'name', 'slug', 'description', 'price',
+    'image_url', 'stock', 'category_slug'
+)
+
+
+class ImportReport:
+    """Класс для подсчета результатов импорта и вывода отклоненных строк."""
+
+    def __init__(self, rejects: TextIO):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.total = 0
+        self.rejected = 0
+        self.upserted = 0
+        self.writer = csv.writer(rejects)
+        self.writer.writerow(('line', 'error'))
+
+    def reject(self, line_no: int, error: str) -> None:
+        """Метод для записи отклоненной строки."""
+        self.rejected += 1
+        self.writer.writerow((line_no, error))
+
+    def __str__(self) -> str:
+        """Магический метод для вывода итогов импорта."""
+        return (
+            f'Прочитано строк: {self.total}, '
+            f'импортировано: {self.upserted}, '
+            f'отклонено: {self.rejected}'
+        )
+
+
+def read_rows(path: Path) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Функция для потокового чтения строк файла.
+
+    Возвращает номер строки, данные строки или текст ошибки разбора.
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        if path.suffix in NDJSON_SUFFIXES:
+            for line_no, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line), None
+                except json.JSONDecodeError as error:
+                    yield line_no, None, f'Невалидный JSON: {error.msg}'
+            return
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, {
+                key: value for key, value in row.items() if value != ''
+            }, None
+
+
+def validate_row(line_no: int, data: dict) -> tuple:
+    """Функция для валидации строки и преобразования ее в запись."""
+    schema = ProductImportSchema.model_validate(data)
+    return (
+        line_no,
+        schema.name,
+        schema.slug,
+        schema.description,
+        schema.price,
+        str(schema.image_url),
+        schema.stock,
+        schema.category_slug
+    )
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """Функция для краткого описания ошибок валидации строки."""
+    return '; '.join(
+        f'{".".join(map(str, e["loc"]))}: {e["msg"]}' for e in error.errors()
+    )
+
+
+async def load_batch(conn: AsyncConnection, records: list[tuple]) -> None:
+    """Функция для загрузки пачки записей во временную таблицу."""
+    await load_records(conn, staging_table, STAGING_COLUMNS, records)
+
+
+def has_category(table: FromClause) -> ColumnElement[bool]:
+    """Функция для условия, что категория строки существует."""
+    return (
+        select(Category.id).
+        where(Category.slug == table.c.category_slug).
+        exists()
+    )
+
+
+def has_foreign_product(
+    table: FromClause,
+    username: str
+) -> ColumnElement[bool]:
+    """Функция для условия, что продукт строки принадлежит другому."""
+    return (
+        select(Product.id).
+        where(Product.slug == table.c.slug,
+              Product.user_username != username).
+        exists()
+    )
+
+
+def is_importable(table: FromClause, username: str) -> ColumnElement[bool]:
+    """
+    Функция для условия, что строку можно импортировать: категория
+    существует, а продукт новый или принадлежит пользователю.
+    """
+    return and_(has_category(table), ~has_foreign_product(table, username))
+
+
+async def report_unresolved_rows(
+    conn: AsyncConnection,
+    username: str,
+    report: ImportReport
+) -> None:
+    """
+    Функция для вывода строк с несуществующей категорией, строк
+    с продуктом другого пользователя и строк, перекрытых более
+    поздней импортируемой строкой с тем же slug.
+
+    Каждая строка выводится один раз с первой найденной причиной.
+    """
+    unknown_category = await conn.stream(
+        select(staging_table.c.line_no, staging_table.c.category_slug).
+        where(~has_category(staging_table)).
+        order_by(staging_table.c.line_no)
+    )
+    async for line_no, category_slug in unknown_category:
+        report.reject(line_no, f'Категории {category_slug} не существует.')
+    foreign_products = await conn.stream(
+        select(staging_table.c.line_no, staging_table.c.slug).
+        where(has_category(staging_table),
+              has_foreign_product(staging_table, username)).
+        order_by(staging_table.c.line_no)
+    )
+    async for line_no, slug in foreign_products:
+        report.reject(
+            line_no, f'Продукт {slug} принадлежит другому пользователю.'
+        )
+    newer = staging_table.alias('newer')
+    duplicates = await conn.stream(
+        select(staging_table.c.line_no, staging_table.c.slug).
+        where(
+            is_importable(staging_table, username),
+            select(newer.c.line_no).
+            where(newer.c.slug == staging_table.c.slug,
+                  newer.c.line_no > staging_table.c.line_no,
+                  is_importable(newer, username)).
+            exists()
+        ).
+        order_by(staging_table.c.line_no)
+    )
+    async for line_no, slug in duplicates:
+        report.reject(line_no, f'Продукт {slug} перезаписан строкой ниже.')
+
+
+async def upsert_products(conn: AsyncConnection, username: str) -> int:
+    """
+    Функция для вставки или обновления продуктов из временной таблицы.
+
+    Для каждого slug берется последняя импортируемая строка файла.
+    Продукты других пользователей не обновляются.
+    """
+    latest_lines = (
+        select(func.max(staging_table.c.line_no)).
+        where(is_importable(staging_table, username)).
+        group_by(staging_table.c.slug)
+    )
+    source = (
+        select(
+            *(staging_table.c[column] for column in UPSERT_COLUMNS),
+            literal(username).label('user_username')
+        ).
+        where(staging_table.c.line_no.in_(latest_lines))
+    )
+    dialect_insert = (
+        postgresql_insert if conn.dialect.name == 'postgresql'
+        else sqlite_insert
+    )
+    query = dialect_insert(Product).from_select(
+        (*UPSERT_COLUMNS, 'user_username'),
+        source
+    )
+    query = query.on_conflict_do_update(
+        index_elements=(Product.slug,),
+        set_={
+            **{
+                column: query.excluded[column]
+                for column in UPSERT_COLUMNS if column != 'slug'
+            },
+            'updated_at': func.now(),
+            'version': Product.version + 1
+        },
+        where=Product.user_username == username
+    )
+    result = await conn.execute(query)
+    return result.rowcount
+
+
+async def import_products(
+    path: str | Path,
+    username: str,
+    engine: AsyncEngine,
+    rejects: TextIO,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> ImportReport:
+    """Функция для потокового импорта продуктов из файла."""
+    path = Path(path)
+    report = ImportReport(rejects)
+    async with engine.begin() as conn:
+        user_id = await conn.scalar(
+            select(User.id).where(User.username == username)
+        )
+        if user_id is None:
+            raise ValueError(f'Пользователя {username} не существует.')
+        await conn.execute(CreateTable(staging_table))
+        records = []
+        for line_no, data, error in read_rows(path):
+            report.total += 1
+            if error is None:
+                try:
+                    records.append(validate_row(line_no, data))
+                except ValidationError as validation_error:
+                    error = format_validation_error(validation_error)
+            if error is not None:
+                report.reject(line_no, error)
+            if len(records) >= batch_size:
+                await load_batch(conn, records)
+                records = []
+        if records:
+            await load_batch(conn, records)
+        await conn.execute(CreateIndex(staging_slug_index))
+        await report_unresolved_rows(conn, username, report)
+        report.upserted = await upsert_products(conn, username)
+        await conn.execute(DropTable(staging_table))
+    return report
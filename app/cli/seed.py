@@ -0,0 +1,478 @@
+"""
+Модуль для заполнения БД синтетическим каталогом большого объема.
+
+Распределения приближены к реальным: популярность продуктов,
+количество отзывов на продукт и выбор категорий и поставщиков
+подчиняются закону Ципфа, ветвление дерева категорий - распределению
+Парето. Номер продукта совпадает с его местом по популярности,
+поэтому product-0 - самый популярный продукт с наибольшим числом
+отзывов.
+
+Строки генерируются пачками в пуле процессов, а загружаются
+несколькими соединениями параллельно (COPY для PostgreSQL
+и многострочный INSERT для остальных БД). Каждая пачка генерируется
+своим генератором случайных чисел от seed, имени таблицы и номера
+пачки, поэтому результат не зависит от числа процессов и соединений.
+
+bcrypt вычисляется только для небольшого набора паролей:
+у пользователя с номером i пароль get_password(i, passwords).
+
+Отзывы загружаются в обход CRUD, поэтому гистограммы оценок
+пересчитываются после загрузки одним запросом.
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from typing import Iterator
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.cli.bulk import load_records
+from app.core.hashing import bcrypt_context
+from app.crud import rating_histogram_crud
+from app.models import (
+    Category,
+    Product,
+    RatingHistogram,
+    Review,
+    RoleEnum,
+    User
+)
+
+DEFAULT_BATCH_SIZE = 10_000
+FANOUT_SHAPE = 1.2
+GRADE_WEIGHTS = (8, 3, 3, 3, 4, 5, 8, 14, 20, 32)
+OUT_OF_STOCK_SHARE = 0.2
+WORDS = (
+    'отличный', 'качество', 'цена', 'доставка', 'быстро', 'удобный',
+    'рекомендую', 'товар', 'хороший', 'плохой', 'размер', 'цвет',
+    'материал', 'упаковка', 'подарок', 'новый', 'легкий', 'прочный',
+    'надежный', 'красивый', 'советую', 'работает', 'батарея', 'экран'
+)
+FIRST_NAMES = ('Анна', 'Иван', 'Мария', 'Петр', 'Ольга', 'Сергей')
+LAST_NAMES = ('Иванов', 'Петров', 'Смирнов', 'Кузнецов', 'Попов')
+
+USER_COLUMNS = (
+    'first_name', 'last_name', 'username', 'email', 'password', 'role'
+)
+CATEGORY_COLUMNS = ('name', 'slug', 'parent_slug')
+PRODUCT_COLUMNS = (
+    'name', 'slug', 'description', 'price', 'image_url', 'stock',
+    'user_username', 'category_slug'
+)
+REVIEW_COLUMNS = ('grade', 'text', 'user_username', 'product_slug')
+
+
+def get_password(number: int, passwords: int) -> str:
+    """Функция для получения пароля пользователя по его номеру."""
+    return f'password-{number % passwords}'
+
+
+def get_zipf_cum_weights(size: int, exponent: float) -> list[float]:
+    """Функция для получения накопленных весов закона Ципфа."""
+    return list(itertools.accumulate(
+        (rank + 1) ** -exponent for rank in range(size)
+    ))
+
+
+def get_review_counts(
+    products: int,
+    reviews: int,
+    exponent: float,
+    cap: int
+) -> list[int]:
+    """
+    Функция для распределения отзывов по продуктам по закону Ципфа.
+
+    Сумма равна reviews, если отзывы помещаются в ограничение cap
+    отзывов на продукт (один отзыв на пару пользователь-продукт).
+    """
+    weights = [(rank + 1) ** -exponent for rank in range(products)]
+    total = sum(weights)
+    counts = [min(cap, int(reviews * weight / total)) for weight in weights]
+    remainder = reviews - sum(counts)
+    while remainder > 0 and any(count < cap for count in counts):
+        for rank, count in enumerate(counts):
+            if remainder == 0:
+                break
+            if count < cap:
+                counts[rank] += 1
+                remainder -= 1
+    return counts
+
+
+class SeedPlan:
+    """Класс с размерами и параметрами генерируемого каталога."""
+
+    def __init__(
+        self,
+        customers: int = 100_000,
+        suppliers: int = 1_000,
+        root_categories: int = 20,
+        depth: int = 4,
+        max_fanout: int = 20,
+        products: int = 1_000_000,
+        reviews: int = 20_000_000,
+        zipf: float = 0.8,
+        passwords: int = 8,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        seed: int = 0
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.customers = customers
+        self.suppliers = suppliers
+        self.root_categories = root_categories
+        self.depth = depth
+        self.max_fanout = max_fanout
+        self.products = products
+        self.reviews = reviews
+        self.zipf = zipf
+        self.passwords = passwords
+        self.batch_size = batch_size
+        self.seed = seed
+
+    def get_random(self, *key) -> random.Random:
+        """Метод для получения генератора случайных чисел для части данных."""
+        return random.Random(':'.join(map(str, (self.seed, *key))))
+
+    def get_category_levels(self) -> list[list[tuple[str, str | None]]]:
+        """
+        Метод для построения дерева категорий по уровням.
+
+        Возвращает для каждого уровня список пар (slug, slug родителя).
+        """
+        rng = self.get_random('categories')
+        levels = [[
+            (f'category-{number}', None)
+            for number in range(self.root_categories)
+        ]]
+        for _ in range(self.depth - 1):
+            levels.append([
+                (f'{parent_slug}-{number}', parent_slug)
+                for parent_slug, _ in levels[-1]
+                for number in range(min(
+                    self.max_fanout,
+                    int(rng.paretovariate(FANOUT_SHAPE))
+                ))
+            ])
+        return levels
+
+    def get_leaf_categories(
+        self,
+        levels: list[list[tuple[str, str | None]]]
+    ) -> list[str]:
+        """
+        Метод для получения категорий без подкатегорий.
+
+        Порядок перемешан: он задает популярность категорий.
+        """
+        parents = {
+            parent_slug for level in levels for _, parent_slug in level
+        }
+        leaves = [
+            slug for level in levels for slug, _ in level
+            if slug not in parents
+        ]
+        self.get_random('leaves').shuffle(leaves)
+        return leaves
+
+
+class SeedLayout:
+    """
+    Класс с общими для всех пачек данными каталога.
+
+    Вычисляется один раз и передается в процессы генерации.
+    """
+
+    def __init__(self, plan: SeedPlan, password_hashes: list[str]):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.plan = plan
+        self.password_hashes = password_hashes
+        self.category_levels = plan.get_category_levels()
+        self.leaf_categories = plan.get_leaf_categories(self.category_levels)
+        self.category_weights = get_zipf_cum_weights(
+            len(self.leaf_categories), plan.zipf
+        )
+        self.supplier_weights = get_zipf_cum_weights(
+            plan.suppliers, plan.zipf
+        )
+        self.review_counts = get_review_counts(
+            plan.products, plan.reviews, plan.zipf, plan.customers // 2
+        )
+
+    def get_user_batches(self) -> Iterator[tuple[int, int]]:
+        """Метод для получения диапазонов номеров пользователей."""
+        total = self.plan.customers + self.plan.suppliers
+        for start in range(0, total, self.plan.batch_size):
+            yield start, min(total, start + self.plan.batch_size)
+
+    def get_product_batches(self) -> Iterator[tuple[int, int]]:
+        """Метод для получения диапазонов номеров продуктов."""
+        for start in range(0, self.plan.products, self.plan.batch_size):
+            yield start, min(self.plan.products, start + self.plan.batch_size)
+
+    def get_review_batches(self) -> Iterator[tuple[int, int]]:
+        """
+        Метод для получения диапазонов продуктов для пачек отзывов.
+
+        В пачку попадают все отзывы продуктов диапазона, поэтому
+        пачка популярного продукта может быть больше batch_size.
+        """
+        start = rows = 0
+        for number, count in enumerate(self.review_counts):
+            rows += count
+            if rows >= self.plan.batch_size:
+                yield start, number + 1
+                start, rows = number + 1, 0
+        if rows:
+            yield start, self.plan.products
+
+
+worker_layout: SeedLayout | None = None
+
+
+def init_worker(layout: SeedLayout) -> None:
+    """Функция для передачи данных каталога в процесс генерации."""
+    global worker_layout
+    worker_layout = layout
+
+
+def get_username(number: int, customers: int) -> str:
+    """Функция для получения имени пользователя по его номеру."""
+    if number < customers:
+        return f'customer-{number}'
+    return f'supplier-{number - customers}'
+
+
+def get_text(rng: random.Random, words: int) -> str:
+    """Функция для генерации текста из случайных слов."""
+    return ' '.join(rng.choices(WORDS, k=words)).capitalize()
+
+
+def generate_users(batch: tuple[int, int]) -> list[tuple]:
+    """Функция для генерации пачки пользователей."""
+    layout = worker_layout
+    plan = layout.plan
+    rng = plan.get_random('users', *batch)
+    records = []
+    for number in range(*batch):
+        username = get_username(number, plan.customers)
+        records.append((
+            rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES),
+            username,
+            f'{username}@example.com',
+            layout.password_hashes[number % plan.passwords],
+            (
+                RoleEnum.CUSTOMER if number < plan.customers
+                else RoleEnum.SUPPLIER
+            ).name
+        ))
+    return records
+
+
+def generate_products(batch: tuple[int, int]) -> list[tuple]:
+    """Функция для генерации пачки продуктов."""
+    layout = worker_layout
+    plan = layout.plan
+    rng = plan.get_random('products', *batch)
+    size = batch[1] - batch[0]
+    categories = rng.choices(
+        layout.leaf_categories, cum_weights=layout.category_weights, k=size
+    )
+    suppliers = rng.choices(
+        range(plan.suppliers), cum_weights=layout.supplier_weights, k=size
+    )
+    records = []
+    for number, category_slug, supplier in zip(
+        range(*batch), categories, suppliers
+    ):
+        slug = f'product-{number}'
+        records.append((
+            f'Товар {number}',
+            slug,
+            get_text(rng, rng.randint(5, 40)),
+            max(1, round(math.exp(rng.gauss(7, 1.2)))),
+            f'https://example.com/{slug}.png',
+            (
+                0 if rng.random() < OUT_OF_STOCK_SHARE
+                else int(rng.expovariate(0.02)) + 1
+            ),
+            f'supplier-{supplier}',
+            category_slug
+        ))
+    return records
+
+
+def generate_reviews(batch: tuple[int, int]) -> list[tuple]:
+    """
+    Функция для генерации отзывов на продукты диапазона.
+
+    Авторы отзывов продукта различны и выбираются среди покупателей.
+    """
+    layout = worker_layout
+    plan = layout.plan
+    rng = plan.get_random('reviews', *batch)
+    records = []
+    for number in range(*batch):
+        count = layout.review_counts[number]
+        grades = rng.choices(range(1, 11), weights=GRADE_WEIGHTS, k=count)
+        for customer, grade in zip(
+            rng.sample(range(plan.customers), count), grades
+        ):
+            records.append((
+                grade,
+                get_text(rng, rng.randint(3, 30)) if rng.random() < 0.7
+                else None,
+                f'customer-{customer}',
+                f'product-{number}'
+            ))
+    return records
+
+
+class SeedReport:
+    """Класс для подсчета загруженных строк по таблицам."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.rows: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+
+    def add(self, table: str, rows: int, seconds: float) -> None:
+        """Метод для учета загруженных строк таблицы."""
+        self.rows[table] = self.rows.get(table, 0) + rows
+        self.seconds[table] = self.seconds.get(table, 0) + seconds
+
+    def __str__(self) -> str:
+        """Магический метод для вывода итогов заполнения."""
+        return ', '.join(
+            f'{table}: {rows} ({rows / max(self.seconds[table], 1e-9):.0f}'
+            f' строк/с)'
+            for table, rows in self.rows.items()
+        )
+
+
+async def load_table(
+    engine: AsyncEngine,
+    table: Table,
+    columns: tuple[str, ...],
+    generate,
+    batches: Iterator[tuple[int, int]],
+    executor: Executor,
+    workers: int
+) -> int:
+    """
+    Функция для параллельной генерации и загрузки пачек таблицы.
+
+    Очередь ограничена, поэтому в памяти одновременно находится
+    не больше 2 * workers сгенерированных пачек.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=workers * 2)
+    rows = 0
+
+    async def produce() -> None:
+        for batch in batches:
+            await queue.put(loop.run_in_executor(executor, generate, batch))
+        for _ in range(workers):
+            await queue.put(None)
+
+    async def consume() -> None:
+        nonlocal rows
+        while (future := await queue.get()) is not None:
+            records = await future
+            async with engine.begin() as conn:
+                await load_records(conn, table, columns, records)
+            rows += len(records)
+
+    await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+    return rows
+
+
+async def load_categories(engine: AsyncEngine, layout: SeedLayout) -> int:
+    """
+    Функция для загрузки дерева категорий.
+
+    Уровни загружаются по очереди, чтобы родитель существовал раньше
+    дочерних категорий.
+    """
+    rows = 0
+    batch_size = layout.plan.batch_size
+    for level in layout.category_levels:
+        for start in range(0, len(level), batch_size):
+            records = [
+                (slug, slug, parent_slug)
+                for slug, parent_slug in level[start:start + batch_size]
+            ]
+            async with engine.begin() as conn:
+                await load_records(
+                    conn, Category.__table__, CATEGORY_COLUMNS, records
+                )
+        rows += len(level)
+    return rows
+
+
+async def seed_catalog(
+    engine: AsyncEngine,
+    plan: SeedPlan,
+    processes: int = 0,
+    workers: int = 4
+) -> SeedReport:
+    """
+    Функция для заполнения пустой БД каталогом.
+
+    При processes=0 пачки генерируются в одном потоке текущего процесса.
+    SQLite не поддерживает параллельную запись, для нее используется
+    одно соединение.
+    """
+    if engine.dialect.name == 'sqlite':
+        workers = 1
+    report = SeedReport()
+    layout = SeedLayout(plan, [
+        bcrypt_context.hash(get_password(number, plan.passwords))
+        for number in range(plan.passwords)
+    ])
+    if processes:
+        executor = ProcessPoolExecutor(
+            processes, initializer=init_worker, initargs=(layout,)
+        )
+    else:
+        executor = ThreadPoolExecutor(
+            1, initializer=init_worker, initargs=(layout,)
+        )
+    tables = (
+        (User.__table__, USER_COLUMNS, generate_users,
+         layout.get_user_batches()),
+        (Category.__table__, CATEGORY_COLUMNS, None, None),
+        (Product.__table__, PRODUCT_COLUMNS, generate_products,
+         layout.get_product_batches()),
+        (Review.__table__, REVIEW_COLUMNS, generate_reviews,
+         layout.get_review_batches())
+    )
+    with executor:
+        for table, columns, generate, batches in tables:
+            started_at = time.perf_counter()
+            if generate is None:
+                rows = await load_categories(engine, layout)
+            else:
+                rows = await load_table(
+                    engine, table, columns, generate, batches, executor,
+                    workers
+                )
+            report.add(table.name, rows, time.perf_counter() - started_at)
+    started_at = time.perf_counter()
+    async with AsyncSession(engine) as session:
+        rows = await rating_histogram_crud.rebuild(session)
+    report.add(
+        RatingHistogram.__tablename__, rows, time.perf_counter() - started_at
+    )
+    return report
@@ -0,0 +1,217 @@
+"""
+Модуль для расчета похожих продуктов по отзывам.
+
+Отзывы потоково читаются в разреженную матрицу продукт x пользователь
+с оценками в ячейках. Строки нормируются, поэтому произведение матрицы
+на транспонированную дает косинусную близость продуктов по отзывам
+одних и тех же пользователей. Близость считается пачками по chunk_size
+продуктов в пуле процессов: в памяти процесса одновременно только
+строки пачки, а не вся матрица продукт x продукт. Для каждого
+продукта сохраняются top_k ближайших продуктов.
+
+Матрица и ее транспонированная копия строятся один раз в родительском
+процессе и достаются процессам пула через fork без копирования, поэтому
+память не растет с количеством процессов.
+
+Результат заменяет таблицу similar_products в одной транзакции,
+поэтому до коммита маршрут отдает прошлый расчет.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.cli.bulk import load_records
+from app.models import Review, SimilarProduct
+
+DEFAULT_TOP_K = 10
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_FETCH_SIZE = 100_000
+
+SIMILAR_PRODUCT_COLUMNS = ('product_slug', 'similar_slug', 'score')
+
+
+class SimilarityReport:
+    """Класс для подсчета итогов расчета похожих продуктов."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.reviews = 0
+        self.products = 0
+        self.pairs = 0
+        self.seconds = 0.0
+
+    def __str__(self) -> str:
+        """Магический метод для вывода итогов расчета."""
+        return (
+            f'Прочитано отзывов: {self.reviews}, '
+            f'продуктов: {self.products}, '
+            f'похожих пар: {self.pairs} ({self.seconds:.1f} с)'
+        )
+
+
+async def load_review_matrix(
+    conn: AsyncConnection,
+    fetch_size: int
+) -> tuple[sparse.csr_matrix, list[str]]:
+    """
+    Функция для чтения отзывов в матрицу продукт x пользователь.
+
+    Имена пользователей и slug продуктов заменяются номерами, строки
+    матрицы нормированы. Возвращает матрицу и slug продуктов по номерам.
+    """
+    users: dict[str, int] = {}
+    products: dict[str, int] = {}
+    user_ids, product_ids, grades = [], [], []
+    result = await conn.stream(
+        select(Review.user_username, Review.product_slug, Review.grade).
+        execution_options(yield_per=fetch_size)
+    )
+    async for partition in result.partitions():
+        usernames, slugs, partition_grades = zip(*partition)
+        user_ids.append(np.fromiter(
+            (users.setdefault(username, len(users))
+             for username in usernames),
+            dtype=np.int32,
+            count=len(partition)
+        ))
+        product_ids.append(np.fromiter(
+            (products.setdefault(slug, len(products)) for slug in slugs),
+            dtype=np.int32,
+            count=len(partition)
+        ))
+        grades.append(np.array(partition_grades, dtype=np.float32))
+    if not products:
+        return sparse.csr_matrix((0, 0), dtype=np.float32), []
+    items = sparse.csr_matrix(
+        (np.concatenate(grades),
+         (np.concatenate(product_ids), np.concatenate(user_ids))),
+        shape=(len(products), len(users))
+    )
+    norms = np.sqrt(np.asarray(items.multiply(items).sum(axis=1))).ravel()
+    return (sparse.diags(1 / norms) @ items).tocsr(), list(products)
+
+
+worker_items: sparse.csr_matrix | None = None
+worker_users: sparse.csr_matrix | None = None
+worker_top_k: int = DEFAULT_TOP_K
+
+
+def init_worker(items: sparse.csr_matrix, top_k: int) -> None:
+    """
+    Функция для передачи матрицы отзывов в процессы расчета.
+
+    Вызывается до создания пула: процессы пула наследуют матрицы
+    из памяти родительского процесса.
+    """
+    global worker_items, worker_users, worker_top_k
+    worker_items = items
+    worker_users = items.T.tocsr()
+    worker_top_k = top_k
+
+
+def get_neighbours(
+    chunk: tuple[int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Функция для получения ближайших продуктов для пачки продуктов.
+
+    Возвращает массивы номеров продуктов, номеров похожих продуктов
+    и их близости.
+    """
+    start, stop = chunk
+    scores = (worker_items[start:stop] @ worker_users).tocsr()
+    products, neighbours, values = [], [], []
+    for row in range(stop - start):
+        row_slice = slice(scores.indptr[row], scores.indptr[row + 1])
+        indices = scores.indices[row_slice]
+        data = scores.data[row_slice]
+        other = indices != start + row
+        indices, data = indices[other], data[other]
+        if len(data) > worker_top_k:
+            top = np.argpartition(-data, worker_top_k)[:worker_top_k]
+            indices, data = indices[top], data[top]
+        products.append(np.full(len(data), start + row, dtype=np.int32))
+        neighbours.append(indices)
+        values.append(data)
+    return (
+        np.concatenate(products),
+        np.concatenate(neighbours),
+        np.concatenate(values)
+    )
+
+
+def get_chunks(products: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Функция для получения диапазонов продуктов для пачек."""
+    for start in range(0, products, chunk_size):
+        yield start, min(start + chunk_size, products)
+
+
+async def build_similar_products(
+    engine: AsyncEngine,
+    top_k: int = DEFAULT_TOP_K,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: int = 0,
+    fetch_size: int = DEFAULT_FETCH_SIZE
+) -> SimilarityReport:
+    """
+    Функция для расчета и сохранения похожих продуктов.
+
+    При processes=0 пачки считаются в одном потоке текущего процесса.
+    Процессы пула создаются через fork и разделяют матрицу отзывов
+    с родительским процессом. В очереди на запись не больше
+    2 * processes посчитанных пачек.
+    """
+    started_at = time.perf_counter()
+    report = SimilarityReport()
+    loop = asyncio.get_running_loop()
+    async with engine.begin() as conn:
+        items, slugs = await load_review_matrix(conn, fetch_size)
+        report.reviews = items.nnz
+        report.products = len(slugs)
+        await conn.execute(delete(SimilarProduct))
+        init_worker(items, top_k)
+        if processes:
+            executor = ProcessPoolExecutor(
+                processes, mp_context=multiprocessing.get_context('fork')
+            )
+        else:
+            executor = ThreadPoolExecutor(1)
+        pending = deque()
+
+        async def write_next() -> None:
+            products, neighbours, scores = await pending.popleft()
+            records = [
+                (slugs[product], slugs[neighbour], score)
+                for product, neighbour, score in zip(
+                    products.tolist(), neighbours.tolist(), scores.tolist()
+                )
+            ]
+            if records:
+                await load_records(
+                    conn,
+                    SimilarProduct.__table__,
+                    SIMILAR_PRODUCT_COLUMNS,
+                    records
+                )
+            report.pairs += len(records)
+
+        with executor:
+            for chunk in get_chunks(len(slugs), chunk_size):
+                pending.append(
+                    loop.run_in_executor(executor, get_neighbours, chunk)
+                )
+                if len(pending) >= max(processes, 1) * 2:
+                    await write_next()
+            while pending:
+                await write_next()
+    report.seconds = time.perf_counter() - started_at
+    return report
@@ -0,0 +1,76 @@
+"""
+Модуль для адаптивного ограничения количества одновременных запросов.
+
+Лимит одновременных запросов подстраивается под время ожидания
+соединения из пула: если соединение ждали дольше целевого времени,
+пул перегружен и лимит уменьшается в несколько раз, иначе лимит
+медленно растет (AIMD, как окно перегрузки TCP). Запросы сверх лимита
+отклоняются сразу, а не ждут соединения pool_timeout секунд.
+
+Чтение каталога имеет приоритет: запись и вход допускаются, только
+пока занята не больше чем write_share часть лимита, поэтому при
+перегрузке первыми отклоняются они.
+"""
+
+from app.core.config import settings
+
+READ = 'read'
+WRITE = 'write'
+
+
+class AdmissionController:
+    """Класс для допуска запросов по адаптивному лимиту."""
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        pool_wait_target: float,
+        write_share: float,
+        backoff: float = 0.9
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.pool_wait_target = pool_wait_target
+        self.write_share = write_share
+        self.backoff = backoff
+        self.limit = float(max_limit)
+        self.in_flight = 0
+
+    def get_limit(self, priority: str) -> int:
+        """Метод для получения лимита запросов с указанным приоритетом."""
+        if priority == READ:
+            return int(self.limit)
+        return max(1, int(self.limit * self.write_share))
+
+    def try_acquire(self, priority: str) -> bool:
+        """Метод для допуска запроса, если лимит не исчерпан."""
+        if self.in_flight >= self.get_limit(priority):
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        """Метод для освобождения места завершенного запроса."""
+        self.in_flight -= 1
+
+    def observe_pool_wait(self, duration: float) -> None:
+        """
+        Метод для изменения лимита по времени ожидания соединения.
+
+        Рост на 1 / limit за соединение дает примерно +1 к лимиту
+        за каждые limit запросов.
+        """
+        if duration > self.pool_wait_target:
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+admission_controller = AdmissionController(
+    min_limit=settings.ADMISSION_MIN_IN_FLIGHT,
+    max_limit=settings.ADMISSION_MAX_IN_FLIGHT,
+    pool_wait_target=settings.ADMISSION_POOL_WAIT_TARGET,
+    write_share=settings.ADMISSION_WRITE_SHARE
+)
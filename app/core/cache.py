@@ -0,0 +1,44 @@
+"""
+Модуль для кэширования ответов в памяти процесса.
+
+Значение живет ttl секунд, при переполнении вытесняется самое старое.
+Каждый воркер сервера хранит свой кэш, поэтому после изменения данных
+воркеры отдают старое значение не дольше ttl.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Класс кэша с ограниченным временем жизни значений."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.values: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Метод для получения значения, если оно есть и не устарело."""
+        item = self.values.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        """Метод для сохранения значения с вытеснением самого старого."""
+        self.values.pop(key, None)
+        self.values[key] = (time.monotonic() + self.ttl, value)
+        while len(self.values) > self.maxsize:
+            self.values.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Метод для очистки кэша."""
+        self.values.clear()
@@ -1,6 +1,7 @@
 """Модуль для настройки переменных окружения."""
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,6 +18,63 @@ class Settings(BaseSettings):
     ALGORITHM: str
     TOKEN_EXPIRE: int
 
+    JOB_QUEUE_SIZE: int = 1000
+    JOB_WORKERS: int = 2
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY: float = 0.5
+    JOB_DRAIN_TIMEOUT: float = 10
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    BCRYPT_WORKERS: int = 4
+
+    SERVER_HOST: str = '0.0.0.0'
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE: int = 5
+    SERVER_TIMEOUT: int = 60
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_DRAIN_TIMEOUT: int = 15
+    SERVER_MAX_REQUESTS: int = 10_000
+    SERVER_MAX_REQUESTS_JITTER: int = 1_000
+
+    WARMUP: bool = True
+    WARMUP_CONNECTIONS: int = 5
+
+    ADMISSION_MIN_IN_FLIGHT: int = 5
+    ADMISSION_MAX_IN_FLIGHT: int = 100
+    ADMISSION_POOL_WAIT_TARGET: float = 0.05
+    ADMISSION_WRITE_SHARE: float = 0.5
+    ADMISSION_RETRY_AFTER: int = 1
+
+    CATALOG_DEADLINE: float = 5
+    ACCOUNT_DEADLINE: float = 10
+    ADMIN_DEADLINE: float = 30
+
+    SQL_QUERY_BUDGET: int = 10
+    SLOW_QUERY_THRESHOLD: float = 0.5
+    SLOW_QUERY_TOP: int = 500
+
+    SERVER_TIMING: bool = True
+
+    TRACING_EXPORTER: Literal['none', 'console', 'otlp'] = 'none'
+    TRACING_SAMPLE_RATIO: float = 0.1
+    TRACING_SERVICE_NAME: str = 'ecommerce-api'
+
+    PROFILE_INTERVAL: float = 0.001
+    PROFILE_STORE_SIZE: int = 50
+
+    LEADERBOARD_PRIOR_WEIGHT: float = 10
+    LEADERBOARD_PRIOR_TOLERANCE: float = 0.01
+    LEADERBOARD_TRENDING_DAYS: int = 7
+    LEADERBOARD_BATCH_SIZE: int = 1000
+    LEADERBOARD_REFRESH_INTERVAL: float = 60
+    LEADERBOARD_CACHE_TTL: float = 30
+
     model_config = SettingsConfigDict(
         env_file=Path(__file__).parent.parent.parent / '.env'
     )
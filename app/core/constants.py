@@ -7,6 +7,8 @@ CATEGORY_NAME_MAX_LENGTH: Final = 64
 PRODUCT_NAME_MAX_LENGTH: Final = 64
 PRODUCT_IMAGE_URL_MAX_LENGTH: Final = 128
 
+REVIEW_GRADES: Final = range(1, 11)
+
 SLUG_REGEXP: Final = r'^[a-z0-9\-]{1,64}$'
 
 USER_FIRST_NAME_MAX_LENGTH: Final = 64
@@ -1,9 +1,11 @@
 """Модуль для создания базовой модели и фабрики сессий."""
 
+import time
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import func
+from sqlalchemy import DateTime, event, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
     AsyncSession,
@@ -11,10 +13,63 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
+from app.core.admission import admission_controller
 from app.core.config import settings
+from app.core.deadlines import set_statement_timeout
+from app.core.instrumentation import request_stats
+from app.core.metrics import DB_POOL_WAIT, observe_pool
 
-engine = create_async_engine(settings.db_url, echo=True)
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений с учетом времени получения соединения.
+
+    Время включает ожидание свободного соединения и открытие нового
+    и используется для адаптивного лимита одновременных запросов.
+    Метрики состояния пула обновляются при выдаче и возврате соединения.
+    """
+
+    def _do_get(self):
+        """Метод для получения соединения из пула."""
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            duration = time.perf_counter() - started_at
+            observe_pool(self)
+            DB_POOL_WAIT.observe(duration)
+            admission_controller.observe_pool_wait(duration)
+            stats = request_stats.get()
+            if stats is not None:
+                stats.observe_pool_wait(duration)
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        """Метод для возврата соединения в пул."""
+        try:
+            super()._do_return_conn(record)
+        finally:
+            observe_pool(self)
+
+
+# CURRENT_TIMESTAMP в SQLite хранит время без долей секунды, параметры
+# сравнения должны быть в том же формате, иначе строки сравниваются неверно.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format=(
+            '%(year)04d-%(month)02d-%(day)02d '
+            '%(hour)02d:%(minute)02d:%(second)02d'
+        )
+    ),
+    'sqlite'
+)
+
+engine = create_async_engine(
+    settings.db_url,
+    echo=True,
+    poolclass=InstrumentedPool
+)
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -24,8 +79,17 @@ async_session_maker = async_sessionmaker(
 
 
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Функция для создания сессий."""
+    """
+    Функция для создания сессий.
+
+    В PostgreSQL время SQL-запросов каждой транзакции сессии
+    ограничено оставшимся временем обработки запроса.
+    """
     async with async_session_maker() as session:
+        if engine.dialect.name == 'postgresql':
+            event.listen(
+                session.sync_session, 'after_begin', set_statement_timeout
+            )
         yield session
 
 
@@ -35,8 +99,11 @@ class Base(AsyncAttrs, DeclarativeBase):
     __abstract__ = True
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        Timestamp, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
+        Timestamp,
         server_default=func.now(),
         onupdate=func.now()
     )
@@ -0,0 +1,82 @@
+"""
+Модуль для ограничения времени обработки запроса.
+
+Маршрут создает для запроса крайний срок без ограничения, зависимость
+роутера задает его длительность. По истечении срока корутина запроса
+отменяется, а каждая транзакция сессии из db_session начинается
+с SET LOCAL statement_timeout на оставшееся время, поэтому PostgreSQL
+сам прерывает долгий SQL-запрос и освобождает соединение.
+"""
+
+import asyncio
+from contextvars import ContextVar
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, SessionTransaction
+
+QUERY_CANCELED_SQLSTATE = '57014'
+
+
+class Deadline:
+    """Класс крайнего срока обработки запроса в текущей задаче."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.loop = asyncio.get_running_loop()
+        self.task = asyncio.current_task()
+        self.expires_at: float | None = None
+        self.expired = False
+        self.handle: asyncio.TimerHandle | None = None
+
+    def set(self, seconds: float) -> None:
+        """Метод для установки срока через seconds секунд от текущего."""
+        self.cancel()
+        self.expires_at = self.loop.time() + seconds
+        self.handle = self.loop.call_at(self.expires_at, self.expire)
+
+    def expire(self) -> None:
+        """Метод для отмены задачи запроса по истечении срока."""
+        self.expired = True
+        self.task.cancel()
+
+    def cancel(self) -> None:
+        """Метод для снятия отмены задачи по сроку."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+    def get_remaining(self) -> float | None:
+        """Метод для получения оставшегося времени в секундах."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - self.loop.time(), 0.0)
+
+
+request_deadline: ContextVar[Deadline | None] = ContextVar(
+    'request_deadline', default=None
+)
+
+
+def set_statement_timeout(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection
+) -> None:
+    """
+    Функция для ограничения времени SQL-запросов транзакции.
+
+    Ограничение равно оставшемуся времени запроса, но не меньше 1 мс:
+    statement_timeout = 0 в PostgreSQL отключает ограничение.
+    """
+    deadline = request_deadline.get()
+    remaining = deadline.get_remaining() if deadline is not None else None
+    if remaining is not None:
+        connection.exec_driver_sql(
+            f'SET LOCAL statement_timeout = {max(int(remaining * 1000), 1)}'
+        )
+
+
+def is_query_canceled(error: DBAPIError) -> bool:
+    """Функция для проверки отмены SQL-запроса по statement_timeout."""
+    return getattr(error.orig, 'sqlstate', None) == QUERY_CANCELED_SQLSTATE
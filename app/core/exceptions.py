@@ -37,3 +37,21 @@ class NotFoundError(HTTPException):
         """Магический метод для инициализации атрибутов объекта."""
         super().__init__(status_code=status.HTTP_404_NOT_FOUND,
                          detail=detail)
+
+
+class PreconditionFailedError(HTTPException):
+    """Ошибка 412 при несовпадении версии объекта."""
+
+    def __init__(self, detail: str | None = None):
+        """Магический метод для инициализации атрибутов объекта."""
+        super().__init__(status_code=status.HTTP_412_PRECONDITION_FAILED,
+                         detail=detail)
+
+
+class GatewayTimeoutError(HTTPException):
+    """Ошибка 504 по истечении времени обработки запроса."""
+
+    def __init__(self, detail: str | None = None):
+        """Магический метод для инициализации атрибутов объекта."""
+        super().__init__(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                         detail=detail)
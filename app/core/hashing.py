@@ -0,0 +1,50 @@
+"""
+Модуль для хэширования и проверки паролей.
+
+bcrypt намеренно медленный, поэтому он выполняется в отдельном
+ограниченном пуле потоков и не блокирует event loop. Время ожидания
+свободного потока и время работы bcrypt попадают в метрики.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.metrics import BCRYPT_DURATION, BCRYPT_QUEUE
+
+bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS,
+    thread_name_prefix='bcrypt'
+)
+
+
+async def run_bcrypt(func: Callable[..., Any], *args) -> Any:
+    """Функция для выполнения операции bcrypt в пуле потоков."""
+    submitted_at = time.perf_counter()
+
+    def call() -> Any:
+        started_at = time.perf_counter()
+        BCRYPT_QUEUE.observe(started_at - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            BCRYPT_DURATION.observe(time.perf_counter() - started_at)
+
+    return await asyncio.get_running_loop().run_in_executor(
+        bcrypt_executor, call
+    )
+
+
+async def hash_password(password: str) -> str:
+    """Функция для хэширования пароля."""
+    return await run_bcrypt(bcrypt_context.hash, password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """Функция для проверки пароля."""
+    return await run_bcrypt(bcrypt_context.verify, password, hashed_password)
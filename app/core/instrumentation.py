@@ -0,0 +1,321 @@
+"""
+Модуль для сбора статистики запроса к API.
+
+Статистика текущего запроса хранится в контекстной переменной,
+обработчики событий SQLAlchemy учитывают в ней каждый SQL-запрос
+и ожидание соединения из пула. Вне запроса к API (фоновые задачи,
+команды управления) статистика запроса не собирается.
+
+SQL-запросы группируются по отпечатку - тексту запроса без значений
+параметров, поэтому N+1 запросы видны как один повторяющийся отпечаток.
+Журнал медленных запросов накапливает статистику по отпечаткам всех
+SQL-запросов процесса и пишет в лог запросы дольше порога.
+
+Этапы запроса (проверка токена, загрузка пользователя, разрешения,
+сериализация) замеряются декоратором timed и контекстным менеджером
+measure, только если для запроса включен учет этапов (Server-Timing).
+"""
+
+import heapq
+import logging
+import math
+import random
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import Scope
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_STARTED_AT_KEY = 'query_started_at'
+SLOW_QUERY_SAMPLES = 128
+
+FINGERPRINT_REPLACEMENTS = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\$\d+(?:::\w+)?|%\(\w+\)s|:\w+'), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),
+    (re.compile(r'\s+'), ' ')
+)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Функция для получения отпечатка SQL-запроса.
+
+    Значения и параметры заменяются на ?, списки параметров
+    (IN, VALUES) сворачиваются в (...). Тексты запросов повторяются,
+    поэтому отпечатки кэшируются.
+    """
+    for pattern, replacement in FINGERPRINT_REPLACEMENTS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class RequestStats:
+    """Класс статистики одного запроса к API."""
+
+    def __init__(self, scope: Scope | None = None):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.scope = scope
+        self.started_at = time.perf_counter()
+        self.query_durations: list[float] = []
+        self.statements: Counter[str] = Counter()
+        self.pool_wait_seconds = 0.0
+        self.timings: dict[str, float] | None = None
+
+    @property
+    def queries(self) -> int:
+        """Количество выполненных SQL-запросов."""
+        return len(self.query_durations)
+
+    @property
+    def query_seconds(self) -> float:
+        """Суммарное время выполнения SQL-запросов."""
+        return sum(self.query_durations)
+
+    @property
+    def route(self) -> str | None:
+        """Метод и шаблон пути маршрута запроса, если он уже найден."""
+        if self.scope is None:
+            return None
+        path = getattr(self.scope.get('route'), 'path', self.scope['path'])
+        return f'{self.scope["method"]} {path}'
+
+    def observe_query(self, statement: str, duration: float) -> None:
+        """Метод для учета выполненного SQL-запроса."""
+        self.query_durations.append(duration)
+        self.statements[statement] += 1
+
+    def observe_pool_wait(self, duration: float) -> None:
+        """Метод для учета ожидания соединения из пула."""
+        self.pool_wait_seconds += duration
+
+    def observe_timing(self, name: str, duration: float) -> None:
+        """Метод для учета времени этапа запроса."""
+        self.timings[name] = self.timings.get(name, 0) + duration
+
+    def get_repeated_statements(self) -> list[tuple[str, int]]:
+        """
+        Метод для получения повторяющихся отпечатков SQL-запросов.
+
+        Запросы считаются по тексту, а отпечатки вычисляются только здесь.
+        """
+        fingerprints = Counter()
+        for statement, count in self.statements.items():
+            fingerprints[fingerprint(statement)] += count
+        return [
+            (statement, count)
+            for statement, count in fingerprints.most_common()
+            if count > 1
+        ]
+
+
+class StatementStats:
+    """
+    Класс накопленной статистики одного отпечатка SQL-запроса.
+
+    Для p95 хранится равномерная выборка длительностей
+    ограниченного размера (reservoir sampling). Отпечаток, занявший
+    место вытесненного, наследует его количество и суммарное время,
+    error_seconds - верхняя граница завышения суммарного времени.
+    """
+
+    def __init__(self, count: int = 0, total_seconds: float = 0.0):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.count = count
+        self.total_seconds = total_seconds
+        self.error_seconds = total_seconds
+        self.max_seconds = 0.0
+        self.samples: list[float] = []
+        self.observed = 0
+
+    def observe(self, duration: float, rng: random.Random) -> None:
+        """Метод для учета выполнения SQL-запроса."""
+        self.count += 1
+        self.observed += 1
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+        if len(self.samples) < SLOW_QUERY_SAMPLES:
+            self.samples.append(duration)
+            return
+        index = rng.randrange(self.observed)
+        if index < SLOW_QUERY_SAMPLES:
+            self.samples[index] = duration
+
+    @property
+    def p95_seconds(self) -> float:
+        """95-й перцентиль длительности по выборке."""
+        samples = sorted(self.samples)
+        return samples[math.ceil(len(samples) * 0.95) - 1]
+
+
+class SlowQueryLog:
+    """
+    Класс журнала медленных SQL-запросов.
+
+    Хранит статистику не больше чем limit отпечатков по алгоритму
+    Space-Saving: новый отпечаток занимает место отпечатка
+    с наименьшим суммарным временем и наследует его счетчики, поэтому
+    часто повторяющийся новый запрос не вытесняется следующим новым.
+    Наименьшее время ищется по куче, значения в которой обновляются
+    лениво при вытеснении. Запросы не короче threshold секунд пишутся
+    в лог с маршрутом, который их выполнил.
+    """
+
+    def __init__(self, limit: int, threshold: float):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.limit = limit
+        self.threshold = threshold
+        self.statements: dict[str, StatementStats] = {}
+        self.heap: list[tuple[float, str]] = []
+        self.rng = random.Random()
+
+    def evict(self) -> StatementStats:
+        """
+        Метод для вытеснения отпечатка с наименьшим суммарным временем.
+
+        Устаревшие значения кучи возвращаются в нее с текущим временем.
+        """
+        while True:
+            total_seconds, key = self.heap[0]
+            statement_stats = self.statements[key]
+            if total_seconds == statement_stats.total_seconds:
+                heapq.heappop(self.heap)
+                return self.statements.pop(key)
+            heapq.heapreplace(self.heap, (statement_stats.total_seconds, key))
+
+    def observe(
+        self,
+        statement: str,
+        duration: float,
+        stats: RequestStats | None = None
+    ) -> None:
+        """Метод для учета выполненного SQL-запроса."""
+        key = fingerprint(statement)
+        statement_stats = self.statements.get(key)
+        if statement_stats is None:
+            if len(self.statements) >= self.limit:
+                evicted = self.evict()
+                statement_stats = StatementStats(
+                    evicted.count, evicted.total_seconds
+                )
+            else:
+                statement_stats = StatementStats()
+            self.statements[key] = statement_stats
+            heapq.heappush(self.heap, (statement_stats.total_seconds, key))
+        statement_stats.observe(duration, self.rng)
+        if duration >= self.threshold:
+            logger.warning(
+                'Медленный SQL-запрос (%.1f мс), маршрут %s:\n%s',
+                duration * 1000,
+                stats.route if stats is not None else '-',
+                statement
+            )
+
+    def get_top(
+        self,
+        limit: int,
+        order_by: str = 'total_seconds'
+    ) -> list[dict]:
+        """Метод для получения отпечатков с наибольшей нагрузкой на БД."""
+        top = sorted(
+            self.statements.items(),
+            key=lambda item: getattr(item[1], order_by),
+            reverse=True
+        )[:limit]
+        return [
+            {
+                'fingerprint': key,
+                'count': statement_stats.count,
+                'total_seconds': statement_stats.total_seconds,
+                'error_seconds': statement_stats.error_seconds,
+                'mean_seconds': (
+                    statement_stats.total_seconds / statement_stats.count
+                ),
+                'p95_seconds': statement_stats.p95_seconds,
+                'max_seconds': statement_stats.max_seconds
+            }
+            for key, statement_stats in top
+        ]
+
+    def reset(self) -> None:
+        """Метод для очистки накопленной статистики."""
+        self.statements.clear()
+        self.heap.clear()
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    'request_stats', default=None
+)
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_TOP, settings.SLOW_QUERY_THRESHOLD
+)
+
+
+@contextmanager
+def measure(name: str) -> Iterator[None]:
+    """Контекстный менеджер для замера времени этапа запроса."""
+    stats = request_stats.get()
+    if stats is None or stats.timings is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.observe_timing(name, time.perf_counter() - started_at)
+
+
+def timed(
+    name: str
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """
+    Декоратор для замера времени асинхронной функции как этапа запроса.
+
+    Сигнатура функции сохраняется, поэтому декоратор подходит
+    для зависимостей FastAPI.
+    """
+    def decorator(
+        func: Callable[..., Awaitable]
+    ) -> Callable[..., Awaitable]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            with measure(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    """Функция для запоминания времени начала SQL-запроса."""
+    conn.info[QUERY_STARTED_AT_KEY] = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context,
+                         executemany):
+    """
+    Функция для учета SQL-запроса в статистике текущего запроса
+    и журнале медленных запросов.
+    """
+    started_at = conn.info.pop(QUERY_STARTED_AT_KEY, None)
+    if started_at is None:
+        return
+    duration = time.perf_counter() - started_at
+    stats = request_stats.get()
+    if stats is not None:
+        stats.observe_query(statement, duration)
+    slow_query_log.observe(statement, duration, stats)
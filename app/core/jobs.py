@@ -0,0 +1,226 @@
+"""
+Модуль для выполнения отложенных фоновых задач.
+
+Задачи ставятся в ограниченную очередь после коммита и выполняются
+воркерами в том же event loop, поэтому время ответа включает только
+критическую часть запроса. Каждая задача получает собственную сессию.
+Периодические задачи ставятся в ту же очередь через заданный интервал.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.db import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[..., Awaitable[Any]]
+
+
+class Job:
+    """Класс задачи: функция, ее аргументы и время постановки в очередь."""
+
+    def __init__(self, func: JobFunc, args: tuple, kwargs: dict):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.enqueued_at = time.perf_counter()
+
+    @property
+    def name(self) -> str:
+        """Имя задачи для логов и метрик."""
+        return self.func.__qualname__
+
+
+class JobMetrics:
+    """Класс для накопления метрик выполнения задач."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.inline = 0
+        self.wait_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+
+    def observe(self, wait_seconds: float, run_seconds: float) -> None:
+        """Метод для учета времени ожидания и выполнения задачи."""
+        self.wait_seconds_total += wait_seconds
+        self.run_seconds_total += run_seconds
+        self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+
+
+class JobRunner:
+    """
+    Класс для выполнения фоновых задач.
+
+    Задача - это корутина, первым аргументом принимающая AsyncSession.
+    Если раннер не запущен (тесты, команды управления) или очередь
+    переполнена, задача выполняется сразу в вызывающей корутине одной
+    попыткой: паузы между повторами не попадают во время ответа.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        queue_size: int,
+        workers: int,
+        max_attempts: int,
+        retry_delay: float
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.session_maker = session_maker
+        self.queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=queue_size)
+        self.workers_count = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.workers: list[asyncio.Task] = []
+        self.periodic: dict[JobFunc, float] = {}
+        self.schedulers: list[asyncio.Task] = []
+        self.metrics = JobMetrics()
+
+    @property
+    def is_running(self) -> bool:
+        """Атрибут показывающий, запущены ли воркеры."""
+        return bool(self.workers)
+
+    async def start(self) -> None:
+        """Метод для запуска воркеров."""
+        if self.is_running:
+            return
+        self.workers = [
+            asyncio.create_task(self.work(), name=f'job-worker-{number}')
+            for number in range(self.workers_count)
+        ]
+        self.schedulers = [
+            asyncio.create_task(
+                self.repeat(func, interval),
+                name=f'job-scheduler-{func.__qualname__}'
+            )
+            for func, interval in self.periodic.items()
+        ]
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Метод для остановки воркеров после выполнения задач из очереди."""
+        if not self.is_running:
+            return
+        for scheduler in self.schedulers:
+            scheduler.cancel()
+        await asyncio.gather(*self.schedulers, return_exceptions=True)
+        self.schedulers = []
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                'Не выполнено фоновых задач при остановке: %s',
+                self.queue.qsize()
+            )
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def schedule(self, func: JobFunc, interval: float) -> None:
+        """
+        Метод для регистрации периодической задачи без аргументов.
+
+        Задача ставится в очередь каждые interval секунд, пока раннер
+        запущен. Повторная регистрация заменяет интервал.
+        """
+        self.periodic[func] = interval
+
+    async def repeat(self, func: JobFunc, interval: float) -> None:
+        """Метод для постановки периодической задачи в очередь."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.enqueue(func)
+
+    async def enqueue(self, func: JobFunc, *args, **kwargs) -> None:
+        """Метод для постановки задачи в очередь."""
+        job = Job(func, args, kwargs)
+        if self.is_running:
+            try:
+                self.queue.put_nowait(job)
+                return
+            except asyncio.QueueFull:
+                logger.warning(
+                    'Очередь задач переполнена, задача %s выполнена сразу '
+                    'без повторных попыток.',
+                    job.name
+                )
+        self.metrics.inline += 1
+        await self.run(job, max_attempts=1)
+
+    async def work(self) -> None:
+        """Метод воркера, выполняющего задачи из очереди."""
+        while True:
+            job = await self.queue.get()
+            try:
+                await self.run(job)
+            finally:
+                self.queue.task_done()
+
+    async def run(self, job: Job, max_attempts: int | None = None) -> None:
+        """
+        Метод для выполнения задачи с повторными попытками.
+
+        По умолчанию задача выполняется не больше max_attempts раз.
+        """
+        max_attempts = max_attempts or self.max_attempts
+        started_at = time.perf_counter()
+        wait_seconds = started_at - job.enqueued_at
+        for attempt in range(1, max_attempts + 1):
+            try:
+                async with self.session_maker() as session:
+                    await job.func(session, *job.args, **job.kwargs)
+            except Exception:
+                if attempt == max_attempts:
+                    self.metrics.failed += 1
+                    logger.exception(
+                        'Фоновая задача %s не выполнена за %s попыток.',
+                        job.name,
+                        attempt
+                    )
+                    return
+                self.metrics.retried += 1
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            else:
+                self.metrics.completed += 1
+                self.metrics.observe(
+                    wait_seconds, time.perf_counter() - started_at
+                )
+                return
+
+    def get_metrics(self) -> dict[str, float]:
+        """Метод для получения метрик очереди и задач."""
+        metrics = self.metrics
+        finished = metrics.completed or 1
+        return {
+            'queue_depth': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'workers': len(self.workers),
+            'completed': metrics.completed,
+            'failed': metrics.failed,
+            'retried': metrics.retried,
+            'inline': metrics.inline,
+            'wait_seconds_avg': metrics.wait_seconds_total / finished,
+            'run_seconds_avg': metrics.run_seconds_total / finished,
+            'run_seconds_max': metrics.run_seconds_max
+        }
+
+
+job_runner = JobRunner(
+    async_session_maker,
+    queue_size=settings.JOB_QUEUE_SIZE,
+    workers=settings.JOB_WORKERS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    retry_delay=settings.JOB_RETRY_DELAY
+)
@@ -0,0 +1,226 @@
+"""
+Модуль для пересчета рейтингов продуктов для таблиц лидеров.
+
+Рейтинг - байесовская средняя оценка: к отзывам продукта добавляется
+prior_weight виртуальных отзывов со средней оценкой всех отзывов,
+поэтому один отзыв 10 не обгоняет тысячу отзывов 9. Оценки
+вычисляются векторно в NumPy по пачкам гистограмм оценок.
+
+Фоновая задача пересчитывает только гистограммы, измененные после
+прошлого пересчета. Все рейтинги пересчитываются при первом запуске
+и когда средняя оценка сдвинулась больше prior_tolerance. Время
+пересчета и средняя оценка хранятся в БД, а пересчет выполняется под
+блокировкой БД, поэтому воркеры не повторяют его друг за другом.
+Рейтинг за период считается заново по индексу отзывов за последние
+trending_days дней.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.constants import REVIEW_GRADES
+from app.crud import product_ranking_crud
+from app.models import LeaderboardState
+
+GRADES = np.array(REVIEW_GRADES, dtype=np.float64)
+# Изменение гистограммы, закоммиченное после начала пересчета, может
+# получить updated_at раньше него: время now() - время начала транзакции.
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+leaderboard_cache = TTLCache(settings.LEADERBOARD_CACHE_TTL, maxsize=1024)
+
+
+def get_bayesian_ratings(
+    counts: np.ndarray,
+    prior_mean: float,
+    prior_weight: float
+) -> np.ndarray:
+    """
+    Функция для вычисления байесовских средних оценок.
+
+    counts - матрица количества отзывов: строка на продукт,
+    столбец на оценку.
+    """
+    return (
+        (counts @ GRADES + prior_weight * prior_mean) /
+        (counts.sum(axis=1) + prior_weight)
+    )
+
+
+def get_prior_mean(totals: np.ndarray) -> float:
+    """Функция для получения средней оценки всех отзывов."""
+    if not totals.sum():
+        return float(GRADES.mean())
+    return float(totals @ GRADES / totals.sum())
+
+
+class LeaderboardRefresher:
+    """Класс фоновой задачи пересчета рейтингов продуктов."""
+
+    def __init__(
+        self,
+        prior_weight: float,
+        prior_tolerance: float,
+        trending_days: int,
+        batch_size: int
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.prior_weight = prior_weight
+        self.prior_tolerance = prior_tolerance
+        self.trending_days = trending_days
+        self.batch_size = batch_size
+        self.lock = asyncio.Lock()
+
+    def is_full_refresh_needed(
+        self,
+        state: LeaderboardState | None,
+        prior_mean: float
+    ) -> bool:
+        """Метод для проверки, устарели ли все рейтинги."""
+        return (
+            state is None or
+            abs(prior_mean - state.prior_mean) > self.prior_tolerance
+        )
+
+    async def refresh_ratings(
+        self,
+        session: AsyncSession,
+        prior_mean: float,
+        since: datetime | None
+    ) -> int:
+        """
+        Метод для пересчета рейтингов за все время.
+
+        Гистограммы читаются пачками по порядку slug, рейтинги пачки
+        сохраняются одним запросом. Возвращает количество рейтингов.
+        """
+        refreshed = 0
+        after = None
+        while True:
+            histograms = await product_ranking_crud.get_histograms(
+                after, since, self.batch_size, session
+            )
+            if not histograms:
+                return refreshed
+            counts = np.array(
+                [histogram[1:] for histogram in histograms], dtype=np.int64
+            )
+            ratings = get_bayesian_ratings(
+                counts, prior_mean, self.prior_weight
+            )
+            await product_ranking_crud.upsert_ratings(
+                [
+                    {
+                        'product_slug': histogram.product_slug,
+                        'rating': rating,
+                        'reviews_count': reviews_count
+                    }
+                    for histogram, rating, reviews_count in zip(
+                        histograms,
+                        ratings.tolist(),
+                        counts.sum(axis=1).tolist()
+                    )
+                ],
+                session
+            )
+            refreshed += len(histograms)
+            if len(histograms) < self.batch_size:
+                return refreshed
+            after = histograms[-1].product_slug
+
+    async def refresh_trending(
+        self,
+        session: AsyncSession,
+        prior_mean: float,
+        now: datetime
+    ) -> int:
+        """
+        Метод для пересчета рейтингов за последние trending_days дней.
+
+        Возвращает количество продуктов с отзывами за период.
+        """
+        rows = await product_ranking_crud.get_recent_grade_counts(
+            now - timedelta(days=self.trending_days), session
+        )
+        records = []
+        if rows:
+            slugs, grades, counts = zip(*rows)
+            slugs, products = np.unique(slugs, return_inverse=True)
+            matrix = np.zeros((len(slugs), len(GRADES)), dtype=np.int64)
+            np.add.at(matrix, (products, np.array(grades) - 1), counts)
+            ratings = get_bayesian_ratings(
+                matrix, prior_mean, self.prior_weight
+            )
+            records = [
+                {
+                    'slug': slug,
+                    'recent_rating': rating,
+                    'recent_reviews_count': reviews_count
+                }
+                for slug, rating, reviews_count in zip(
+                    slugs.tolist(),
+                    ratings.tolist(),
+                    matrix.sum(axis=1).tolist()
+                )
+            ]
+        await product_ranking_crud.replace_trending(records, session)
+        return len(records)
+
+    async def refresh(
+        self,
+        session: AsyncSession,
+        full: bool = False
+    ) -> dict[str, int] | None:
+        """
+        Метод фоновой задачи для пересчета рейтингов.
+
+        Если пересчет уже выполняется в этом или другом процессе,
+        задача пропускается. Возвращает количество пересчитанных
+        рейтингов.
+        """
+        if self.lock.locked():
+            return None
+        async with self.lock:
+            if not await product_ranking_crud.try_lock(session):
+                await session.rollback()
+                return None
+            state = await product_ranking_crud.get_state(session)
+            now = await product_ranking_crud.get_now(session)
+            prior_mean = get_prior_mean(np.array(
+                await product_ranking_crud.get_grade_totals(session),
+                dtype=np.int64
+            ))
+            since = None
+            if not full and not self.is_full_refresh_needed(
+                state, prior_mean
+            ):
+                since = state.refreshed_at - REFRESH_OVERLAP
+            report = {
+                'ratings': await self.refresh_ratings(
+                    session, prior_mean, since
+                ),
+                'trending': await self.refresh_trending(
+                    session, prior_mean, now
+                )
+            }
+            await product_ranking_crud.save_state(
+                prior_mean if since is None else state.prior_mean,
+                now,
+                session
+            )
+            await session.commit()
+            leaderboard_cache.clear()
+            return report
+
+
+leaderboard_refresher = LeaderboardRefresher(
+    prior_weight=settings.LEADERBOARD_PRIOR_WEIGHT,
+    prior_tolerance=settings.LEADERBOARD_PRIOR_TOLERANCE,
+    trending_days=settings.LEADERBOARD_TRENDING_DAYS,
+    batch_size=settings.LEADERBOARD_BATCH_SIZE
+)
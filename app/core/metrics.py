@@ -0,0 +1,123 @@
+"""
+Модуль с метриками Prometheus.
+
+Метрики запросов обновляются один раз в конце запроса по собранной
+статистике, состояние пула соединений - при выдаче и возврате
+соединения. Под несколькими воркерами (задан PROMETHEUS_MULTIPROC_DIR)
+выданные соединения и соединения сверх пула суммируются по живым
+процессам, размер пула берется максимальный.
+"""
+
+from functools import lru_cache
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.pool import QueuePool
+
+from app.core.instrumentation import RequestStats
+
+UNMATCHED_ROUTE = '<unmatched>'
+DB_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Время обработки запроса.',
+    ('method', 'route')
+)
+REQUESTS = Counter(
+    'http_requests',
+    'Количество запросов по статусу ответа.',
+    ('method', 'route', 'status')
+)
+REQUEST_EXCEPTIONS = Counter(
+    'http_request_exceptions',
+    'Количество запросов, завершившихся необработанным исключением.',
+    ('method', 'route')
+)
+DB_STATEMENTS = Counter(
+    'db_statements',
+    'Количество SQL-запросов по маршруту.',
+    ('route',)
+)
+DB_STATEMENT_DURATION = Histogram(
+    'db_statement_duration_seconds',
+    'Время выполнения SQL-запроса по маршруту.',
+    ('route',),
+    buckets=DB_BUCKETS
+)
+DB_POOL_WAIT = Histogram(
+    'db_pool_wait_seconds',
+    'Время получения соединения из пула.',
+    buckets=DB_BUCKETS
+)
+DB_POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Размер пула соединений.',
+    multiprocess_mode='max'
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out',
+    'Выданные соединения.',
+    multiprocess_mode='livesum'
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow',
+    'Соединения сверх размера пула.',
+    multiprocess_mode='livesum'
+)
+ADMISSION_REJECTED = Counter(
+    'admission_rejected',
+    'Количество запросов, отклоненных при перегрузке.',
+    ('priority',)
+)
+BCRYPT_QUEUE = Histogram(
+    'bcrypt_queue_seconds',
+    'Время ожидания свободного потока для bcrypt.',
+    buckets=DB_BUCKETS
+)
+BCRYPT_DURATION = Histogram(
+    'bcrypt_duration_seconds',
+    'Время хэширования или проверки пароля bcrypt.'
+)
+
+
+@lru_cache(maxsize=4096)
+def get_route_metrics(method: str, route: str, status: int) -> tuple:
+    """
+    Функция для получения метрик с метками маршрута.
+
+    Метрики с метками кэшируются, чтобы не искать их на каждый запрос.
+    """
+    return (
+        REQUEST_DURATION.labels(method, route),
+        REQUESTS.labels(method, route, str(status)),
+        DB_STATEMENTS.labels(route),
+        DB_STATEMENT_DURATION.labels(route)
+    )
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status: int,
+    duration: float,
+    stats: RequestStats
+) -> None:
+    """Функция для обновления метрик по завершенному запросу."""
+    request_duration, requests, statements, statement_duration = (
+        get_route_metrics(method, route, status)
+    )
+    request_duration.observe(duration)
+    requests.inc()
+    if stats.query_durations:
+        statements.inc(stats.queries)
+        for query_duration in stats.query_durations:
+            statement_duration.observe(query_duration)
+
+
+def observe_pool(pool: QueuePool) -> None:
+    """Функция для обновления метрик состояния пула соединений."""
+    DB_POOL_SIZE.set(pool.size())
+    DB_POOL_CHECKED_OUT.set(pool.checkedout())
+    DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
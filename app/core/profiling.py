@@ -0,0 +1,208 @@
+"""
+Модуль для профилирования отдельных запросов к API.
+
+Сэмплирующий профилировщик в отдельном потоке с заданным интервалом
+снимает стек потока, выполняющего запрос, и считает одинаковые стеки.
+Результат - профиль в свернутом формате (collapsed stacks), который
+открывают flamegraph.pl, speedscope и inferno.
+
+Каждый снимок относится к одной категории: сериализация (pydantic,
+рендеринг ответа), гидратация ORM (создание объектов из строк),
+SQL (Core и драйвер БД), ожидание (event loop ждет ответа БД или сети)
+и остальное. Профилируется весь поток event loop, поэтому при
+параллельных запросах в профиль попадают и они.
+
+Профилировщик запускается только по запросу, обычные запросы
+не несут накладных расходов.
+"""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from pathlib import Path
+from types import FrameType
+
+from app.core.config import settings
+
+PROFILE_CATEGORIES = (
+    ('serialization', (
+        f'{os.sep}pydantic{os.sep}',
+        f'{os.sep}pydantic_core{os.sep}',
+        f'{os.sep}fastapi{os.sep}encoders.py',
+        f'{os.sep}app{os.sep}api{os.sep}responses.py'
+    )),
+    ('orm_hydration', tuple(
+        f'{os.sep}sqlalchemy{os.sep}orm{os.sep}{name}.py'
+        for name in ('loading', 'strategies', 'attributes', 'identity',
+                     'state', 'instrumentation', 'collections')
+    )),
+    ('sql', (
+        f'{os.sep}sqlalchemy{os.sep}',
+        f'{os.sep}asyncpg{os.sep}',
+        f'{os.sep}aiosqlite{os.sep}'
+    ))
+)
+WAIT_FILE = f'{os.sep}selectors.py'
+PATH_PREFIXES = sorted(
+    {
+        sysconfig.get_paths()['purelib'],
+        sysconfig.get_paths()['stdlib'],
+        str(Path(__file__).parent.parent.parent)
+    },
+    key=len,
+    reverse=True
+)
+
+
+def get_frame_label(frame: FrameType) -> str:
+    """Функция для получения подписи кадра стека в профиле."""
+    filename = frame.f_code.co_filename
+    for prefix in PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):].lstrip(os.sep)
+            break
+    return f'{frame.f_code.co_name} ({filename}:{frame.f_code.co_firstlineno})'
+
+
+def get_category(filenames: list[str]) -> str:
+    """
+    Функция для определения категории снимка стека.
+
+    Файлы перечислены от вызываемой функции к вызывающей.
+    """
+    for category, patterns in PROFILE_CATEGORIES:
+        if any(
+            pattern in filename
+            for filename in filenames for pattern in patterns
+        ):
+            return category
+    if filenames and filenames[0].endswith(WAIT_FILE):
+        return 'wait'
+    return 'other'
+
+
+class SamplingProfiler:
+    """Класс сэмплирующего профилировщика потока."""
+
+    def __init__(self, interval: float = settings.PROFILE_INTERVAL):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.categories: Counter[str] = Counter()
+        self.duration = 0.0
+        self.stopped = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        """Магический метод для запуска профилировщика текущего потока."""
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(
+            target=self.sample,
+            args=(threading.get_ident(),),
+            name='profiler',
+            daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Магический метод для остановки профилировщика."""
+        self.stopped.set()
+        self.thread.join()
+        self.duration = time.perf_counter() - self.started_at
+
+    def sample(self, thread_id: int) -> None:
+        """Метод для снятия стеков потока до остановки профилировщика."""
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            labels, filenames = [], []
+            while frame is not None:
+                labels.append(get_frame_label(frame))
+                filenames.append(frame.f_code.co_filename)
+                frame = frame.f_back
+            if labels:
+                self.stacks[';'.join(reversed(labels))] += 1
+                self.categories[get_category(filenames)] += 1
+
+    def get_breakdown(self) -> dict[str, float]:
+        """
+        Метод для получения времени по категориям в секундах.
+
+        Время каждой категории пропорционально доле ее снимков.
+        """
+        samples = sum(self.categories.values())
+        if not samples:
+            return {}
+        return {
+            category: self.duration * count / samples
+            for category, count in self.categories.most_common()
+        }
+
+    def get_collapsed(self) -> str:
+        """Метод для получения профиля в свернутом формате."""
+        return ''.join(
+            f'{stack} {count}\n' for stack, count in self.stacks.items()
+        )
+
+
+class Profile:
+    """Класс сохраненного профиля запроса."""
+
+    def __init__(self, method: str, path: str, profiler: SamplingProfiler):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.id = uuid.uuid4().hex
+        self.method = method
+        self.path = path
+        self.duration = profiler.duration
+        self.breakdown = profiler.get_breakdown()
+        self.collapsed = profiler.get_collapsed()
+
+    def format_breakdown(self) -> str:
+        """Метод для вывода времени по категориям в заголовок ответа."""
+        return ', '.join(
+            f'{category}={seconds * 1000:.1f}ms'
+            for category, seconds in self.breakdown.items()
+        )
+
+    def to_dict(self) -> dict:
+        """Метод для получения описания профиля без стеков."""
+        return {
+            'id': self.id,
+            'method': self.method,
+            'path': self.path,
+            'duration_seconds': self.duration,
+            'breakdown': self.breakdown
+        }
+
+
+class ProfileStore:
+    """Класс хранилища последних профилей запросов."""
+
+    def __init__(self, limit: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.limit = limit
+        self.profiles: OrderedDict[str, Profile] = OrderedDict()
+
+    def add(self, profile: Profile) -> Profile:
+        """Метод для сохранения профиля с вытеснением самого старого."""
+        self.profiles[profile.id] = profile
+        while len(self.profiles) > self.limit:
+            self.profiles.popitem(last=False)
+        return profile
+
+    def get(self, profile_id: str) -> Profile | None:
+        """Метод для получения профиля по идентификатору."""
+        return self.profiles.get(profile_id)
+
+    def list(self) -> list[dict]:
+        """Метод для получения описаний профилей от новых к старым."""
+        return [
+            profile.to_dict() for profile in reversed(self.profiles.values())
+        ]
+
+
+profile_store = ProfileStore(settings.PROFILE_STORE_SIZE)
@@ -5,19 +5,21 @@ from datetime import datetime, timedelta, timezone
 import jwt
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import UnauthorizedError, ValidationError
 from app.core.config import settings
 from app.core.db import db_session
+from app.core.hashing import verify_password
+from app.core.instrumentation import measure, timed
+from app.core.tracing import traced
 from app.crud import user_crud
 from app.models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/api/v1/auth/login/')
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
 
+@traced()
 async def authenticate_user(
     username: str,
     password: str,
@@ -26,7 +28,7 @@ async def authenticate_user(
     """Функция для аутентификации пользователя."""
     user = await user_crud.get_user_by_username(username, session)
     if user:
-        is_password_hashed = bcrypt_context.verify(password, user.password)
+        is_password_hashed = await verify_password(password, user.password)
     if not (user and is_password_hashed):
         raise ValidationError('Не правильные учетные данные')
     return user
@@ -49,6 +51,8 @@ def create_access_token(
     )
 
 
+@traced()
+@timed('jwt')
 async def validate_and_decode_token(token: str) -> dict | None:
     """Функция для валидации и декодирования токена."""
     try:
@@ -64,10 +68,14 @@ async def validate_and_decode_token(token: str) -> dict | None:
     return payload
 
 
+@traced()
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(db_session)
 ) -> User | None:
     """Функция для получения текущего пользователя."""
     payload = await validate_and_decode_token(token)
-    return await user_crud.get_user_by_username(payload.get('sub'), session)
+    with measure('user'):
+        return await user_crud.get_user_by_username(
+            payload.get('sub'), session
+        )
@@ -0,0 +1,134 @@
+"""
+Модуль для распределенной трассировки OpenTelemetry.
+
+Корневой span запроса создает TracingMiddleware с учетом заголовка
+traceparent (W3C Trace Context). Решение о записи трассы принимается
+один раз для корневого span'а (head-based sampling) и наследуется
+дочерними: зависимости, валидаторы и методы CRUD оборачиваются
+декоратором traced, SQL-запросы - обработчиками событий SQLAlchemy.
+Вне записываемой трассы дочерние span'ы не создаются.
+
+Без настроенного экспортера (TRACING_EXPORTER=none) используется
+трассировщик OpenTelemetry по умолчанию, который ничего не записывает.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable
+
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+    OTLPSpanExporter
+)
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+SPAN_KEY = 'tracing_span'
+
+tracer = trace.get_tracer(__name__)
+
+
+def get_exporter(name: str) -> SpanExporter:
+    """Функция для создания экспортера span'ов по имени."""
+    if name == 'console':
+        return ConsoleSpanExporter()
+    if name == 'otlp':
+        return OTLPSpanExporter()
+    raise ValueError(f'Неизвестный экспортер трассировки: {name}.')
+
+
+def configure_tracing(
+    processor: SpanProcessor,
+    sample_ratio: float = settings.TRACING_SAMPLE_RATIO
+) -> TracerProvider:
+    """Функция для настройки трассировки с выборкой доли запросов."""
+    provider = TracerProvider(
+        resource=Resource.create(
+            {SERVICE_NAME: settings.TRACING_SERVICE_NAME}
+        ),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio))
+    )
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+    return provider
+
+
+def configure_tracing_from_settings() -> None:
+    """Функция для настройки трассировки по переменным окружения."""
+    if settings.TRACING_EXPORTER != 'none':
+        configure_tracing(
+            BatchSpanProcessor(get_exporter(settings.TRACING_EXPORTER))
+        )
+
+
+def traced(
+    name: str | None = None
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """
+    Декоратор для создания span'а вокруг асинхронной функции.
+
+    Имя span'а по умолчанию - полное имя функции. Сигнатура функции
+    сохраняется, поэтому декоратор подходит для зависимостей FastAPI.
+    """
+    def decorator(
+        func: Callable[..., Awaitable]
+    ) -> Callable[..., Awaitable]:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            if not trace.get_current_span().is_recording():
+                return await func(*args, **kwargs)
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_statement_span(conn, cursor, statement, parameters, context,
+                         executemany):
+    """Функция для создания span'а SQL-запроса."""
+    if not trace.get_current_span().is_recording():
+        return
+    conn.info[SPAN_KEY] = tracer.start_span(
+        statement.split(None, 1)[0].upper(),
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            'db.system': conn.dialect.name,
+            'db.statement': statement
+        }
+    )
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def end_statement_span(conn, cursor, statement, parameters, context,
+                       executemany):
+    """Функция для завершения span'а SQL-запроса."""
+    span = conn.info.pop(SPAN_KEY, None)
+    if span is not None:
+        span.end()
+
+
+@event.listens_for(Engine, 'handle_error')
+def fail_statement_span(exception_context):
+    """Функция для завершения span'а SQL-запроса с ошибкой."""
+    connection = exception_context.connection
+    span = (
+        connection.info.pop(SPAN_KEY, None) if connection is not None
+        else None
+    )
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
@@ -1,23 +1,37 @@
 """Модуль для создания валидаторов."""
 
+from typing import Sequence
+
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.db import AsyncSession
-from app.crud import category_crud, product_crud, review_crud, user_crud
+from app.core.tracing import traced
+from app.crud import (
+    category_crud,
+    product_crud,
+    rating_histogram_crud,
+    review_crud,
+    user_crud
+)
 from app.crud import ModelType
-from app.models import Category, Product, Review
+from app.models import Category, Product, RatingHistogram, Review
 
 
+@traced()
 async def get_category_or_not_found(
     category_slug: str,
     session: AsyncSession,
+    fields: Sequence[str] | None = None
 ) -> Category | None:
     """Валидация существования категории и получения категории."""
-    category = await category_crud.get_object_by_slug(category_slug, session)
+    category = await category_crud.get_object_by_slug(
+        category_slug, session, fields
+    )
     if not category:
         raise NotFoundError('Такой категории не существует.')
     return category
 
 
+@traced()
 async def check_category_already_exists(
     category_slug: str,
     session: AsyncSession
@@ -28,6 +42,7 @@ async def check_category_already_exists(
         raise ValidationError('Уже есть такая категория.')
 
 
+@traced()
 async def check_cant_change_parent_category(
     category_slug: str,
     session: AsyncSession,
@@ -38,17 +53,22 @@ async def check_cant_change_parent_category(
         raise ValidationError('Нельзя поменять родительскую категорию.')
 
 
+@traced()
 async def get_product_or_not_found(
     product_slug: str,
-    session: AsyncSession
+    session: AsyncSession,
+    fields: Sequence[str] | None = None
 ) -> Product | None:
     """Валидация существования продукта и получения продукта."""
-    product = await product_crud.get_object_by_slug(product_slug, session)
+    product = await product_crud.get_object_by_slug(
+        product_slug, session, fields
+    )
     if not product:
         raise NotFoundError('Такого продукта не существует.')
     return product
 
 
+@traced()
 async def check_product_already_exists(
     product_slug: str,
     session: AsyncSession
@@ -59,17 +79,43 @@ async def check_product_already_exists(
         raise ValidationError('Уже есть такой продукт.')
 
 
-async def get_review_or_not_found(
+@traced()
+async def get_review_for_product_or_not_found(
+    product_slug: str,
     review_id: int,
-    session: AsyncSession
-) -> Review | None:
-    """Валидация существования отзыва и получения отзыва."""
-    review = await review_crud.get(review_id, session)
+    session: AsyncSession,
+    fields: Sequence[str] | None = None
+) -> Review:
+    """Валидация существования продукта и его отзыва и получения отзыва."""
+    product_exists, review = await review_crud.get_for_product(
+        product_slug, review_id, session, fields
+    )
+    if not product_exists:
+        raise NotFoundError('Такого продукта не существует.')
     if not review:
         raise NotFoundError('Такого отзыва не существует.')
     return review
 
 
+@traced()
+async def get_rating_histogram_or_not_found(
+    product_slug: str,
+    session: AsyncSession
+) -> RatingHistogram | None:
+    """
+    Валидация существования продукта и получения гистограммы оценок.
+
+    Гистограммы нет, если у продукта еще не было отзывов.
+    """
+    product_exists, histogram = await rating_histogram_crud.get_for_product(
+        product_slug, session
+    )
+    if not product_exists:
+        raise NotFoundError('Такого продукта не существует.')
+    return histogram
+
+
+@traced()
 async def check_review_already_exists(
     product_slug: str,
     username: str,
@@ -85,6 +131,7 @@ async def check_review_already_exists(
         raise ValidationError('Вы уже оставили отзыв на этот продукт.')
 
 
+@traced()
 async def check_cant_review_own_product(
     current_username: str,
     review_username: ModelType
@@ -96,6 +143,7 @@ async def check_cant_review_own_product(
         raise ValidationError('Нельзя оставлять отзыв на свой продукт')
 
 
+@traced()
 async def check_user_already_exists(
     username: str,
     email: str,
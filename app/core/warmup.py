@@ -0,0 +1,114 @@
+"""
+Модуль для прогрева приложения при запуске.
+
+Первые запросы после развертывания не должны платить за открытие
+соединений с БД и компиляцию SQL-запросов: соединения пула
+открываются заранее, а каждый запрос CRUD выполняется один раз
+с заведомо несуществующими значениями, чтобы его скомпилированная
+форма попала в кэш SQLAlchemy, не читая таблицы целиком.
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker
+)
+
+from app.crud import (
+    category_crud,
+    product_crud,
+    product_ranking_crud,
+    rating_histogram_crud,
+    review_crud,
+    similar_product_crud,
+    user_crud
+)
+
+logger = logging.getLogger(__name__)
+
+WARMUP_VALUE = '__warmup__'
+WARMUP_ID = 0
+
+
+async def open_connections(engine: AsyncEngine, count: int) -> int:
+    """
+    Функция для открытия соединений пула заранее.
+
+    Число соединений ограничено размером пула, чтобы после прогрева
+    все они остались в пуле. Возвращает число открытых соединений.
+    """
+    size = getattr(engine.pool, 'size', None)
+    if size is not None:
+        count = min(count, size())
+    connections = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count))
+    )
+    await asyncio.gather(*(connection.close() for connection in connections))
+    return len(connections)
+
+
+async def warm_statements(session: AsyncSession) -> None:
+    """
+    Функция для выполнения каждого запроса CRUD один раз.
+
+    Списки запрашиваются с фильтром по несуществующему значению:
+    запрос без фильтра прочитал бы всю таблицу.
+    """
+    await category_crud.get(WARMUP_ID, session)
+    await category_crud.get_object_by_slug(WARMUP_VALUE, session)
+    await category_crud.get_subcategories_by_category_or_all(
+        WARMUP_VALUE, session
+    )
+    await category_crud.get_parent_slug(WARMUP_VALUE, session)
+    await product_crud.get_object_by_slug(WARMUP_VALUE, session)
+    await product_crud.get_products_by_category_or_is_active_or_all(
+        WARMUP_VALUE, True, session
+    )
+    await product_ranking_crud.get_top_rated(WARMUP_VALUE, 1, session)
+    await product_ranking_crud.get_trending(1, session)
+    await rating_histogram_crud.get_for_product(WARMUP_VALUE, session)
+    await review_crud.get(WARMUP_ID, session)
+    await review_crud.get_for_product(WARMUP_VALUE, WARMUP_ID, session)
+    await review_crud.get_page_for_product(
+        WARMUP_VALUE, 'newest', 1, None, session
+    )
+    await review_crud.get_reviews_by_product_or_all(WARMUP_VALUE, session)
+    await review_crud.get_review_by_product_slug_and_username(
+        WARMUP_VALUE, WARMUP_VALUE, session
+    )
+    await similar_product_crud.get_for_product(WARMUP_VALUE, 1, session)
+    await user_crud.get_user_by_username(WARMUP_VALUE, session)
+    await user_crud.get_username_and_email(
+        WARMUP_VALUE, WARMUP_VALUE, session
+    )
+
+
+async def warm_up(
+    engine: AsyncEngine,
+    session_maker: async_sessionmaker[AsyncSession],
+    connections: int
+) -> None:
+    """
+    Функция для прогрева соединений и кэша SQL-запросов.
+
+    Ошибка БД не останавливает запуск: приложение стартует
+    без прогрева, как и раньше.
+    """
+    started_at = time.perf_counter()
+    try:
+        opened = await open_connections(engine, connections)
+        async with session_maker() as session:
+            await warm_statements(session)
+    except (OSError, SQLAlchemyError) as error:
+        logger.warning('Прогрев БД не выполнен: %s', error)
+        return
+    logger.info(
+        'Прогрев выполнен за %.3f с, открыто соединений: %s',
+        time.perf_counter() - started_at,
+        opened
+    )
@@ -2,6 +2,9 @@
 
 from .base import ModelType, SchemaType
 from .categories import category_crud
+from .product_rankings import product_ranking_crud
 from .products import product_crud
+from .rating_histograms import rating_histogram_crud
 from .reviews import review_crud
+from .similar_products import similar_product_crud
 from .users import user_crud
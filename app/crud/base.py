@@ -1,18 +1,31 @@
 """Модуль для создания базовых CRUD операций."""
 
-from typing import Generic, TypeVar
+from typing import Generic, Sequence, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, load_only
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.db import Base
+from app.core.exceptions import PreconditionFailedError
+from app.core.tracing import traced
 from app.models import User
 
 ModelType = TypeVar('ModelType', bound=Base)
 SchemaType = TypeVar('Schematype', bound=BaseModel)
 
 
+def get_dialect_insert(session: AsyncSession):
+    """Функция для получения INSERT с поддержкой ON CONFLICT."""
+    if session.bind.dialect.name == 'postgresql':
+        return postgresql_insert
+    return sqlite_insert
+
+
 class CRUDBase(Generic[ModelType, SchemaType]):
     """Класс для создания базовых CRUD операций."""
 
@@ -20,6 +33,25 @@ class CRUDBase(Generic[ModelType, SchemaType]):
         """Магический метод для инициализации атрибутов объекта."""
         self.model = model
 
+    def get_fields_options(self, fields: Sequence[str] | None) -> list:
+        """
+        Метод для получения опций загрузки только запрошенных полей.
+
+        Остальные колонки и вычисляемые поля (например, подзапрос
+        рейтинга) не попадают в SELECT, связи не загружаются.
+        Первичный ключ и версия загружаются всегда.
+        """
+        if fields is None:
+            return []
+        columns = {*fields, 'id'}
+        if hasattr(self.model, 'version'):
+            columns.add('version')
+        return [
+            load_only(*(getattr(self.model, column) for column in columns)),
+            lazyload('*')
+        ]
+
+    @traced()
     async def get_all(
         self,
         session: AsyncSession
@@ -28,18 +60,22 @@ class CRUDBase(Generic[ModelType, SchemaType]):
         objs = await session.execute(select(self.model))
         return objs.scalars().all()
 
+    @traced()
     async def get(
         self,
         id: int,
-        session: AsyncSession
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
     ) -> ModelType | None:
         """Метод для получения объекта."""
         obj = await session.execute(
             select(self.model).
-            where(self.model.id == id)
+            where(self.model.id == id).
+            options(*self.get_fields_options(fields))
         )
         return obj.scalar()
 
+    @traced()
     async def create(
         self,
         schema: SchemaType,
@@ -59,41 +95,72 @@ class CRUDBase(Generic[ModelType, SchemaType]):
         await session.refresh(model_obj)
         return model_obj
 
+    @traced()
     async def update(
         self,
         model_obj: ModelType,
         schema: SchemaType,
-        session: AsyncSession
+        session: AsyncSession,
+        version: int | None = None
     ) -> ModelType:
-        """Метод для изменения объекта."""
+        """
+        Метод для изменения объекта.
+
+        Если передана версия, объект изменяется только при ее совпадении.
+        У моделей с версией UPDATE дополнительно проверяет версию в WHERE,
+        поэтому параллельное изменение тоже приводит к ошибке 412.
+        """
+        self.check_version(model_obj, version)
         update_data = schema.model_dump(exclude_unset=True)
         for key in update_data:
             setattr(model_obj, key, update_data[key])
-        await session.commit()
+        try:
+            await session.commit()
+        except StaleDataError:
+            await session.rollback()
+            raise PreconditionFailedError('Объект уже был изменен.')
         await session.refresh(model_obj)
         return model_obj
 
+    @staticmethod
+    def check_version(model_obj: ModelType, version: int | None) -> None:
+        """Метод для проверки версии объекта из заголовка If-Match."""
+        if version is not None and version != model_obj.version:
+            raise PreconditionFailedError('Объект уже был изменен.')
+
+    @traced()
     async def delete(
         self,
         model_obj: ModelType,
         session: AsyncSession
     ) -> None:
-        """Метод для удаления объекта."""
-        await session.delete(model_obj)
+        """
+        Метод для удаления объекта.
+
+        Связанные объекты удаляются самой БД через ON DELETE CASCADE
+        одним запросом, без загрузки дочерних объектов в память.
+        """
+        await session.execute(
+            delete(self.model).
+            where(self.model.id == model_obj.id)
+        )
         await session.commit()
 
 
 class AbstractCRUDBase(CRUDBase):
     """Абстрактный класс для наследования."""
 
+    @traced()
     async def get_object_by_slug(
         self,
         slug: str,
-        session: AsyncSession
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
     ) -> ModelType | None:
         """Метод для получения объекта по slug."""
         obj = await session.execute(
             select(self.model).
-            where(self.model.slug == slug)
+            where(self.model.slug == slug).
+            options(*self.get_fields_options(fields))
         )
         return obj.scalar()
@@ -1,8 +1,11 @@
 """Модуль для создания CRUD операций для категории."""
 
+from typing import Sequence
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced
 from app.crud.base import AbstractCRUDBase
 from app.models import Category
 
@@ -10,22 +13,26 @@ from app.models import Category
 class CRUDCategory(AbstractCRUDBase):
     """Класс для создания CRUD операций для категории."""
 
+    @traced()
     async def get_subcategories_by_category_or_all(
         self,
         parent_slug: str,
         session: AsyncSession,
+        fields: Sequence[str] | None = None
     ) -> list[Category]:
         """
         Метод для получения всех категорий.
 
         Так же можно отсортировать категории по родительской категории.
+        С fields загружаются только запрошенные поля.
         """
-        query = select(Category)
+        query = select(Category).options(*self.get_fields_options(fields))
         if parent_slug:
             query = query.where(Category.parent_slug == parent_slug)
         categories = await session.execute(query)
         return categories.scalars().all()
 
+    @traced()
     async def get_parent_slug(
         self,
         parent_slug: str,
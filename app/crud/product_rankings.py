@@ -0,0 +1,261 @@
+"""Модуль для создания CRUD операций для рейтинга продукта."""
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import (
+    DateTime,
+    Row,
+    bindparam,
+    cast,
+    func,
+    or_,
+    select,
+    update
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import REVIEW_GRADES
+from app.core.tracing import traced
+from app.crud.base import CRUDBase, get_dialect_insert
+from app.models import (
+    Category,
+    LeaderboardState,
+    Product,
+    ProductRanking,
+    RatingHistogram,
+    Review
+)
+
+GRADE_COLUMNS = tuple(
+    getattr(RatingHistogram, RatingHistogram.get_column_name(grade))
+    for grade in REVIEW_GRADES
+)
+# Ключ блокировки PostgreSQL, общей для всех процессов пересчета.
+REFRESH_LOCK_KEY = 0x6c6561646572
+STATE_ID = 1
+
+
+class CRUDProductRanking(CRUDBase):
+    """
+    Класс для создания CRUD операций для рейтинга продукта.
+
+    Методы записи не делают commit: пересчет рейтингов выполняется
+    одной транзакцией.
+    """
+
+    @traced()
+    async def get_top_rated(
+        self,
+        category_slug: str | None,
+        limit: int,
+        session: AsyncSession
+    ) -> Sequence[Row]:
+        """
+        Метод для получения продуктов с наибольшим рейтингом.
+
+        Если у категории есть подкатегории, их продукты тоже будут
+        включены.
+        """
+        query = (
+            select(ProductRanking.product_slug, Product.name,
+                   ProductRanking.rating, ProductRanking.reviews_count).
+            join(Product, Product.slug == ProductRanking.product_slug).
+            where(ProductRanking.reviews_count > 0).
+            order_by(ProductRanking.rating.desc(),
+                     ProductRanking.reviews_count.desc()).
+            limit(limit)
+        )
+        if category_slug:
+            query = (query.
+                     join(Category, Category.slug == Product.category_slug).
+                     where(or_(Product.category_slug == category_slug,
+                               Category.parent_slug == category_slug)))
+        rankings = await session.execute(query)
+        return rankings.all()
+
+    @traced()
+    async def get_trending(
+        self,
+        limit: int,
+        session: AsyncSession
+    ) -> Sequence[Row]:
+        """Метод для получения продуктов с наибольшим рейтингом за период."""
+        rankings = await session.execute(
+            select(ProductRanking.product_slug, Product.name,
+                   ProductRanking.trending_rating.label('rating'),
+                   ProductRanking.trending_reviews_count.label(
+                       'reviews_count'
+                   )).
+            join(Product, Product.slug == ProductRanking.product_slug).
+            where(ProductRanking.trending_rating.is_not(None)).
+            order_by(ProductRanking.trending_rating.desc(),
+                     ProductRanking.trending_reviews_count.desc()).
+            limit(limit)
+        )
+        return rankings.all()
+
+    @traced()
+    async def try_lock(self, session: AsyncSession) -> bool:
+        """
+        Метод для захвата блокировки пересчета до конца транзакции.
+
+        В PostgreSQL используется advisory-блокировка, поэтому пересчет
+        выполняет только один процесс. Возвращает False, если блокировка
+        уже захвачена. В SQLite записи и так выполняются по очереди.
+        """
+        if session.bind.dialect.name != 'postgresql':
+            return True
+        return await session.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+        )
+
+    @traced()
+    async def get_state(
+        self,
+        session: AsyncSession
+    ) -> LeaderboardState | None:
+        """Метод для получения состояния прошлого пересчета."""
+        return await session.get(
+            LeaderboardState, STATE_ID, populate_existing=True
+        )
+
+    @traced()
+    async def save_state(
+        self,
+        prior_mean: float,
+        refreshed_at: datetime,
+        session: AsyncSession
+    ) -> None:
+        """Метод для сохранения состояния пересчета."""
+        query = get_dialect_insert(session)(LeaderboardState).values(
+            id=STATE_ID, prior_mean=prior_mean, refreshed_at=refreshed_at
+        )
+        await session.execute(
+            query.on_conflict_do_update(
+                index_elements=(LeaderboardState.id,),
+                set_={
+                    'prior_mean': query.excluded.prior_mean,
+                    'refreshed_at': query.excluded.refreshed_at,
+                    'updated_at': func.now()
+                }
+            )
+        )
+
+    @traced()
+    async def get_now(self, session: AsyncSession) -> datetime:
+        """
+        Метод для получения текущего времени БД.
+
+        Время приводится к типу колонок created_at и updated_at:
+        в PostgreSQL now() возвращает время с часовым поясом.
+        """
+        now = func.now()
+        if session.bind.dialect.name == 'postgresql':
+            now = cast(now, DateTime)
+        return await session.scalar(select(now))
+
+    @traced()
+    async def get_grade_totals(self, session: AsyncSession) -> Row:
+        """Метод для получения количества всех отзывов по оценкам."""
+        totals = await session.execute(
+            select(*(func.coalesce(func.sum(column), 0)
+                     for column in GRADE_COLUMNS))
+        )
+        return totals.one()
+
+    @traced()
+    async def get_histograms(
+        self,
+        after: str | None,
+        since: datetime | None,
+        limit: int,
+        session: AsyncSession
+    ) -> Sequence[Row]:
+        """
+        Метод для получения пачки гистограмм оценок по порядку slug.
+
+        Пачка начинается после продукта after. С since возвращаются
+        только гистограммы, измененные после этого времени.
+        """
+        query = (
+            select(RatingHistogram.product_slug, *GRADE_COLUMNS).
+            order_by(RatingHistogram.product_slug).
+            limit(limit)
+        )
+        if after is not None:
+            query = query.where(RatingHistogram.product_slug > after)
+        if since is not None:
+            query = query.where(RatingHistogram.updated_at >= since)
+        histograms = await session.execute(query)
+        return histograms.all()
+
+    @traced()
+    async def get_recent_grade_counts(
+        self,
+        since: datetime,
+        session: AsyncSession
+    ) -> Sequence[Row]:
+        """
+        Метод для получения количества отзывов после since
+        по продуктам и оценкам.
+
+        Запрос читает только индекс (created_at, product_slug, grade).
+        """
+        counts = await session.execute(
+            select(Review.product_slug, Review.grade, func.count()).
+            where(Review.created_at >= since).
+            group_by(Review.product_slug, Review.grade)
+        )
+        return counts.all()
+
+    @traced()
+    async def upsert_ratings(
+        self,
+        records: list[dict],
+        session: AsyncSession
+    ) -> None:
+        """Метод для сохранения рейтингов за все время одним запросом."""
+        query = get_dialect_insert(session)(ProductRanking).values(records)
+        await session.execute(
+            query.on_conflict_do_update(
+                index_elements=(ProductRanking.product_slug,),
+                set_={
+                    'rating': query.excluded.rating,
+                    'reviews_count': query.excluded.reviews_count,
+                    'updated_at': func.now()
+                }
+            )
+        )
+
+    @traced()
+    async def replace_trending(
+        self,
+        records: list[dict],
+        session: AsyncSession
+    ) -> None:
+        """
+        Метод для замены рейтингов за период.
+
+        Записи содержат slug, recent_rating и recent_reviews_count.
+        Рейтинги продуктов без отзывов за период сбрасываются.
+        """
+        table = ProductRanking.__table__
+        await session.execute(
+            update(table).
+            where(table.c.trending_rating.is_not(None)).
+            values(trending_rating=None, trending_reviews_count=0)
+        )
+        if records:
+            await session.execute(
+                update(table).
+                where(table.c.product_slug == bindparam('slug')).
+                values(
+                    trending_rating=bindparam('recent_rating'),
+                    trending_reviews_count=bindparam('recent_reviews_count')
+                ),
+                records
+            )
+
+
+product_ranking_crud = CRUDProductRanking(ProductRanking)
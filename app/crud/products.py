@@ -1,8 +1,11 @@
 """Модуль для создания CRUD операций для продукта."""
 
+from typing import Sequence
+
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced
 from app.crud.base import AbstractCRUDBase
 from app.models import Category, Product
 
@@ -10,18 +13,21 @@ from app.models import Category, Product
 class CRUDProduct(AbstractCRUDBase):
     """Класс для создания CRUD операций для продукта."""
 
+    @traced()
     async def get_products_by_category_or_is_active_or_all(
         self,
         category_slug: str | None,
         is_active: bool,
-        session: AsyncSession
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
     ) -> list[Product]:
         """
         Метод для получения всех продуктов по категории и наличии товара.
 
         Если у категории есть подкатегории, то их продукты тоже будут включены.
+        С fields загружаются только запрошенные поля.
         """
-        query = select(Product)
+        query = select(Product).options(*self.get_fields_options(fields))
         if category_slug:
             query = (query.
                      join(Category, Category.slug == Product.category_slug).
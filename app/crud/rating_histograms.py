@@ -0,0 +1,152 @@
+"""Модуль для создания CRUD операций для гистограммы оценок."""
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import REVIEW_GRADES
+from app.core.tracing import traced
+from app.crud.base import CRUDBase, get_dialect_insert
+from app.models import Product, RatingHistogram, Review
+
+
+class CRUDRatingHistogram(CRUDBase):
+    """
+    Класс для создания CRUD операций для гистограммы оценок.
+
+    Методы изменения счетчиков не делают commit: они выполняются
+    в транзакции изменения отзыва. Каждое изменение обновляет
+    updated_at, по нему пересчитываются только измененные рейтинги.
+    """
+
+    @traced()
+    async def get_for_product(
+        self,
+        product_slug: str,
+        session: AsyncSession
+    ) -> tuple[bool, RatingHistogram | None]:
+        """
+        Метод для получения гистограммы продукта одним запросом.
+
+        Возвращает признак существования продукта и гистограмму,
+        если для продукта уже были отзывы.
+        """
+        result = await session.execute(
+            select(Product.id, RatingHistogram).
+            outerjoin(RatingHistogram,
+                      RatingHistogram.product_slug == Product.slug).
+            where(Product.slug == product_slug)
+        )
+        row = result.first()
+        if row is None:
+            return False, None
+        return True, row.RatingHistogram
+
+    @traced()
+    async def increment(
+        self,
+        product_slug: str,
+        grade: int,
+        session: AsyncSession
+    ) -> None:
+        """Метод для учета нового отзыва с оценкой grade."""
+        column = RatingHistogram.get_column_name(grade)
+        query = get_dialect_insert(session)(RatingHistogram).values(
+            product_slug=product_slug, **{column: 1}
+        )
+        await session.execute(
+            query.on_conflict_do_update(
+                index_elements=(RatingHistogram.product_slug,),
+                set_={
+                    column: getattr(RatingHistogram, column) + 1,
+                    'updated_at': func.now()
+                }
+            )
+        )
+
+    @traced()
+    async def decrement(
+        self,
+        product_slug: str,
+        grade: int,
+        session: AsyncSession
+    ) -> None:
+        """Метод для учета удаленного отзыва с оценкой grade."""
+        column = RatingHistogram.get_column_name(grade)
+        await session.execute(
+            update(RatingHistogram).
+            where(RatingHistogram.product_slug == product_slug).
+            values({column: getattr(RatingHistogram, column) - 1})
+        )
+
+    @traced()
+    async def subtract_user_reviews(
+        self,
+        username: str,
+        session: AsyncSession
+    ) -> None:
+        """
+        Метод для вычитания отзывов пользователя из гистограмм.
+
+        Вызывается перед удалением пользователя: его отзывы удаляет
+        сама БД через ON DELETE CASCADE.
+        """
+        user_reviews = and_(
+            Review.product_slug == RatingHistogram.product_slug,
+            Review.user_username == username
+        )
+        await session.execute(
+            update(RatingHistogram).
+            where(RatingHistogram.product_slug.in_(
+                select(Review.product_slug).
+                where(Review.user_username == username)
+            )).
+            values({
+                RatingHistogram.get_column_name(grade): (
+                    getattr(RatingHistogram,
+                            RatingHistogram.get_column_name(grade)) -
+                    select(func.count()).
+                    where(user_reviews, Review.grade == grade).
+                    scalar_subquery()
+                )
+                for grade in REVIEW_GRADES
+            })
+        )
+
+    @traced()
+    async def rebuild(self, session: AsyncSession) -> int:
+        """
+        Метод для пересчета всех гистограмм по отзывам.
+
+        Отзывы читаются за один проход с GROUP BY, гистограммы
+        вставляются или заменяются одним INSERT ... ON CONFLICT.
+        Возвращает количество гистограмм.
+        """
+        columns = [
+            RatingHistogram.get_column_name(grade) for grade in REVIEW_GRADES
+        ]
+        source = (
+            select(
+                Product.slug,
+                *(func.count(Review.id).filter(Review.grade == grade)
+                  for grade in REVIEW_GRADES)
+            ).
+            outerjoin(Review, Review.product_slug == Product.slug).
+            group_by(Product.slug)
+        )
+        query = get_dialect_insert(session)(RatingHistogram).from_select(
+            ('product_slug', *columns), source
+        )
+        result = await session.execute(
+            query.on_conflict_do_update(
+                index_elements=(RatingHistogram.product_slug,),
+                set_={
+                    **{column: query.excluded[column] for column in columns},
+                    'updated_at': func.now()
+                }
+            )
+        )
+        await session.commit()
+        return result.rowcount
+
+
+rating_histogram_crud = CRUDRatingHistogram(RatingHistogram)
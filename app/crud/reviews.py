@@ -1,27 +1,144 @@
 """Модуль для создания CRUD операций для отзыва."""
 
-from sqlalchemy import select
+from typing import Any, Literal, Sequence
+
+from sqlalchemy import and_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from app.core.tracing import traced
+from app.crud.base import CRUDBase, SchemaType
+from app.crud.rating_histograms import rating_histogram_crud
+from app.models import Product, Review, User
 
-from app.crud.base import CRUDBase
-from app.models import Review
+ReviewSort = Literal['newest', 'highest', 'lowest']
+
+REVIEW_SORT_COLUMNS = {
+    'newest': 'created_at',
+    'highest': 'grade',
+    'lowest': 'grade'
+}
+ASCENDING_REVIEW_SORTS = ('lowest',)
 
 
 class CRUDReview(CRUDBase):
-    """Класс для создания CRUD операций для отзыва."""
+    """
+    Класс для создания CRUD операций для отзыва.
+
+    Создание, изменение оценки и удаление отзыва изменяют гистограмму
+    оценок продукта в той же транзакции.
+    """
 
+    @traced()
+    async def create(
+        self,
+        schema: SchemaType,
+        session: AsyncSession,
+        user: User = None,
+        product_slug: str = None
+    ) -> Review:
+        """Метод для создания отзыва."""
+        await rating_histogram_crud.increment(
+            product_slug, schema.grade, session
+        )
+        return await super().create(schema, session, user, product_slug)
+
+    @traced()
+    async def update(
+        self,
+        model_obj: Review,
+        schema: SchemaType,
+        session: AsyncSession,
+        version: int | None = None
+    ) -> Review:
+        """
+        Метод для изменения отзыва.
+
+        Версия проверяется до изменения гистограммы оценок.
+        """
+        self.check_version(model_obj, version)
+        grade = schema.model_dump(exclude_unset=True).get('grade')
+        if grade is not None and grade != model_obj.grade:
+            await rating_histogram_crud.decrement(
+                model_obj.product_slug, model_obj.grade, session
+            )
+            await rating_histogram_crud.increment(
+                model_obj.product_slug, grade, session
+            )
+        return await super().update(model_obj, schema, session, version)
+
+    @traced()
+    async def delete(
+        self,
+        model_obj: Review,
+        session: AsyncSession
+    ) -> None:
+        """Метод для удаления отзыва."""
+        await rating_histogram_crud.decrement(
+            model_obj.product_slug, model_obj.grade, session
+        )
+        await super().delete(model_obj, session)
+
+    @traced()
     async def get_reviews_by_product_or_all(
         self,
         product_slug: str,
-        session: AsyncSession
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
     ) -> list[Review]:
-        """Метод для получения всех отзывов или отзывов по продукту."""
-        query = select(Review)
+        """
+        Метод для получения всех отзывов или отзывов по продукту.
+
+        С fields загружаются только запрошенные поля.
+        """
+        query = select(Review).options(*self.get_fields_options(fields))
         if product_slug:
             query = query.where(Review.product_slug == product_slug)
         reviews = await session.execute(query)
         return reviews.scalars().all()
 
+    @traced()
+    async def get_page_for_product(
+        self,
+        product_slug: str,
+        sort: ReviewSort,
+        limit: int,
+        after: tuple[Any, int] | None,
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
+    ) -> list[Review]:
+        """
+        Метод для получения страницы отзывов продукта.
+
+        Страница начинается после отзыва с ключом after (значение
+        колонки сортировки и id), поэтому запрос читает из индекса
+        (product_slug, колонка сортировки, id) только limit строк
+        на любой странице. Связи отзывов не загружаются.
+        """
+        column = REVIEW_SORT_COLUMNS[sort]
+        key = (getattr(Review, column), Review.id)
+        ascending = sort in ASCENDING_REVIEW_SORTS
+        query = (
+            select(Review).
+            where(Review.product_slug == product_slug).
+            order_by(*(item.asc() if ascending else item.desc()
+                       for item in key)).
+            limit(limit).
+            options(*(
+                self.get_fields_options((*fields, column)) if fields
+                else [lazyload('*')]
+            ))
+        )
+        if after is not None:
+            after_key = tuple_(*after, types=[item.type for item in key])
+            query = query.where(
+                tuple_(*key) > after_key if ascending
+                else tuple_(*key) < after_key
+            )
+        reviews = await session.execute(query)
+        return reviews.scalars().all()
+
+    @traced()
     async def get_review_by_product_slug_and_username(
         self,
         product_slug,
@@ -36,5 +153,32 @@ class CRUDReview(CRUDBase):
         )
         return review.scalar()
 
+    @traced()
+    async def get_for_product(
+        self,
+        product_slug: str,
+        review_id: int,
+        session: AsyncSession,
+        fields: Sequence[str] | None = None
+    ) -> tuple[bool, Review | None]:
+        """
+        Метод для получения отзыва продукта одним запросом.
+
+        Возвращает признак существования продукта и отзыв, если отзыв
+        с таким id относится к этому продукту. Связи отзыва
+        не загружаются, с fields загружаются только запрошенные поля.
+        """
+        result = await session.execute(
+            select(Product.id, Review).
+            outerjoin(Review, and_(Review.product_slug == Product.slug,
+                                   Review.id == review_id)).
+            where(Product.slug == product_slug).
+            options(*(self.get_fields_options(fields) or [lazyload('*')]))
+        )
+        row = result.first()
+        if row is None:
+            return False, None
+        return True, row.Review
+
 
 review_crud = CRUDReview(Review)
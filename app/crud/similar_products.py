@@ -0,0 +1,40 @@
+"""Модуль для создания CRUD операций для похожих продуктов."""
+
+from typing import Sequence
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tracing import traced
+from app.crud.base import CRUDBase
+from app.models import Product, SimilarProduct
+
+
+class CRUDSimilarProduct(CRUDBase):
+    """Класс для создания CRUD операций для похожих продуктов."""
+
+    @traced()
+    async def get_for_product(
+        self,
+        product_slug: str,
+        limit: int,
+        session: AsyncSession
+    ) -> Sequence[Row]:
+        """
+        Метод для получения продуктов, похожих на продукт.
+
+        Строки читаются из индекса (product_slug, score) уже
+        в порядке близости.
+        """
+        similar = await session.execute(
+            select(SimilarProduct.similar_slug.label('product_slug'),
+                   Product.name, SimilarProduct.score).
+            join(Product, Product.slug == SimilarProduct.similar_slug).
+            where(SimilarProduct.product_slug == product_slug).
+            order_by(SimilarProduct.score.desc()).
+            limit(limit)
+        )
+        return similar.all()
+
+
+similar_product_crud = CRUDSimilarProduct(SimilarProduct)
@@ -3,13 +3,71 @@
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.base import CRUDBase
+from app.core.hashing import hash_password
+from app.core.tracing import traced
+from app.crud.base import CRUDBase, SchemaType
+from app.crud.rating_histograms import rating_histogram_crud
 from app.models import User
 
 
 class CRUDUser(CRUDBase):
-    """Класс для создания CRUD операций для пользователя."""
+    """
+    Класс для создания CRUD операций для пользователя.
 
+    Пароль хэшируется перед сохранением в пуле потоков bcrypt.
+    """
+
+    @traced()
+    async def hash_schema_password(self, schema: SchemaType) -> SchemaType:
+        """Метод для замены пароля в схеме на его хэш."""
+        if schema.password is None:
+            return schema
+        return schema.model_copy(
+            update={'password': await hash_password(schema.password)}
+        )
+
+    @traced()
+    async def create(
+        self,
+        schema: SchemaType,
+        session: AsyncSession,
+        user: User = None,
+        product_slug: str = None
+    ) -> User:
+        """Метод для создания пользователя."""
+        schema = await self.hash_schema_password(schema)
+        return await super().create(schema, session, user, product_slug)
+
+    @traced()
+    async def update(
+        self,
+        model_obj: User,
+        schema: SchemaType,
+        session: AsyncSession,
+        version: int | None = None
+    ) -> User:
+        """Метод для изменения пользователя."""
+        schema = await self.hash_schema_password(schema)
+        return await super().update(model_obj, schema, session, version)
+
+    @traced()
+    async def delete(
+        self,
+        model_obj: User,
+        session: AsyncSession
+    ) -> None:
+        """
+        Метод для удаления пользователя.
+
+        Отзывы пользователя удаляются каскадом в БД, поэтому
+        они вычитаются из гистограмм оценок в той же транзакции.
+        """
+        await rating_histogram_crud.subtract_user_reviews(
+            model_obj.username, session
+        )
+        await super().delete(model_obj, session)
+
+    @traced()
     async def get_user_by_username(
         self,
         username: str,
@@ -22,6 +80,7 @@ class CRUDUser(CRUDBase):
         )
         return user.scalar()
 
+    @traced()
     async def get_username_and_email(
         self,
         username: str,
@@ -1,13 +1,81 @@
 """Модуль для создания приложения. Основная точка входа."""
 
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
-from app.api.routers import main_router
+from app.api.responses import NegotiatedResponse, build_adapters
+from app.api.routers import main_router, service_router
+from app.core.admission import admission_controller
+from app.core.config import settings
+from app.core.db import async_session_maker, engine
+from app.core.jobs import job_runner
+from app.core.leaderboards import leaderboard_refresher
+from app.core.tracing import configure_tracing_from_settings
+from app.core.warmup import warm_up
+from app.middlewares import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    MetricsMiddleware,
+    QueryBudgetMiddleware,
+    ServerTimingMiddleware,
+    TracingMiddleware
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Функция для запуска и остановки приложения.
+
+    При запуске собираются адаптеры ответов, прогреваются соединения
+    с БД и кэш SQL-запросов, планируется пересчет рейтингов.
+    Остановка начинается, когда сервер уже перестал принимать
+    соединения и дождался текущих запросов (SERVER_DRAIN_TIMEOUT):
+    выполняются оставшиеся фоновые задачи и закрываются соединения с БД.
+    """
+    build_adapters()
+    if settings.WARMUP:
+        await warm_up(engine, async_session_maker, settings.WARMUP_CONNECTIONS)
+    if settings.LEADERBOARD_REFRESH_INTERVAL:
+        job_runner.schedule(
+            leaderboard_refresher.refresh,
+            settings.LEADERBOARD_REFRESH_INTERVAL
+        )
+    await job_runner.start()
+    yield
+    await job_runner.stop(timeout=settings.JOB_DRAIN_TIMEOUT)
+    await engine.dispose()
+
+
+configure_tracing_from_settings()
+
+app = FastAPI(lifespan=lifespan, default_response_class=NegotiatedResponse)
 
-app = FastAPI()
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    zstd_level=settings.COMPRESSION_ZSTD_LEVEL
+)
+app.add_middleware(
+    QueryBudgetMiddleware,
+    budget=settings.SQL_QUERY_BUDGET
+)
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=admission_controller,
+    retry_after=settings.ADMISSION_RETRY_AFTER
+)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
 
 app.include_router(main_router)
+app.include_router(service_router)
 
 
 if __name__ == '__main__':
@@ -15,5 +83,6 @@ if __name__ == '__main__':
         'app.main:app',
         host='127.0.0.1',
         port=8000,
-        reload=True
+        reload=True,
+        timeout_graceful_shutdown=settings.SERVER_DRAIN_TIMEOUT
     )
@@ -0,0 +1,8 @@
+"""Файл для инициализации пакета."""
+
+from .admission import AdmissionMiddleware
+from .compression import CompressionMiddleware
+from .metrics import MetricsMiddleware
+from .query_budget import QueryBudgetMiddleware
+from .server_timing import ServerTimingMiddleware
+from .tracing import TracingMiddleware
@@ -0,0 +1,71 @@
+"""
+Модуль для сброса нагрузки при перегрузке пула соединений.
+
+Middleware допускает запрос к API, только если не исчерпан
+адаптивный лимит одновременных запросов, иначе сразу отвечает 503
+с заголовком Retry-After. GET и HEAD запросы каталога считаются
+чтением и имеют приоритет, остальные запросы к API (запись, вход,
+профиль пользователя) - записью. Запросы администратора и служебные
+маршруты (метрики, документация) не ограничиваются.
+"""
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.admission import READ, WRITE, AdmissionController
+from app.core.metrics import ADMISSION_REJECTED
+
+READ_METHODS = ('GET', 'HEAD')
+CATALOG_PREFIXES = (
+    '/api/v1/categories/',
+    '/api/v1/leaderboards/',
+    '/api/v1/products/',
+    '/api/v1/reviews/'
+)
+API_PREFIX = '/api/'
+EXEMPT_PREFIXES = ('/api/v1/admin/',)
+
+
+def get_priority(scope: Scope) -> str | None:
+    """Функция для получения приоритета запроса или None без ограничения."""
+    path = scope['path']
+    if not path.startswith(API_PREFIX) or path.startswith(EXEMPT_PREFIXES):
+        return None
+    if scope['method'] in READ_METHODS and path.startswith(CATALOG_PREFIXES):
+        return READ
+    return WRITE
+
+
+class AdmissionMiddleware:
+    """Middleware для отклонения запросов сверх адаптивного лимита."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        retry_after: int
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+        self.controller = controller
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        priority = get_priority(scope) if scope['type'] == 'http' else None
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+        if not self.controller.try_acquire(priority):
+            ADMISSION_REJECTED.labels(priority).inc()
+            response = JSONResponse(
+                {'detail': 'Сервер перегружен, повторите запрос позже.'},
+                status_code=503,
+                headers={'Retry-After': str(self.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
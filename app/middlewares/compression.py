@@ -0,0 +1,204 @@
+"""
+Модуль для сжатия ответов.
+
+Кодировка выбирается по заголовку Accept-Encoding (zstd, br, gzip),
+ответы меньше порога не сжимаются, потоковые ответы сжимаются
+по частям без буферизации всего тела.
+"""
+
+import zlib
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ENCODINGS_PRIORITY = ('zstd', 'br', 'gzip')
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/msgpack',
+    'application/problem+json',
+    'text/'
+)
+
+
+class GzipCompressor:
+    """Класс для сжатия gzip."""
+
+    def __init__(self, level: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Метод для сжатия части тела с выдачей готовых данных."""
+        return (self.compressor.compress(data) +
+                self.compressor.flush(zlib.Z_SYNC_FLUSH))
+
+    def finish(self) -> bytes:
+        """Метод для завершения потока сжатия."""
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    """Класс для сжатия brotli."""
+
+    def __init__(self, quality: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """Метод для сжатия части тела с выдачей готовых данных."""
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self) -> bytes:
+        """Метод для завершения потока сжатия."""
+        return self.compressor.finish()
+
+
+class ZstdCompressor:
+    """Класс для сжатия zstd."""
+
+    def __init__(self, level: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Метод для сжатия части тела с выдачей готовых данных."""
+        return (self.compressor.compress(data) +
+                self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        """Метод для завершения потока сжатия."""
+        return self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Функция для выбора кодировки по заголовку Accept-Encoding.
+
+    Из принятых клиентом кодировок (q > 0) выбирается первая
+    по приоритету сервера.
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        accepted[name.strip()] = quality
+    for encoding in ENCODINGS_PRIORITY:
+        quality = accepted.get(encoding, accepted.get('*', 0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Middleware для сжатия ответов по Accept-Encoding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        gzip_level: int,
+        brotli_quality: int,
+        zstd_level: int
+    ):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors = {
+            'zstd': lambda: ZstdCompressor(zstd_level),
+            'br': lambda: BrotliCompressor(brotli_quality),
+            'gzip': lambda: GzipCompressor(gzip_level)
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get('accept-encoding', '')
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(
+            send, encoding, self.compressors[encoding], self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Класс для сжатия сообщений одного ответа."""
+
+    def __init__(self, send: Send, encoding: str, factory, minimum_size: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.raw_send = send
+        self.encoding = encoding
+        self.factory = factory
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        """Метод для перехвата и сжатия сообщений ответа."""
+        if message['type'] == 'http.response.start':
+            self.start_message = message
+            return
+        if message['type'] != 'http.response.body' or self.passthrough:
+            await self.raw_send(message)
+            return
+        if self.start_message is not None:
+            await self.start(message)
+            return
+        await self.send_body(
+            message.get('body', b''), message.get('more_body', False)
+        )
+
+    async def start(self, message: Message) -> None:
+        """Метод для выбора сжатия по первой части тела ответа."""
+        start_message, self.start_message = self.start_message, None
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        headers = MutableHeaders(raw=start_message['headers'])
+        content_type = headers.get('content-type', '')
+        self.passthrough = (
+            'content-encoding' in headers or
+            not content_type.startswith(COMPRESSIBLE_TYPES) or
+            (not more_body and len(body) < self.minimum_size)
+        )
+        if self.passthrough:
+            await self.raw_send(start_message)
+            await self.raw_send(message)
+            return
+        self.compressor = self.factory()
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+        if more_body:
+            if 'content-length' in headers:
+                del headers['content-length']
+            await self.raw_send(start_message)
+            await self.send_body(body, more_body)
+            return
+        compressed = self.compressor.compress(body) + self.compressor.finish()
+        headers['Content-Length'] = str(len(compressed))
+        await self.raw_send(start_message)
+        await self.raw_send({'type': 'http.response.body', 'body': compressed})
+
+    async def send_body(self, body: bytes, more_body: bool) -> None:
+        """Метод для отправки очередной сжатой части тела ответа."""
+        compressed = self.compressor.compress(body) if body else b''
+        if not more_body:
+            compressed += self.compressor.finish()
+        await self.raw_send({
+            'type': 'http.response.body',
+            'body': compressed,
+            'more_body': more_body
+        })
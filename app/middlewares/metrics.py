@@ -0,0 +1,64 @@
+"""
+Модуль для сбора метрик запросов.
+
+Middleware создает статистику запроса, по которой в конце запроса
+одним вызовом обновляются метрики Prometheus. Маршрут берется
+из шаблона пути, поэтому количество меток не зависит от параметров.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.instrumentation import RequestStats, request_stats
+from app.core.metrics import (
+    REQUEST_EXCEPTIONS,
+    UNMATCHED_ROUTE,
+    observe_request
+)
+
+
+def get_route_path(scope: Scope) -> str:
+    """Функция для получения шаблона пути маршрута запроса."""
+    route = scope.get('route')
+    return getattr(route, 'path', UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Middleware для сбора метрик запросов."""
+
+    def __init__(self, app: ASGIApp):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats(scope)
+        token = request_stats.set(stats)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            REQUEST_EXCEPTIONS.labels(
+                scope['method'], get_route_path(scope)
+            ).inc()
+            raise
+        finally:
+            request_stats.reset(token)
+            observe_request(
+                scope['method'],
+                get_route_path(scope),
+                status,
+                time.perf_counter() - stats.started_at,
+                stats
+            )
@@ -0,0 +1,58 @@
+"""
+Модуль для контроля количества SQL-запросов на запрос к API.
+
+Если запрос к API выполнил больше SQL-запросов, чем разрешено,
+в лог пишется предупреждение с повторяющимися отпечатками запросов,
+по которым видны N+1 запросы и повторные загрузки объектов.
+"""
+
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.instrumentation import RequestStats, request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """Middleware для подсчета SQL-запросов на запрос к API."""
+
+    def __init__(self, app: ASGIApp, budget: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        stats = request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats(scope)
+            token = request_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if token is not None:
+                request_stats.reset(token)
+            if stats.queries > self.budget:
+                self.warn(scope, stats)
+
+    def warn(self, scope: Scope, stats: RequestStats) -> None:
+        """Метод для записи предупреждения о превышении бюджета."""
+        repeated = '\n'.join(
+            f'{count} x {statement}'
+            for statement, count in stats.get_repeated_statements()
+        )
+        logger.warning(
+            'Запрос %s %s выполнил %s SQL-запросов при бюджете %s.'
+            '\nПовторяющиеся запросы:\n%s',
+            scope['method'],
+            scope['path'],
+            stats.queries,
+            self.budget,
+            repeated or '-'
+        )
@@ -0,0 +1,69 @@
+"""
+Модуль для заголовка Server-Timing.
+
+Middleware включает учет этапов запроса в его статистике и добавляет
+в ответ заголовок Server-Timing: проверка токена (jwt), загрузка
+пользователя (user), разрешения и загрузка объекта (permission),
+SQL-запросы (db), сериализация ответа (serialization) и общее время
+до начала ответа (total). Время db пересекается с user и permission,
+в которые входят их SQL-запросы.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.instrumentation import RequestStats, request_stats
+
+SERVER_TIMING_STAGES = ('jwt', 'user', 'permission', 'serialization')
+
+
+def format_server_timing(stats: RequestStats) -> str:
+    """Функция для формирования значения заголовка Server-Timing."""
+    metrics = [
+        f'{name};dur={stats.timings[name] * 1000:.2f}'
+        for name in SERVER_TIMING_STAGES if name in stats.timings
+    ]
+    if stats.queries:
+        metrics.append(
+            f'db;dur={stats.query_seconds * 1000:.2f};'
+            f'desc="{stats.queries} queries"'
+        )
+    metrics.append(
+        f'total;dur={(time.perf_counter() - stats.started_at) * 1000:.2f}'
+    )
+    return ', '.join(metrics)
+
+
+class ServerTimingMiddleware:
+    """Middleware для добавления заголовка Server-Timing."""
+
+    def __init__(self, app: ASGIApp):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        stats = request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats(scope)
+            token = request_stats.set(stats)
+        stats.timings = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(raw=message['headers']).append(
+                    'Server-Timing', format_server_timing(stats)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if token is not None:
+                request_stats.reset(token)
@@ -0,0 +1,69 @@
+"""
+Модуль для трассировки запросов.
+
+Middleware продолжает трассу из заголовка traceparent или начинает
+новую, создает корневой span запроса с шаблоном маршрута в имени
+и возвращает контекст записанной трассы в заголовке traceresponse.
+"""
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import tracer
+from app.middlewares.metrics import get_route_path
+
+
+class TracingMiddleware:
+    """Middleware для создания корневого span'а запроса."""
+
+    def __init__(self, app: ASGIApp):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Магический метод для обработки запроса."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        context = propagate.extract({
+            key.decode('latin-1'): value.decode('latin-1')
+            for key, value in scope['headers']
+        })
+        method = scope['method']
+        with tracer.start_as_current_span(
+            method,
+            context=context,
+            kind=SpanKind.SERVER,
+            attributes={
+                'http.request.method': method,
+                'url.path': scope['path']
+            }
+        ) as span:
+            status = 500
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status
+                if message['type'] == 'http.response.start':
+                    status = message['status']
+                    if span.is_recording():
+                        carrier = {}
+                        propagate.inject(
+                            carrier, context=trace.set_span_in_context(span)
+                        )
+                        MutableHeaders(raw=message['headers']).append(
+                            'traceresponse', carrier['traceparent']
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if span.is_recording():
+                    route = get_route_path(scope)
+                    span.update_name(f'{method} {route}')
+                    span.set_attribute('http.route', route)
+                    span.set_attribute('http.response.status_code', status)
+                    if status >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
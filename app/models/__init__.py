@@ -1,6 +1,10 @@
 """Файл для инициализации пакета."""
 
 from .categories import Category
+from .leaderboard_states import LeaderboardState
+from .product_rankings import ProductRanking
 from .products import Product
+from .rating_histograms import RatingHistogram
 from .reviews import Review
+from .similar_products import SimilarProduct
 from .users import RoleEnum, User
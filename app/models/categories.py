@@ -5,9 +5,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.constants import CATEGORY_NAME_MAX_LENGTH
 from app.core.db import Base
+from app.models.mixins import VersionMixin
 
 
-class Category(Base):
+class Category(VersionMixin, Base):
     """Модель Category."""
 
     __tablename__ = 'categories'
@@ -21,7 +22,7 @@ class Category(Base):
     )
     slug: Mapped[str] = mapped_column(unique=True, index=True)
     parent_slug: Mapped[str | None] = mapped_column(
-        ForeignKey('categories.slug'),
+        ForeignKey('categories.slug', ondelete='CASCADE'),
         default=None
     )
 
@@ -33,13 +34,15 @@ class Category(Base):
     )
     subcategories: Mapped[list['Category']] = relationship(
         'Category',
-        lazy='selectin',
+        lazy='select',
         back_populates='parent_category',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
     products: Mapped[list['Product']] = relationship(
         'Product',
-        lazy='selectin',
+        lazy='select',
         back_populates='category',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
@@ -0,0 +1,22 @@
+"""Модуль для создания модели LeaderboardState."""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base, Timestamp
+
+
+class LeaderboardState(Base):
+    """
+    Модель LeaderboardState.
+
+    Единственная строка с временем прошлого пересчета рейтингов
+    и средней оценкой прошлого полного пересчета. Хранится в БД,
+    чтобы новый процесс продолжал пересчет с того же места.
+    """
+
+    __tablename__ = 'leaderboard_states'
+
+    prior_mean: Mapped[float]
+    refreshed_at: Mapped[datetime] = mapped_column(Timestamp)
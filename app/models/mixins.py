@@ -0,0 +1,21 @@
+"""Модуль для миксинов моделей."""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+
+class VersionMixin:
+    """
+    Миксин для оптимистичной блокировки.
+
+    UPDATE выполняется с условием на текущую версию и увеличивает ее
+    в том же запросе, поэтому параллельные изменения не блокируют
+    друг друга, а проигравший запрос получает StaleDataError.
+    """
+
+    version: Mapped[int] = mapped_column(server_default=text('1'))
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        """Настройка маппера для учета версии объекта."""
+        return {'version_id_col': cls.__table__.c.version}
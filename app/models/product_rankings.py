@@ -0,0 +1,35 @@
+"""Модуль для создания модели ProductRanking."""
+
+from sqlalchemy import ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class ProductRanking(Base):
+    """
+    Модель ProductRanking.
+
+    Байесовская средняя оценка продукта за все время и за последние
+    дни для таблиц лидеров. Строки пересчитываются фоновой задачей,
+    индексы по оценке отдают первые места без сортировки.
+    """
+
+    __tablename__ = 'product_rankings'
+    __table_args__ = (
+        Index('ix_product_rankings_rating_reviews_count',
+              'rating', 'reviews_count'),
+        Index('ix_product_rankings_trending_rating_trending_reviews_count',
+              'trending_rating', 'trending_reviews_count')
+    )
+
+    product_slug: Mapped[str] = mapped_column(
+        ForeignKey('products.slug', ondelete='CASCADE'),
+        unique=True
+    )
+    rating: Mapped[float]
+    reviews_count: Mapped[int]
+    trending_rating: Mapped[float | None] = mapped_column(default=None)
+    trending_reviews_count: Mapped[int] = mapped_column(
+        server_default=text('0')
+    )
@@ -17,9 +17,10 @@ from app.core.constants import (
     PRODUCT_NAME_MAX_LENGTH
 )
 from app.core.db import Base
+from app.models.mixins import VersionMixin
 
 
-class Product(Base):
+class Product(VersionMixin, Base):
     """Модель Product."""
 
     __tablename__ = 'products'
@@ -32,8 +33,12 @@ class Product(Base):
         String(PRODUCT_IMAGE_URL_MAX_LENGTH)
     )
     stock: Mapped[int]
-    user_username: Mapped[str] = mapped_column(ForeignKey('users.username'))
-    category_slug: Mapped[str] = mapped_column(ForeignKey('categories.slug'))
+    user_username: Mapped[str] = mapped_column(
+        ForeignKey('users.username', ondelete='CASCADE')
+    )
+    category_slug: Mapped[str] = mapped_column(
+        ForeignKey('categories.slug', ondelete='CASCADE')
+    )
 
     category: Mapped['Category'] = relationship(
         'Category',
@@ -47,9 +52,10 @@ class Product(Base):
     )
     reviews: Mapped[list['Review']] = relationship(
         'Review',
-        lazy='selectin',
+        lazy='raise',
         back_populates='product',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
 
     @declared_attr
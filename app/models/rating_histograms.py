@@ -0,0 +1,45 @@
+"""Модуль для создания модели RatingHistogram."""
+
+from sqlalchemy import ForeignKey, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.constants import REVIEW_GRADES
+from app.core.db import Base
+
+
+class RatingHistogram(Base):
+    """
+    Модель RatingHistogram.
+
+    Количество отзывов продукта по каждой оценке от 1 до 10.
+    Счетчики изменяются в той же транзакции, что и отзывы.
+    """
+
+    __tablename__ = 'rating_histograms'
+
+    product_slug: Mapped[str] = mapped_column(
+        ForeignKey('products.slug', ondelete='CASCADE'),
+        unique=True
+    )
+    grade_1: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_2: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_3: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_4: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_5: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_6: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_7: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_8: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_9: Mapped[int] = mapped_column(server_default=text('0'))
+    grade_10: Mapped[int] = mapped_column(server_default=text('0'))
+
+    @staticmethod
+    def get_column_name(grade: int) -> str:
+        """Метод для получения имени счетчика оценки."""
+        return f'grade_{grade}'
+
+    def get_grades(self) -> dict[int, int]:
+        """Метод для получения количества отзывов по оценкам."""
+        return {
+            grade: getattr(self, self.get_column_name(grade))
+            for grade in REVIEW_GRADES
+        }
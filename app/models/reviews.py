@@ -1,20 +1,33 @@
 """Модуль для создания модели Review."""
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db import Base
+from app.models.mixins import VersionMixin
 
 
-class Review(Base):
+class Review(VersionMixin, Base):
     """Модель Review."""
 
     __tablename__ = 'reviews'
+    __table_args__ = (
+        Index('ix_reviews_product_slug_created_at_id',
+              'product_slug', 'created_at', 'id'),
+        Index('ix_reviews_product_slug_grade_id',
+              'product_slug', 'grade', 'id'),
+        Index('ix_reviews_created_at_product_slug_grade',
+              'created_at', 'product_slug', 'grade')
+    )
 
     grade: Mapped[int]
     text: Mapped[str | None] = mapped_column(Text, default=None)
-    user_username: Mapped[str] = mapped_column(ForeignKey('users.username'))
-    product_slug: Mapped[str] = mapped_column(ForeignKey('products.slug'))
+    user_username: Mapped[str] = mapped_column(
+        ForeignKey('users.username', ondelete='CASCADE')
+    )
+    product_slug: Mapped[str] = mapped_column(
+        ForeignKey('products.slug', ondelete='CASCADE')
+    )
 
     user: Mapped['User'] = relationship(
         'User',
@@ -0,0 +1,30 @@
+"""Модуль для создания модели SimilarProduct."""
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class SimilarProduct(Base):
+    """
+    Модель SimilarProduct.
+
+    Продукт, похожий на product_slug по отзывам одних и тех же
+    пользователей, и косинусная близость продуктов. Строки заменяются
+    целиком командой build-similar-products.
+    """
+
+    __tablename__ = 'similar_products'
+    __table_args__ = (
+        Index('ix_similar_products_product_slug_score',
+              'product_slug', 'score'),
+    )
+
+    product_slug: Mapped[str] = mapped_column(
+        ForeignKey('products.slug', ondelete='CASCADE')
+    )
+    similar_slug: Mapped[str] = mapped_column(
+        ForeignKey('products.slug', ondelete='CASCADE')
+    )
+    score: Mapped[float]
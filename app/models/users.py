@@ -42,13 +42,15 @@ class User(Base):
 
     products: Mapped[list['Product']] = relationship(
         'Product',
-        lazy='selectin',
+        lazy='select',
         back_populates='user',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
     reviews: Mapped[list['Review']] = relationship(
         'Review',
-        lazy='selectin',
+        lazy='select',
         back_populates='user',
-        cascade='all, delete-orphan'
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
@@ -8,8 +8,12 @@ from .categories import (
 from .mixins import SlugMixin
 from .products import (
     ProductCreateSchema,
+    ProductImportSchema,
     ProductReadSchema,
     ProductUpdateSchema
 )
+from .product_rankings import ProductRankingReadSchema
+from .rating_histograms import RatingHistogramReadSchema
 from .reviews import ReviewCreateSchema, ReviewReadSchema, ReviewUpdateSchema
+from .similar_products import SimilarProductReadSchema
 from .users import UserCreateSchema, UserReadSchema, UserUpdateSchema
@@ -26,3 +26,4 @@ class CategoryReadSchema(BaseModel):
     name: str
     slug: str
     parent_slug: str | None
+    version: int
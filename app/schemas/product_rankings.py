@@ -0,0 +1,12 @@
+"""Модуль для создания схем модели ProductRanking."""
+
+from pydantic import BaseModel
+
+
+class ProductRankingReadSchema(BaseModel):
+    """Схема для чтения данных."""
+
+    product_slug: str
+    name: str
+    rating: float
+    reviews_count: int
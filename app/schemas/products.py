@@ -37,6 +37,12 @@ class ProductCreateSchema(ProductUpdateSchema, SlugMixin):
     category_slug: str
 
 
+class ProductImportSchema(ProductCreateSchema):
+    """Схема для валидации строк файла импорта продуктов."""
+
+    image_url: HttpUrl = Field(max_length=PRODUCT_IMAGE_URL_MAX_LENGTH)
+
+
 class ProductReadSchema(BaseModel):
     """Схема для чтения данных."""
 
@@ -50,3 +56,4 @@ class ProductReadSchema(BaseModel):
     category_slug: str
     user_username: str
     rating: float | None
+    version: int
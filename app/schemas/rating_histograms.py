@@ -0,0 +1,11 @@
+"""Модуль для создания схем модели RatingHistogram."""
+
+from pydantic import BaseModel
+
+
+class RatingHistogramReadSchema(BaseModel):
+    """Схема для чтения данных."""
+
+    product_slug: str
+    grades: dict[int, int]
+    total: int
@@ -24,3 +24,4 @@ class ReviewReadSchema(BaseModel):
     grade: int
     product_slug: str
     user_username: str
+    version: int
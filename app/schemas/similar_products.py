@@ -0,0 +1,11 @@
+"""Модуль для создания схем модели SimilarProduct."""
+
+from pydantic import BaseModel
+
+
+class SimilarProductReadSchema(BaseModel):
+    """Схема для чтения данных."""
+
+    product_slug: str
+    name: str
+    score: float
@@ -1,6 +1,6 @@
 """Модуль для создания схем модели User."""
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field
 
 from app.core.constants import (
     USER_EMAIL_MAX_LENGTH,
@@ -9,7 +9,6 @@ from app.core.constants import (
     USER_PASSWORD_MAX_LENGTH,
     USER_USERNAME_REGEXP
 )
-from app.core.security import bcrypt_context
 from app.models import RoleEnum
 
 
@@ -25,13 +24,6 @@ class UserUpdateSchema(BaseModel):
     email: EmailStr = Field(max_length=USER_EMAIL_MAX_LENGTH, default=None)
     password: str = Field(max_length=USER_PASSWORD_MAX_LENGTH, default=None)
 
-    @field_validator('password')
-    @classmethod
-    def set_hash_password(cls, value):
-        """Метод для установления hash-пароля."""
-        value = bcrypt_context.hash(value)
-        return value
-
 
 class UserCreateSchema(UserUpdateSchema):
     """Схема для валидации и создания данных."""
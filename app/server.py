@@ -0,0 +1,119 @@
+"""
+Модуль для запуска приложения в production.
+
+Приложение запускается под gunicorn с воркерами uvicorn на uvloop
+и httptools. Число воркеров по умолчанию равно числу доступных
+процессу ядер. Приложение импортируется один раз в мастер-процессе
+(preload) и наследуется воркерами при fork, соединения с БД
+открываются уже в воркерах. Воркер перезапускается после
+SERVER_MAX_REQUESTS запросов (со случайным разбросом, чтобы воркеры
+не перезапускались одновременно) и завершает текущие запросы
+в течение SERVER_DRAIN_TIMEOUT секунд.
+
+Метрики Prometheus собираются со всех воркеров через каталог
+PROMETHEUS_MULTIPROC_DIR, который создается при запуске, если не задан.
+
+Запуск:
+    python -m app.server
+
+Для разработки (перезагрузка кода и отладчик) используется
+python -m app.main или docker/docker-compose.dev.yml.
+"""
+
+import glob
+import os
+import tempfile
+
+from gunicorn.app.base import BaseApplication
+from uvicorn_worker import UvicornWorker
+
+from app.core.config import settings
+
+PROMETHEUS_MULTIPROC_DIR = 'PROMETHEUS_MULTIPROC_DIR'
+
+
+class ProductionWorker(UvicornWorker):
+    """
+    Воркер uvicorn с циклом событий uvloop и парсером httptools.
+
+    Текущие запросы при остановке ожидаются SERVER_DRAIN_TIMEOUT секунд,
+    чтобы до завершения воркера по SERVER_GRACEFUL_TIMEOUT осталось
+    время на остановку приложения (lifespan).
+    """
+
+    CONFIG_KWARGS = {
+        'loop': 'uvloop',
+        'http': 'httptools',
+        'timeout_graceful_shutdown': settings.SERVER_DRAIN_TIMEOUT
+    }
+
+
+def get_workers_count() -> int:
+    """Функция для получения числа воркеров по доступным ядрам."""
+    if settings.SERVER_WORKERS:
+        return settings.SERVER_WORKERS
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def child_exit(server, worker) -> None:
+    """Функция для удаления файлов метрик завершенного воркера."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def get_options() -> dict:
+    """Функция для получения настроек gunicorn из Settings."""
+    return {
+        'bind': f'{settings.SERVER_HOST}:{settings.SERVER_PORT}',
+        'workers': get_workers_count(),
+        'worker_class': ProductionWorker,
+        'preload_app': True,
+        'backlog': settings.SERVER_BACKLOG,
+        'keepalive': settings.SERVER_KEEPALIVE,
+        'timeout': settings.SERVER_TIMEOUT,
+        'graceful_timeout': settings.SERVER_GRACEFUL_TIMEOUT,
+        'max_requests': settings.SERVER_MAX_REQUESTS,
+        'max_requests_jitter': settings.SERVER_MAX_REQUESTS_JITTER,
+        'child_exit': child_exit,
+        'accesslog': '-',
+        'errorlog': '-'
+    }
+
+
+class ProductionServer(BaseApplication):
+    """Класс приложения gunicorn с настройками из Settings."""
+
+    def __init__(self, options: dict):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Метод для передачи настроек в gunicorn."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        """Метод для импорта ASGI-приложения."""
+        from app.main import app
+        return app
+
+
+def main() -> None:
+    """Точка входа production-сервера."""
+    directory = os.environ.get(PROMETHEUS_MULTIPROC_DIR)
+    if directory is None:
+        os.environ[PROMETHEUS_MULTIPROC_DIR] = tempfile.mkdtemp(
+            prefix='prometheus-'
+        )
+    else:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, '*.db')):
+            os.remove(path)
+    ProductionServer(get_options()).run()
+
+
+if __name__ == '__main__':
+    main()
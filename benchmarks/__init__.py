@@ -0,0 +1 @@
+"""Файл для инициализации пакета."""
@@ -0,0 +1,148 @@
+"""
+Бенчмарк удаления категории с большим количеством продуктов.
+
+Сравнивает каскадное удаление силами ORM (загрузка всех дочерних
+объектов и DELETE на каждую строку, как было до passive_deletes)
+с удалением через ON DELETE CASCADE в самой БД,
+которое использует CRUDBase.delete.
+
+Запуск:
+    python -m benchmarks.bench_cascade_delete --products 100000
+    python -m benchmarks.bench_cascade_delete --db-url postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+from app.core.db import Base
+from app.crud import category_crud
+from app.models import Category, Product, RoleEnum, User
+
+BATCH_SIZE = 5000
+
+
+def create_engine(db_url: str):
+    """Функция для создания движка с включенными внешними ключами."""
+    engine = create_async_engine(db_url)
+    if engine.dialect.name == 'sqlite':
+        @event.listens_for(engine.sync_engine, 'connect')
+        def enable_foreign_keys(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA foreign_keys=ON')
+            cursor.close()
+    return engine
+
+
+async def seed(session: AsyncSession, products: int) -> None:
+    """Функция для заполнения БД категорией с продуктами."""
+    session.add(User(
+        first_name='bench',
+        last_name='bench',
+        username='bench',
+        email='bench@example.com',
+        password='-',
+        role=RoleEnum.SUPPLIER
+    ))
+    session.add(Category(name='bench', slug='bench'))
+    await session.flush()
+    for start in range(0, products, BATCH_SIZE):
+        await session.execute(
+            insert(Product),
+            [
+                {
+                    'name': f'product {i}',
+                    'slug': f'product-{i}',
+                    'price': 1,
+                    'image_url': 'https://example.com/',
+                    'stock': 1,
+                    'user_username': 'bench',
+                    'category_slug': 'bench'
+                }
+                for i in range(start, min(start + BATCH_SIZE, products))
+            ]
+        )
+    await session.commit()
+
+
+async def run(db_url: str, products: int, mode: str) -> dict:
+    """Функция для запуска одного замера."""
+    engine = create_engine(db_url)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as session:
+        await seed(session, products)
+
+    statements = 0
+
+    def count_statements(*args):
+        nonlocal statements
+        statements += 1
+
+    async with session_maker() as session:
+        started = time.perf_counter()
+        event.listen(
+            engine.sync_engine, 'before_cursor_execute', count_statements
+        )
+        query = select(Category).where(Category.slug == 'bench')
+        if mode == 'orm':
+            query = query.options(
+                selectinload(Category.subcategories),
+                selectinload(Category.products).selectinload(Product.reviews)
+            )
+        category = await session.scalar(query)
+        if mode == 'orm':
+            await session.delete(category)
+            await session.commit()
+        else:
+            await category_crud.delete(category, session)
+        elapsed = time.perf_counter() - started
+        event.remove(
+            engine.sync_engine, 'before_cursor_execute', count_statements
+        )
+        left = await session.scalar(
+            select(Product.id).where(Product.category_slug == 'bench')
+        )
+    await engine.dispose()
+    return {
+        'mode': mode,
+        'products': products,
+        'seconds': round(elapsed, 3),
+        'statements': statements,
+        'products_left': int(left is not None)
+    }
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--products', type=int, default=100_000)
+    parser.add_argument('--db-url', default=None)
+    parser.add_argument('--mode', choices=('db', 'orm', 'both'),
+                        default='both')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = args.db_url or (
+            f'sqlite+aiosqlite:///{Path(tmp) / "bench.db"}'
+        )
+        modes = ('orm', 'db') if args.mode == 'both' else (args.mode,)
+        for mode in modes:
+            result = asyncio.run(run(db_url, args.products, mode))
+            print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Бенчмарк сжатия ответов списков продуктов и отзывов.
+
+Для каждой кодировки и уровня выводит размер сжатого тела,
+долю сэкономленных байт и процессорное время на сжатие и распаковку.
+
+Запуск:
+    python -m benchmarks.bench_compression --sizes 100 1000 10000
+"""
+
+import argparse
+import gzip
+import json
+import time
+
+import brotli
+import zstandard
+
+from app.api.responses import (
+    SchemaResponse,
+    product_list_adapter,
+    review_list_adapter
+)
+from app.middlewares.compression import (
+    BrotliCompressor,
+    GzipCompressor,
+    ZstdCompressor
+)
+from app.models import Review
+from benchmarks.bench_serialization import make_products
+
+LEVELS = {
+    'gzip': (GzipCompressor, gzip.decompress, (1, 6, 9)),
+    'br': (BrotliCompressor, brotli.decompress, (1, 4, 9)),
+    'zstd': (
+        ZstdCompressor,
+        lambda data: zstandard.ZstdDecompressor().decompressobj(
+        ).decompress(data),
+        (1, 3, 9)
+    )
+}
+
+
+def make_reviews(size: int) -> list[Review]:
+    """Функция для создания списка ORM-объектов отзывов без БД."""
+    return [
+        Review(
+            id=i,
+            text=f'отзыв {i} ' + 'текст отзыва ' * 5,
+            grade=i % 10 + 1,
+            product_slug=f'product-{i % 100}',
+            user_username=f'user-{i % 50}',
+            version=1
+        )
+        for i in range(size)
+    ]
+
+
+def measure(func, repeat: int) -> tuple[float, object]:
+    """Функция для получения лучшего процессорного времени и результата."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.process_time()
+        result = func()
+        best = min(best, time.process_time() - started)
+    return best, result
+
+
+def compress(factory, level: int, body: bytes) -> bytes:
+    """Функция для сжатия тела так же, как это делает middleware."""
+    compressor = factory(level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=(100, 1_000, 10_000))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        payloads = {
+            'products': SchemaResponse(
+                product_list_adapter, make_products(size)
+            ).body,
+            'reviews': SchemaResponse(
+                review_list_adapter, make_reviews(size)
+            ).body
+        }
+        for endpoint, body in payloads.items():
+            for encoding, (factory, decompress, levels) in LEVELS.items():
+                for level in levels:
+                    compress_time, compressed = measure(
+                        lambda: compress(factory, level, body), args.repeat
+                    )
+                    decompress_time, restored = measure(
+                        lambda: decompress(compressed), args.repeat
+                    )
+                    assert restored == body
+                    print(json.dumps({
+                        'endpoint': endpoint,
+                        'items': size,
+                        'encoding': encoding,
+                        'level': level,
+                        'raw_bytes': len(body),
+                        'compressed_bytes': len(compressed),
+                        'saved': round(1 - len(compressed) / len(body), 3),
+                        'compress_ms': round(compress_time * 1000, 2),
+                        'decompress_ms': round(decompress_time * 1000, 2)
+                    }))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Бенчмарк накладных расходов сбора метрик на запрос.
+
+Вызывает ASGI-приложение с одним маршрутом без HTTP-сервера
+с MetricsMiddleware и без него и выводит время на запрос.
+
+Запуск:
+    python -m benchmarks.bench_metrics --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+
+from app.core.instrumentation import request_stats
+from app.middlewares import MetricsMiddleware
+
+SCOPE = {
+    'type': 'http',
+    'asgi': {'version': '3.0'},
+    'http_version': '1.1',
+    'method': 'GET',
+    'scheme': 'http',
+    'path': '/items/1',
+    'raw_path': b'/items/1',
+    'root_path': '',
+    'query_string': b'',
+    'headers': [],
+    'server': ('test', 80),
+    'client': ('test', 1)
+}
+
+
+def create_app() -> FastAPI:
+    """Функция для создания приложения с одним маршрутом."""
+    app = FastAPI()
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int):
+        stats = request_stats.get()
+        if stats is not None:
+            stats.observe_query('SELECT 1', 0.0001)
+        return {'id': item_id}
+
+    return app
+
+
+async def run(app, requests: int) -> float:
+    """Функция для выполнения запросов и получения времени на запрос."""
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    app = create_app()
+    apps = {'without_metrics': app, 'with_metrics': MetricsMiddleware(app)}
+    results = dict.fromkeys(apps, float('inf'))
+    for _ in range(args.repeat):
+        for name, asgi_app in apps.items():
+            results[name] = min(
+                results[name], asyncio.run(run(asgi_app, args.requests))
+            )
+    print(json.dumps({
+        **{name: round(value * 1e6, 1) for name, value in results.items()},
+        'overhead': round(
+            (results['with_metrics'] - results['without_metrics']) * 1e6, 1
+        ),
+        'unit': 'us'
+    }))
+
+
+if __name__ == '__main__':
+    main()
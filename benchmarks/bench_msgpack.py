@@ -0,0 +1,82 @@
+"""
+Бенчмарк пропускной способности JSON и MessagePack для списка продуктов.
+
+Измеряет кодирование ответа на сервере (SchemaResponse) и декодирование
+тела на клиенте, а также размер тела в каждом формате.
+
+Запуск:
+    python -m benchmarks.bench_msgpack --sizes 100 1000 10000
+"""
+
+import argparse
+import json
+import time
+
+import msgpack
+import orjson
+
+from app.api.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    SchemaResponse,
+    product_list_adapter,
+    response_media_type
+)
+from benchmarks.bench_serialization import make_products
+
+DECODERS = {
+    JSON_MEDIA_TYPE: orjson.loads,
+    MSGPACK_MEDIA_TYPE: msgpack.unpackb
+}
+
+
+def measure(func, repeat: int) -> float:
+    """Функция для получения лучшего времени из нескольких запусков."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def encode(products, media_type: str) -> bytes:
+    """Функция для кодирования ответа в выбранном формате."""
+    token = response_media_type.set(media_type)
+    try:
+        return SchemaResponse(product_list_adapter, products).body
+    finally:
+        response_media_type.reset(token)
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=(100, 1_000, 10_000))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        products = make_products(size)
+        bodies = {}
+        for media_type, decode in DECODERS.items():
+            body = bodies[media_type] = encode(products, media_type)
+            encode_time = measure(
+                lambda: encode(products, media_type), args.repeat
+            )
+            decode_time = measure(lambda: decode(body), args.repeat)
+            print(json.dumps({
+                'items': size,
+                'format': media_type,
+                'bytes': len(body),
+                'encode_ms': round(encode_time * 1000, 2),
+                'decode_ms': round(decode_time * 1000, 2),
+                'items_per_second': round(size / (encode_time + decode_time))
+            }))
+        assert msgpack.unpackb(bodies[MSGPACK_MEDIA_TYPE]) == orjson.loads(
+            bodies[JSON_MEDIA_TYPE]
+        )
+
+
+if __name__ == '__main__':
+    main()
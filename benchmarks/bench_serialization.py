@@ -0,0 +1,109 @@
+"""
+Микробенчмарк сериализации списка продуктов.
+
+Сравнивает стандартный путь FastAPI (валидация по response_model,
+сериализация в python-объекты и json.dumps или orjson.dumps)
+с однопроходной сериализацией через TypeAdapter.dump_json.
+
+Запуск:
+    python -m benchmarks.bench_serialization --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import SchemaResponse, product_list_adapter
+from app.models import Product
+from app.schemas import ProductReadSchema
+
+
+def make_products(size: int) -> list[Product]:
+    """Функция для создания списка ORM-объектов продуктов без БД."""
+    products = []
+    for i in range(size):
+        product = Product(
+            id=i,
+            name=f'product {i}',
+            slug=f'product-{i}',
+            description='description ' * 10,
+            price=i % 1000 + 1,
+            image_url=f'https://example.com/{i}.png',
+            stock=i % 7,
+            category_slug='category',
+            user_username='supplier',
+            version=1
+        )
+        product.rating = Decimal('7.5')
+        products.append(product)
+    return products
+
+
+async def fastapi_default(products, field, response_class) -> bytes:
+    """Функция сериализации так, как это делает FastAPI."""
+    content = await serialize_response(field=field, response_content=products)
+    return response_class(content).body
+
+
+def type_adapter(products) -> bytes:
+    """Функция однопроходной сериализации через TypeAdapter."""
+    return SchemaResponse(product_list_adapter, products).body
+
+
+def measure(func, repeat: int) -> float:
+    """Функция для получения лучшего времени из нескольких запусков."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=(1_000, 10_000, 100_000))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    field = create_model_field(
+        name='response', type_=list[ProductReadSchema], mode='serialization'
+    )
+    for size in args.sizes:
+        products = make_products(size)
+        results = {
+            'fastapi_json': measure(
+                lambda: asyncio.run(
+                    fastapi_default(products, field, JSONResponse)
+                ),
+                args.repeat
+            ),
+            'fastapi_orjson': measure(
+                lambda: asyncio.run(
+                    fastapi_default(products, field, ORJSONResponse)
+                ),
+                args.repeat
+            ),
+            'type_adapter': measure(
+                lambda: type_adapter(products), args.repeat
+            )
+        }
+        assert orjson.loads(type_adapter(products[:10])) == json.loads(
+            asyncio.run(fastapi_default(products[:10], field, JSONResponse))
+        )
+        timings = {
+            name: round(value * 1000, 1) for name, value in results.items()
+        }
+        print(json.dumps({'items': size, **timings, 'unit': 'ms'}))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Бенчмарк времени первых запросов после запуска приложения.
+
+Каждый замер выполняется в новом процессе: приложение импортируется,
+затем без прогрева или с прогревом, как в lifespan (адаптеры ответов,
+соединения пула и кэш SQL-запросов), выполняется по одному первому
+запросу к каждому маршруту. Результат - медиана по запускам.
+
+Запуск:
+    python -m benchmarks.bench_warmup --runs 5
+    python -m benchmarks.bench_warmup --db-url postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.responses import build_adapters
+from app.core.config import settings
+from app.core.db import Base, db_session
+from app.core.warmup import warm_up
+from app.main import app
+from benchmarks.bench_cascade_delete import create_engine, seed
+
+URLS = (
+    '/api/v1/categories/',
+    '/api/v1/categories/bench/',
+    '/api/v1/products/?category_slug=bench&is_active=true',
+    '/api/v1/products/product-1/',
+    '/api/v1/reviews/?product_slug=product-1'
+)
+
+
+async def prepare(db_url: str, products: int) -> None:
+    """Функция для создания схемы и заполнения БД."""
+    engine = create_engine(db_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        await seed(session, products)
+    await engine.dispose()
+
+
+async def measure_first_requests(db_url: str, warm: bool) -> dict:
+    """Функция для замера первых запросов в текущем процессе."""
+    engine = create_engine(db_url)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def get_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[db_session] = get_session
+    started = time.perf_counter()
+    if warm:
+        build_adapters()
+        await warm_up(engine, session_maker, settings.WARMUP_CONNECTIONS)
+    result = {'startup': time.perf_counter() - started}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://bench'
+    ) as client:
+        for url in URLS:
+            started = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            result[url] = time.perf_counter() - started
+    await engine.dispose()
+    return result
+
+
+def run_child(db_url: str, warm: bool) -> dict:
+    """Функция для замера в новом процессе."""
+    output = subprocess.run(
+        (sys.executable, '-m', 'benchmarks.bench_warmup', '--child',
+         '--db-url', db_url, *(('--warm',) if warm else ())),
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--db-url', default=None)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--child', action='store_true',
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--warm', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        result = asyncio.run(measure_first_requests(args.db_url, args.warm))
+        print(json.dumps(result))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = args.db_url or (
+            f'sqlite+aiosqlite:///{Path(tmp) / "bench.db"}'
+        )
+        asyncio.run(prepare(db_url, args.products))
+        for warm in (False, True):
+            runs = [run_child(db_url, warm) for _ in range(args.runs)]
+            print(json.dumps({
+                'warm': warm,
+                **{
+                    key: round(
+                        statistics.median(run[key] for run in runs) * 1000, 2
+                    )
+                    for key in runs[0]
+                },
+                'first_requests_ms': round(
+                    statistics.median(
+                        sum(run[url] for url in URLS) for run in runs
+                    ) * 1000,
+                    2
+                )
+            }, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Нагрузочный тест API на заполненном каталоге.
+
+БД пересоздается и заполняется каталогом по seed, затем виртуальные
+пользователи выполняют сценарии (категории, продукты, карточка
+продукта, отзыв, вход). Результат - JSON с p50/p95/p99, пропускной
+способностью и количеством SQL-запросов на запрос, который можно
+сравнивать между коммитами.
+
+Запуск:
+    python -m benchmarks.load --products 10000 --reviews 50000
+    python -m benchmarks.load --products 1000000 --reviews 20000000 \
+        --db-url postgresql+asyncpg://... --processes 8
+    python -m benchmarks.load --db-url postgresql+asyncpg://... \
+        --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.cli.seed import SeedPlan
+from app.core.db import Base, db_session
+from app.core.jobs import job_runner
+from app.main import app
+from benchmarks.bench_cascade_delete import create_engine
+from benchmarks.load.driver import run_load
+from benchmarks.load.scenarios import SCENARIOS, ScenarioContext
+from benchmarks.load.seed import Catalog, seed_load_catalog
+
+
+def get_commit() -> str | None:
+    """Функция для получения текущего коммита."""
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace, db_url: str) -> dict:
+    """Функция для подготовки БД и запуска нагрузки."""
+    engine = create_engine(db_url)
+    catalog = Catalog(
+        SeedPlan(
+            customers=args.customers,
+            suppliers=args.suppliers,
+            root_categories=args.root_categories,
+            depth=args.depth,
+            max_fanout=args.max_fanout,
+            products=args.products,
+            reviews=args.reviews,
+            seed=args.seed
+        ),
+        args.reviewers
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    rows = await seed_load_catalog(engine, catalog, args.processes)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def get_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[db_session] = get_session
+    job_runner.session_maker = session_maker
+    scenarios = {name: SCENARIOS[name] for name in args.scenarios}
+    try:
+        report = await run_load(
+            app,
+            engine,
+            ScenarioContext(catalog),
+            scenarios,
+            args.concurrency,
+            args.iterations,
+            args.seed
+        )
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+    return {
+        'commit': get_commit(),
+        'dialect': engine.dialect.name,
+        'config': {
+            key: value for key, value in vars(args).items()
+            if key not in ('db_url', 'output')
+        },
+        'rows': rows,
+        **report
+    }
+
+
+def main() -> None:
+    """Точка входа нагрузочного теста."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--db-url', help='По умолчанию SQLite во временном '
+                                         'файле, как в тестах.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--iterations', type=int, default=50,
+                        help='Сценариев на виртуального пользователя.')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS,
+                        default=list(SCENARIOS))
+    parser.add_argument('--customers', type=int, default=1000)
+    parser.add_argument('--suppliers', type=int, default=50)
+    parser.add_argument('--reviewers', type=int, default=1000,
+                        help='Авторов для сценария создания отзывов.')
+    parser.add_argument('--root-categories', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--max-fanout', type=int, default=10)
+    parser.add_argument('--products', type=int, default=10_000)
+    parser.add_argument('--reviews', type=int, default=50_000)
+    parser.add_argument('--processes', type=int, default=0,
+                        help='Процессов генерации каталога.')
+    parser.add_argument('--output', type=Path)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        db_url = args.db_url or (
+            f'sqlite+aiosqlite:///{Path(directory) / "load.db"}'
+        )
+        result = asyncio.run(run(args, db_url))
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding='utf-8')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
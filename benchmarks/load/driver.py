@@ -0,0 +1,164 @@
+"""
+Модуль с асинхронным драйвером нагрузки.
+
+Каждый виртуальный пользователь выполняет заданное число сценариев,
+выбранных по весам генератором со своим seed, поэтому набор запросов
+воспроизводим между запусками. Приложение вызывается в процессе через
+ASGI без HTTP-сервера. SQL-запросы считаются событиями движка
+и относятся к запросу через контекстную переменную.
+"""
+
+import asyncio
+import math
+import random
+import time
+from contextvars import ContextVar
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.load.scenarios import ScenarioContext
+
+PERCENTILES = (50, 95, 99)
+
+
+class QuerySample:
+    """Класс для подсчета SQL-запросов одного запроса к API."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.queries = 0
+
+
+current_sample: ContextVar[QuerySample | None] = ContextVar(
+    'current_sample', default=None
+)
+
+
+class RequestMetrics:
+    """Класс для накопления результатов запросов одного типа."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.queries = 0
+
+    def observe(self, latency: float, status: int, queries: int) -> None:
+        """Метод для учета выполненного запроса."""
+        self.latencies.append(latency)
+        self.queries += queries
+        if status >= 400:
+            self.errors += 1
+
+    def report(self, duration: float) -> dict:
+        """Метод для получения итогов в миллисекундах."""
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            'requests': count,
+            'errors': self.errors,
+            'throughput_rps': round(count / duration, 1),
+            **{
+                f'p{percentile}_ms': round(
+                    latencies[math.ceil(percentile / 100 * count) - 1] * 1000,
+                    2
+                )
+                for percentile in PERCENTILES
+            },
+            'queries_per_request': round(self.queries / count, 2)
+        }
+
+
+class Recorder:
+    """Класс для выполнения и учета запросов к приложению."""
+
+    def __init__(self, client: AsyncClient, results: dict):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.client = client
+        self.results = results
+
+    async def request(self, name: str, method: str, url: str, **kwargs):
+        """Метод для выполнения запроса с замером времени и SQL."""
+        sample = QuerySample()
+        token = current_sample.set(sample)
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        finally:
+            latency = time.perf_counter() - started_at
+            current_sample.reset(token)
+        self.results.setdefault(name, RequestMetrics()).observe(
+            latency, response.status_code, sample.queries
+        )
+        return response
+
+
+def count_queries(conn, cursor, statement, parameters, context, executemany):
+    """Функция для учета SQL-запроса в текущем запросе к API."""
+    sample = current_sample.get()
+    if sample is not None:
+        sample.queries += 1
+
+
+async def virtual_user(
+    recorder: Recorder,
+    context: ScenarioContext,
+    scenarios: dict,
+    iterations: int,
+    rng: random.Random
+) -> None:
+    """Функция виртуального пользователя, выполняющего сценарии."""
+    functions = [function for function, _ in scenarios.values()]
+    weights = [weight for _, weight in scenarios.values()]
+    for _ in range(iterations):
+        scenario = rng.choices(functions, weights)[0]
+        await scenario(recorder, context, rng)
+
+
+async def run_load(
+    app,
+    engine: AsyncEngine,
+    context: ScenarioContext,
+    scenarios: dict,
+    concurrency: int,
+    iterations: int,
+    seed: int
+) -> dict:
+    """Функция для запуска нагрузки и получения отчета."""
+    results: dict[str, RequestMetrics] = {}
+    event.listen(engine.sync_engine, 'after_cursor_execute', count_queries)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url='http://load'
+        ) as client:
+            recorder = Recorder(client, results)
+            started_at = time.perf_counter()
+            await asyncio.gather(*(
+                virtual_user(
+                    recorder,
+                    context,
+                    scenarios,
+                    iterations,
+                    random.Random(seed + number)
+                )
+                for number in range(concurrency)
+            ))
+            duration = time.perf_counter() - started_at
+    finally:
+        event.remove(engine.sync_engine, 'after_cursor_execute',
+                     count_queries)
+    total = RequestMetrics()
+    for metrics in results.values():
+        total.latencies.extend(metrics.latencies)
+        total.errors += metrics.errors
+        total.queries += metrics.queries
+    return {
+        'duration_s': round(duration, 2),
+        'total': total.report(duration),
+        'requests': {
+            name: results[name].report(duration) for name in sorted(results)
+        }
+    }
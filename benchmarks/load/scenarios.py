@@ -0,0 +1,115 @@
+"""
+Модуль со сценариями нагрузочного теста.
+
+Сценарий - корутина, выполняющая один или несколько запросов
+через Recorder. Популярность продуктов неравномерная: номер продукта
+совпадает с его местом по популярности, и небольшая часть каталога
+получает большую часть просмотров.
+"""
+
+import random
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from benchmarks.load.seed import Catalog
+
+API = '/api/v1'
+
+
+class ScenarioContext:
+    """Класс с общими для сценариев данными каталога."""
+
+    def __init__(self, catalog: Catalog):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.catalog = catalog
+        self.tokens = {
+            username: create_access_token(
+                username, expiration_time=settings.TOKEN_EXPIRE
+            )
+            for username in catalog.reviewers
+        }
+
+    def popular_product(self, rng: random.Random) -> str:
+        """Метод для выбора продукта со смещением к популярным."""
+        products = self.catalog.products
+        return products[int(len(products) * rng.random() ** 3)]
+
+    def unreviewed_pair(self, rng: random.Random) -> tuple[str, str]:
+        """Метод для выбора автора и продукта без его отзыва."""
+        while True:
+            pair = (
+                rng.choice(self.catalog.reviewers),
+                self.popular_product(rng)
+            )
+            if pair not in self.catalog.reviewed:
+                self.catalog.reviewed.add(pair)
+                return pair
+
+
+async def browse_categories(recorder, context, rng) -> None:
+    """Сценарий просмотра дерева категорий."""
+    await recorder.request('list_categories', 'GET', f'{API}/categories/')
+    await recorder.request(
+        'list_subcategories',
+        'GET',
+        f'{API}/categories/',
+        params={'parent_slug': rng.choice(context.catalog.root_categories)}
+    )
+
+
+async def list_products(recorder, context, rng) -> None:
+    """Сценарий просмотра продуктов категории и фильтра наличия."""
+    slug, root_slug = rng.choice(context.catalog.categories)
+    await recorder.request(
+        'list_products_by_category',
+        'GET',
+        f'{API}/products/',
+        params={'category_slug': slug}
+    )
+    await recorder.request(
+        'list_active_products_by_root_category',
+        'GET',
+        f'{API}/products/',
+        params={'category_slug': root_slug, 'is_active': True}
+    )
+
+
+async def product_detail(recorder, context, rng) -> None:
+    """Сценарий просмотра продукта."""
+    slug = context.popular_product(rng)
+    await recorder.request('product_detail', 'GET', f'{API}/products/{slug}/')
+
+
+async def post_review(recorder, context, rng) -> None:
+    """Сценарий создания отзыва."""
+    username, slug = context.unreviewed_pair(rng)
+    await recorder.request(
+        'post_review',
+        'POST',
+        f'{API}/products/{slug}/reviews/',
+        json={'grade': rng.randint(1, 10), 'text': 'отзыв'},
+        headers={'Authorization': f'Bearer {context.tokens[username]}'}
+    )
+
+
+async def login(recorder, context, rng) -> None:
+    """Сценарий входа пользователя."""
+    username = rng.choice(context.catalog.customers)
+    await recorder.request(
+        'login',
+        'POST',
+        f'{API}/auth/login/',
+        data={
+            'username': username,
+            'password': context.catalog.get_password(username)
+        }
+    )
+
+
+SCENARIOS = {
+    'browse_categories': (browse_categories, 20),
+    'list_products': (list_products, 30),
+    'product_detail': (product_detail, 35),
+    'post_review': (post_review, 10),
+    'login': (login, 5)
+}
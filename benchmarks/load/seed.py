@@ -0,0 +1,62 @@
+"""
+Модуль для заполнения БД каталогом для нагрузочного теста.
+
+Каталог генерируется командой seed (app.cli.seed) детерминированно
+по seed. Для сценария создания отзывов отдельно создаются
+пользователи reviewer-i без отзывов, поэтому сценарий не пересекается
+со сгенерированными отзывами.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.cli.bulk import load_records
+from app.cli.seed import USER_COLUMNS, SeedPlan, get_password, seed_catalog
+from app.core.hashing import bcrypt_context
+from app.models import RoleEnum, User
+
+
+class Catalog:
+    """Класс с параметрами генерации и ключами созданных объектов."""
+
+    def __init__(self, plan: SeedPlan, reviewers: int):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.plan = plan
+        self.customers = [f'customer-{i}' for i in range(plan.customers)]
+        self.reviewers = [f'reviewer-{i}' for i in range(reviewers)]
+        levels = plan.get_category_levels()
+        self.root_categories = [slug for slug, _ in levels[0]]
+        self.categories = [
+            (slug, '-'.join(slug.split('-')[:2]))
+            for slug in plan.get_leaf_categories(levels)
+        ]
+        self.products = [f'product-{i}' for i in range(plan.products)]
+        self.reviewed: set[tuple[str, str]] = set()
+
+    def get_password(self, username: str) -> str:
+        """Метод для получения пароля пользователя каталога."""
+        number = int(username.rsplit('-', 1)[1])
+        return get_password(number, self.plan.passwords)
+
+
+async def seed_load_catalog(
+    engine: AsyncEngine,
+    catalog: Catalog,
+    processes: int
+) -> dict[str, int]:
+    """Функция для заполнения БД каталогом и авторами новых отзывов."""
+    report = await seed_catalog(engine, catalog.plan, processes=processes)
+    password = bcrypt_context.hash(catalog.get_password(catalog.reviewers[0]))
+    async with engine.begin() as conn:
+        await load_records(conn, User.__table__, USER_COLUMNS, [
+            (
+                username,
+                username,
+                username,
+                f'{username}@example.com',
+                password,
+                RoleEnum.CUSTOMER.name
+            )
+            for username in catalog.reviewers
+        ])
+    report.add(User.__tablename__, len(catalog.reviewers), 0)
+    return report.rows
@@ -4,27 +4,12 @@ from typing import AsyncGenerator
 
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine
-)
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import Base, db_session
+from app.core.jobs import job_runner
 from app.main import app
-
-TEST_DATABASE_URL = 'sqlite+aiosqlite:///:memory:'
-
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    connect_args={'check_same_thread': False}
-)
-
-test_async_session = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+from .database import test_async_session, test_engine
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -51,6 +36,7 @@ async def override_session(test_db_session) -> None:
         yield test_db_session
     app.dependency_overrides = {}
     app.dependency_overrides[db_session] = mock_get_session
+    job_runner.session_maker = test_async_session
 
 
 @pytest_asyncio.fixture
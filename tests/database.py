@@ -0,0 +1,30 @@
+"""Модуль для создания тестовой БД и фабрики сессий."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+TEST_DATABASE_URL = 'sqlite+aiosqlite:///:memory:'
+
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    connect_args={'check_same_thread': False}
+)
+
+
+@event.listens_for(test_engine.sync_engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Включение внешних ключей, чтобы работал ON DELETE CASCADE."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+test_async_session = async_sessionmaker(
+    test_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
@@ -7,7 +7,8 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import bcrypt_context, get_current_user
+from app.core.hashing import bcrypt_context
+from app.core.security import get_current_user
 from app.main import app
 from app.models import RoleEnum, User
 from ..utils import create_db_obj
@@ -0,0 +1,169 @@
+"""Модуль создания тестов для сброса нагрузки при перегрузке пула."""
+
+import asyncio
+import time
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+import app.core.db
+from app.core.admission import READ, WRITE, AdmissionController
+from app.core.db import InstrumentedPool
+from app.middlewares import AdmissionMiddleware
+
+POOL_SIZE = 2
+HOLD_SECONDS = 0.05
+
+
+def make_controller(max_limit: int = 8) -> AdmissionController:
+    """Функция для создания контроллера с маленьким лимитом."""
+    return AdmissionController(
+        min_limit=POOL_SIZE,
+        max_limit=max_limit,
+        pool_wait_target=0.01,
+        write_share=0.5
+    )
+
+
+class TestAdmissionController:
+    """Класс для тестирования адаптивного лимита."""
+
+    def test_limit_adapts_to_pool_wait(self):
+        """
+        Тест для проверки уменьшения лимита при долгом ожидании
+        соединения и его восстановления при быстром.
+        """
+        controller = make_controller()
+        for _ in range(100):
+            controller.observe_pool_wait(1.0)
+        assert controller.get_limit(READ) == POOL_SIZE
+        for _ in range(1000):
+            controller.observe_pool_wait(0.0)
+        assert controller.get_limit(READ) == 8
+
+    def test_writes_get_smaller_share(self):
+        """Тест для проверки, что запись отклоняется раньше чтения."""
+        controller = make_controller()
+        for _ in range(4):
+            assert controller.try_acquire(WRITE)
+        assert not controller.try_acquire(WRITE)
+        assert controller.try_acquire(READ)
+        controller.release()
+        assert controller.try_acquire(WRITE) is False
+
+
+class TestAdmissionMiddleware:
+    """Класс для тестирования отклонения запросов сверх лимита."""
+
+    @pytest.fixture
+    def controller(self) -> AdmissionController:
+        """Фикстура для создания контроллера с занятой долей записи."""
+        controller = make_controller()
+        controller.in_flight = controller.get_limit(WRITE)
+        return controller
+
+    @pytest.mark.parametrize(
+        'method, url, expected_status',
+        (
+            ('GET', '/api/v1/products/', HTTPStatus.OK),
+            ('GET', '/api/v1/products/slug/reviews/', HTTPStatus.OK),
+            ('POST', '/api/v1/products/', HTTPStatus.SERVICE_UNAVAILABLE),
+            ('POST', '/api/v1/auth/login/', HTTPStatus.SERVICE_UNAVAILABLE),
+            ('GET', '/api/v1/users/me/', HTTPStatus.SERVICE_UNAVAILABLE),
+            ('GET', '/api/v1/admin/slow-queries/', HTTPStatus.OK),
+            ('GET', '/metrics', HTTPStatus.OK)
+        ),
+        ids=(
+            'catalog_read', 'nested_catalog_read', 'write', 'login',
+            'profile', 'admin', 'service'
+        )
+    )
+    async def test_reads_have_priority(
+        self,
+        controller: AdmissionController,
+        method: str,
+        url: str,
+        expected_status: int
+    ):
+        """
+        Тест для проверки, что при занятой доле записи
+        допускаются только чтение каталога и служебные запросы.
+        """
+        async def endpoint(scope, receive, send):
+            await PlainTextResponse('ok')(scope, receive, send)
+
+        async with AsyncClient(
+            transport=ASGITransport(
+                app=AdmissionMiddleware(endpoint, controller, retry_after=3)
+            ),
+            base_url='http://test'
+        ) as client:
+            response = await client.request(method, url)
+        assert response.status_code == expected_status
+        if expected_status == HTTPStatus.SERVICE_UNAVAILABLE:
+            assert response.headers['retry-after'] == '3'
+        assert controller.in_flight == controller.get_limit(WRITE)
+
+    async def test_admitted_latency_is_bounded_under_overload(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path
+    ):
+        """
+        Тест для проверки, что при перегрузке маленького пула
+        лишние запросы отклоняются, а время допущенных ограничено.
+
+        Без ограничения последний из 20 одновременных клиентов ждал бы
+        соединение 20 / POOL_SIZE * HOLD_SECONDS = 0.5 с на каждом шаге.
+        """
+        engine = create_async_engine(
+            f'sqlite+aiosqlite:///{tmp_path / "admission.db"}',
+            poolclass=InstrumentedPool,
+            pool_size=POOL_SIZE,
+            max_overflow=0
+        )
+        controller = make_controller()
+        monkeypatch.setattr(app.core.db, 'admission_controller', controller)
+
+        async def hold_connection(request: Request) -> PlainTextResponse:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql('SELECT 1')
+                await asyncio.sleep(HOLD_SECONDS)
+            return PlainTextResponse('ok')
+
+        application = AdmissionMiddleware(
+            Starlette(routes=[Route('/api/v1/products/', hold_connection)]),
+            controller,
+            retry_after=1
+        )
+        admitted, rejected = [], 0
+
+        async def run_client(client: AsyncClient) -> None:
+            nonlocal rejected
+            for _ in range(10):
+                started = time.perf_counter()
+                response = await client.get('/api/v1/products/')
+                if response.status_code == HTTPStatus.OK:
+                    admitted.append(time.perf_counter() - started)
+                else:
+                    rejected += 1
+                    await asyncio.sleep(HOLD_SECONDS)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=application),
+            base_url='http://test'
+        ) as client:
+            await asyncio.gather(*(run_client(client) for _ in range(20)))
+        await engine.dispose()
+        assert rejected > 0
+        assert len(admitted) >= 20
+        assert controller.limit < 8
+        assert max(admitted) < 8 / POOL_SIZE * HOLD_SECONDS * 2
+        assert controller.in_flight == 0
@@ -9,8 +9,13 @@ from slugify import slugify
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Category
-from .utils import check_db_data, check_db_fields, check_json_data
+from app.models import Category, Product, Review
+from .utils import (
+    assert_num_queries,
+    check_db_data,
+    check_db_fields,
+    check_json_data
+)
 
 
 class TestCategoryAPI:
@@ -43,7 +48,8 @@ class TestCategoryAPI:
         родительской категории анонимным пользователем.
         """
         params = {'parent_slug': parent_category.slug}
-        response = await client.get(self.list_url, params=params)
+        with assert_num_queries(1):
+            response = await client.get(self.list_url, params=params)
         data = response.json()
         assert response.status_code == HTTPStatus.OK, data
         assert len(data) == 2
@@ -54,9 +60,10 @@ class TestCategoryAPI:
         category_1: Category
     ):
         """Тест для проверки получения категории анонимным пользователем."""
-        response = await client.get(
-            self.detail_url.format(slug=category_1.slug)
-        )
+        with assert_num_queries(1):
+            response = await client.get(
+                self.detail_url.format(slug=category_1.slug)
+            )
         assert response.status_code == HTTPStatus.OK, response.json()
         expected_data = {f: getattr(category_1, f) for f in self.expected_data}
         check_json_data(response, expected_data)
@@ -146,6 +153,51 @@ class TestCategoryAPI:
         check_json_data(response, self.expected_data)
         check_db_data(response, self.expected_data, category_1)
 
+    async def test_get_category_returns_etag(
+        self,
+        client: AsyncClient,
+        category_1: Category
+    ):
+        """Тест для проверки наличия ETag с версией категории."""
+        response = await client.get(
+            self.detail_url.format(slug=category_1.slug)
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['ETag'] == f'"{category_1.version}"'
+
+    async def test_patch_category_with_if_match(
+        self,
+        admin_client: AsyncClient,
+        category_1: Category
+    ):
+        """Тест для проверки изменения категории с актуальной версией."""
+        response = await admin_client.patch(
+            self.detail_url.format(slug=category_1.slug),
+            json=self.request_data,
+            headers={'If-Match': f'"{category_1.version}"'}
+        )
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.headers['ETag'] == '"2"'
+        assert category_1.name == self.request_data['name']
+
+    async def test_patch_category_with_outdated_if_match(
+        self,
+        admin_client: AsyncClient,
+        category_1: Category
+    ):
+        """
+        Тест для проверки ошибки 412 при изменении
+        категории с устаревшей версией.
+        """
+        name = category_1.name
+        response = await admin_client.patch(
+            self.detail_url.format(slug=category_1.slug),
+            json=self.request_data,
+            headers={'If-Match': '2'}
+        )
+        assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+        assert category_1.name == name
+
     async def test_admin_cant_patch_category_on_already_exists_data(
         self,
         admin_client: AsyncClient,
@@ -242,6 +294,30 @@ class TestCategoryAPI:
         )
         assert count == 0
 
+    @pytest.mark.usefixtures('category_2', 'review_1')
+    async def test_admin_can_delete_category_with_related_objects(
+        self,
+        admin_client,
+        test_db_session: AsyncSession,
+        parent_category: Category,
+        category_1: Category
+    ):
+        """
+        Тест для проверки каскадного удаления подкатегорий,
+        продуктов и отзывов вместе с категорией.
+        """
+        category_1.parent_slug = parent_category.slug
+        await test_db_session.commit()
+        response = await admin_client.delete(
+            self.detail_url.format(slug=parent_category.slug)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        for model in (Category, Product, Review):
+            count = await test_db_session.scalar(
+                select(func.count()).select_from(model)
+            )
+            assert count == 0, model.__name__
+
     @pytest.mark.parametrize(
         'parametrized_client, expected_status',
         (
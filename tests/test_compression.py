@@ -0,0 +1,127 @@
+"""Модуль создания тестов для сжатия ответов."""
+
+import gzip
+import json
+
+import brotli
+import pytest
+import zstandard
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.middlewares import CompressionMiddleware
+from app.middlewares.compression import negotiate_encoding
+
+PAYLOAD = [{'id': i, 'name': f'продукт {i}'} for i in range(200)]
+CHUNKS = [json.dumps(PAYLOAD).encode()] * 3
+
+DECOMPRESSORS = {
+    'gzip': gzip.decompress,
+    'br': brotli.decompress,
+    'zstd': lambda data: zstandard.ZstdDecompressor().decompressobj(
+    ).decompress(data)
+}
+
+
+async def large(request):
+    """Эндпоинт с большим ответом."""
+    return JSONResponse(PAYLOAD)
+
+
+async def small(request):
+    """Эндпоинт с маленьким ответом."""
+    return JSONResponse({'id': 1})
+
+
+async def stream(request):
+    """Эндпоинт с потоковым ответом."""
+    async def chunks():
+        for chunk in CHUNKS:
+            yield chunk
+    return StreamingResponse(chunks(), media_type='application/json')
+
+
+app = CompressionMiddleware(
+    Starlette(routes=[
+        Route('/large', large),
+        Route('/small', small),
+        Route('/stream', stream)
+    ]),
+    minimum_size=1024,
+    gzip_level=6,
+    brotli_quality=4,
+    zstd_level=3
+)
+
+
+@pytest.fixture
+async def compression_client():
+    """Фикстура для создания клиента без автоматической распаковки."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def get_raw(client: AsyncClient, url: str, accept_encoding: str):
+    """Функция для получения заголовков и сжатого тела ответа."""
+    async with client.stream(
+        'GET', url, headers={'Accept-Encoding': accept_encoding}
+    ) as response:
+        body = b''.join([chunk async for chunk in response.aiter_raw()])
+    return response, body
+
+
+class TestCompression:
+    """Класс для тестирования сжатия ответов."""
+
+    @pytest.mark.parametrize('accept_encoding, encoding', [
+        ('gzip, deflate, br, zstd', 'zstd'),
+        ('gzip, br', 'br'),
+        ('gzip', 'gzip'),
+        ('zstd;q=0, br;q=0, *', 'gzip'),
+        ('identity', None),
+        ('', None)
+    ])
+    def test_negotiate_encoding(self, accept_encoding, encoding):
+        """Тест для проверки выбора кодировки."""
+        assert negotiate_encoding(accept_encoding) == encoding
+
+    @pytest.mark.parametrize('encoding', ['gzip', 'br', 'zstd'])
+    async def test_large_response_compressed(
+        self,
+        compression_client: AsyncClient,
+        encoding: str
+    ):
+        """Тест для проверки сжатия большого ответа."""
+        response, body = await get_raw(compression_client, '/large', encoding)
+        assert response.headers['content-encoding'] == encoding
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert int(response.headers['content-length']) == len(body)
+        assert json.loads(DECOMPRESSORS[encoding](body)) == PAYLOAD
+
+    async def test_small_response_not_compressed(
+        self,
+        compression_client: AsyncClient
+    ):
+        """Тест для проверки, что ответ меньше порога не сжимается."""
+        response, body = await get_raw(compression_client, '/small', 'gzip')
+        assert 'content-encoding' not in response.headers
+        assert json.loads(body) == {'id': 1}
+
+    @pytest.mark.parametrize('encoding', ['gzip', 'br', 'zstd'])
+    async def test_streaming_response_compressed_by_chunks(
+        self,
+        compression_client: AsyncClient,
+        encoding: str
+    ):
+        """Тест для проверки сжатия потокового ответа по частям."""
+        response, body = await get_raw(
+            compression_client, '/stream', encoding
+        )
+        assert response.headers['content-encoding'] == encoding
+        assert 'content-length' not in response.headers
+        assert DECOMPRESSORS[encoding](body) == b''.join(CHUNKS)
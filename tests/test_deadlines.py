@@ -0,0 +1,120 @@
+"""Модуль создания тестов для ограничения времени обработки запроса."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import DBAPIError
+
+from app.api.dependencies import set_deadline
+from app.api.routing import DEADLINE_EXCEEDED, DeadlineRoute
+from app.core.deadlines import (
+    QUERY_CANCELED_SQLSTATE,
+    Deadline,
+    request_deadline,
+    set_statement_timeout
+)
+
+
+class QueryCanceledError(Exception):
+    """Ошибка драйвера при отмене SQL-запроса по statement_timeout."""
+
+    sqlstate = QUERY_CANCELED_SQLSTATE
+
+
+class ConnectionStub:
+    """Класс соединения, сохраняющий выполненные SQL-запросы."""
+
+    def __init__(self):
+        """Магический метод для инициализации атрибутов объекта."""
+        self.statements = []
+
+    def exec_driver_sql(self, statement: str) -> None:
+        """Метод для сохранения SQL-запроса."""
+        self.statements.append(statement)
+
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+@router.get('/slow/')
+async def slow() -> dict:
+    """Маршрут, выполняющийся дольше срока роутера."""
+    await asyncio.sleep(1)
+    return {}
+
+
+@router.get('/overridden/', dependencies=[Depends(set_deadline(1))])
+async def overridden() -> dict:
+    """Маршрут со сроком больше срока роутера."""
+    await asyncio.sleep(0.1)
+    return {}
+
+
+@router.get('/canceled/')
+async def canceled() -> dict:
+    """Маршрут, SQL-запрос которого отменен по statement_timeout."""
+    raise DBAPIError('SELECT pg_sleep(10)', None, QueryCanceledError())
+
+
+application = FastAPI()
+application.include_router(
+    router, dependencies=[Depends(set_deadline(0.05))]
+)
+
+
+@pytest.fixture
+async def deadline_client():
+    """Фикстура для создания клиента приложения со сроками."""
+    async with AsyncClient(
+        transport=ASGITransport(app=application),
+        base_url='http://test'
+    ) as client:
+        yield client
+
+
+class TestDeadlines:
+    """Класс для тестирования сроков обработки запросов."""
+
+    @pytest.mark.parametrize(
+        'url, expected_status',
+        (
+            ('/slow/', HTTPStatus.GATEWAY_TIMEOUT),
+            ('/overridden/', HTTPStatus.OK),
+            ('/canceled/', HTTPStatus.GATEWAY_TIMEOUT)
+        ),
+        ids=('router_deadline', 'route_deadline', 'statement_timeout')
+    )
+    async def test_deadline_response(
+        self,
+        deadline_client: AsyncClient,
+        url: str,
+        expected_status: int
+    ):
+        """Тест для проверки ответа 504 по истечении срока."""
+        response = await deadline_client.get(url)
+        assert response.status_code == expected_status
+        if expected_status == HTTPStatus.GATEWAY_TIMEOUT:
+            assert response.json() == {'detail': DEADLINE_EXCEEDED}
+
+    async def test_statement_timeout_is_remaining_time(self):
+        """
+        Тест для проверки, что транзакция ограничивает SQL-запросы
+        оставшимся временем обработки запроса.
+        """
+        connection = ConnectionStub()
+        set_statement_timeout(None, None, connection)
+        assert connection.statements == []
+        deadline = Deadline()
+        token = request_deadline.set(deadline)
+        try:
+            deadline.set(2)
+            set_statement_timeout(None, None, connection)
+        finally:
+            deadline.cancel()
+            request_deadline.reset(token)
+        statement, = connection.statements
+        assert statement.startswith('SET LOCAL statement_timeout = ')
+        assert 1900 < int(statement.rsplit(' ', 1)[1]) <= 2000
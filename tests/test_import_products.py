@@ -0,0 +1,147 @@
+"""Модуль создания тестов для импорта продуктов."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cli.import_products import import_products
+from app.models import Category, Product, User
+from .database import test_engine
+
+CSV_HEADER = 'name,description,image_url,price,stock,category_slug\n'
+
+
+class TestImportProducts:
+    """Класс для тестирования импорта продуктов."""
+
+    async def test_import_csv_with_rejects(
+        self,
+        tmp_path: Path,
+        test_db_session: AsyncSession,
+        supplier_1: User,
+        category_1: Category
+    ):
+        """
+        Тест для проверки импорта CSV с отклонением
+        невалидных строк и строк с несуществующей категорией.
+        """
+        path = tmp_path / 'products.csv'
+        slug = category_1.slug
+        path.write_text(
+            CSV_HEADER
+            + f'продукт 1,,https://image1.com/,10,1,{slug}\n'
+            + f'продукт 2,описание,https://image2.com/,-1,1,{slug}\n'
+            + 'продукт 3,,https://image3.com/,5,1,not-found\n'
+            + f'продукт 1,новое,https://image1.com/,20,2,{slug}\n',
+            encoding='utf-8'
+        )
+        rejects = io.StringIO()
+        report = await import_products(
+            path, supplier_1.username, test_engine, rejects, batch_size=2
+        )
+        assert (report.total, report.upserted, report.rejected) == (4, 1, 3)
+        rejected_lines = [
+            line.split(',')[0] for line in rejects.getvalue().splitlines()[1:]
+        ]
+        assert sorted(rejected_lines) == ['2', '3', '4']
+        products = (await test_db_session.scalars(select(Product))).all()
+        assert len(products) == 1
+        assert (products[0].price, products[0].stock) == (20, 2)
+        assert products[0].user_username == supplier_1.username
+
+    async def test_rejected_row_does_not_overwrite_earlier_row(
+        self,
+        tmp_path: Path,
+        test_db_session: AsyncSession,
+        supplier_1: User,
+        category_1: Category
+    ):
+        """
+        Тест для проверки, что отклоненная строка ниже не перекрывает
+        импортируемую строку с тем же slug.
+        """
+        path = tmp_path / 'products.csv'
+        path.write_text(
+            CSV_HEADER
+            + f'продукт 1,,https://image1.com/,10,1,{category_1.slug}\n'
+            + 'продукт 1,,https://image1.com/,20,2,not-found\n',
+            encoding='utf-8'
+        )
+        rejects = io.StringIO()
+        report = await import_products(
+            path, supplier_1.username, test_engine, rejects
+        )
+        assert (report.upserted, report.rejected) == (1, 1)
+        assert rejects.getvalue().splitlines()[1].startswith('3,')
+        products = (await test_db_session.scalars(select(Product))).all()
+        assert [product.price for product in products] == [10]
+
+    async def test_import_ndjson_updates_existing_product(
+        self,
+        tmp_path: Path,
+        test_db_session: AsyncSession,
+        supplier_1: User,
+        product_1: Product
+    ):
+        """
+        Тест для проверки обновления существующего продукта
+        и отклонения невалидного JSON при импорте NDJSON.
+        """
+        row = {
+            'name': product_1.name,
+            'image_url': 'https://new-image.com/',
+            'price': 99,
+            'stock': 0,
+            'category_slug': product_1.category_slug
+        }
+        path = tmp_path / 'products.ndjson'
+        path.write_text(json.dumps(row) + '\n{invalid\n', encoding='utf-8')
+        report = await import_products(
+            path, supplier_1.username, test_engine, io.StringIO()
+        )
+        assert (report.upserted, report.rejected) == (1, 1)
+        await test_db_session.refresh(product_1)
+        assert (product_1.price, product_1.stock) == (99, 0)
+        assert product_1.image_url == row['image_url']
+
+    async def test_import_rejects_another_users_product(
+        self,
+        tmp_path: Path,
+        test_db_session: AsyncSession,
+        supplier_1: User,
+        supplier_2: User,
+        product_1: Product
+    ):
+        """
+        Тест для проверки отклонения строк с продуктом
+        другого пользователя без его изменения.
+        """
+        path = tmp_path / 'products.csv'
+        path.write_text(
+            CSV_HEADER
+            + f'{product_1.name},,https://new-image.com/,99,0,'
+            + f'{product_1.category_slug}\n',
+            encoding='utf-8'
+        )
+        rejects = io.StringIO()
+        report = await import_products(
+            path, supplier_2.username, test_engine, rejects
+        )
+        assert (report.upserted, report.rejected) == (0, 1)
+        assert product_1.slug in rejects.getvalue()
+        await test_db_session.refresh(product_1)
+        assert product_1.price != 99
+        assert product_1.user_username == supplier_1.username
+
+    async def test_import_with_unknown_user(self, tmp_path: Path):
+        """Тест для проверки импорта от несуществующего пользователя."""
+        path = tmp_path / 'products.csv'
+        path.write_text(CSV_HEADER, encoding='utf-8')
+        with pytest.raises(ValueError):
+            await import_products(
+                path, 'not_found', test_engine, io.StringIO()
+            )
@@ -0,0 +1,174 @@
+"""Модуль создания тестов для фоновых задач."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from pytest_lazy_fixtures import lf
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.jobs import JobRunner
+from .database import test_async_session as session_maker
+
+
+@pytest.fixture
+def runner() -> JobRunner:
+    """Фикстура для создания раннера с маленькой очередью."""
+    return JobRunner(
+        session_maker,
+        queue_size=1,
+        workers=1,
+        max_attempts=3,
+        retry_delay=0
+    )
+
+
+class TestJobRunner:
+    """Класс для тестирования раннера фоновых задач."""
+
+    async def test_job_runs_inline_when_runner_is_stopped(
+        self,
+        runner: JobRunner
+    ):
+        """Тест для проверки выполнения задачи сразу без воркеров."""
+        calls = []
+
+        async def job(session: AsyncSession, value: int):
+            calls.append(value)
+
+        await runner.enqueue(job, 1)
+        assert calls == [1]
+        assert runner.get_metrics()['inline'] == 1
+
+    async def test_job_is_retried(self, runner: JobRunner):
+        """Тест для проверки повторного выполнения упавшей задачи."""
+        attempts = []
+
+        async def job(session: AsyncSession):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RuntimeError
+
+        await runner.start()
+        await runner.enqueue(job)
+        await runner.stop(timeout=1)
+        metrics = runner.get_metrics()
+        assert len(attempts) == 3
+        assert (metrics['retried'], metrics['completed']) == (2, 1)
+
+    async def test_inline_job_is_not_retried(self, runner: JobRunner):
+        """
+        Тест для проверки, что задача, выполненная сразу
+        без воркеров, не повторяется в вызывающей корутине.
+        """
+        attempts = []
+
+        async def job(session: AsyncSession):
+            attempts.append(1)
+            raise RuntimeError
+
+        runner.retry_delay = 60
+        await runner.enqueue(job)
+        metrics = runner.get_metrics()
+        assert len(attempts) == 1
+        assert (metrics['retried'], metrics['failed']) == (0, 1)
+
+    async def test_job_runs_inline_once_when_queue_is_full(
+        self,
+        runner: JobRunner
+    ):
+        """
+        Тест для проверки выполнения задачи сразу одной попыткой
+        при переполненной очереди.
+        """
+        release = asyncio.Event()
+        attempts = []
+
+        async def blocking_job(session: AsyncSession):
+            await release.wait()
+
+        async def failing_job(session: AsyncSession):
+            attempts.append(1)
+            raise RuntimeError
+
+        runner.retry_delay = 60
+        await runner.start()
+        await runner.enqueue(blocking_job)
+        await asyncio.sleep(0)
+        await runner.enqueue(blocking_job)
+        await runner.enqueue(failing_job)
+        assert len(attempts) == 1
+        metrics = runner.get_metrics()
+        assert (metrics['inline'], metrics['retried']) == (1, 0)
+        release.set()
+        await runner.stop(timeout=1)
+
+    async def test_stop_drains_queue(self, runner: JobRunner):
+        """Тест для проверки выполнения задач из очереди при остановке."""
+        calls = []
+
+        async def job(session: AsyncSession, value: int):
+            await asyncio.sleep(0.01)
+            calls.append(value)
+
+        await runner.start()
+        for value in range(3):
+            await runner.enqueue(job, value)
+        await runner.stop(timeout=1)
+        assert sorted(calls) == [0, 1, 2]
+        metrics = runner.get_metrics()
+        assert metrics['queue_depth'] == 0
+        assert metrics['workers'] == 0
+
+    async def test_periodic_job(self, runner: JobRunner):
+        """
+        Тест для проверки постановки периодической задачи в очередь,
+        пока раннер запущен.
+        """
+        calls = []
+
+        async def job(session: AsyncSession):
+            calls.append(1)
+
+        runner.schedule(job, 0.01)
+        await runner.start()
+        await asyncio.sleep(0.1)
+        await runner.stop(timeout=1)
+        count = len(calls)
+        assert count >= 2
+        await asyncio.sleep(0.05)
+        assert len(calls) == count
+
+
+class TestJobsAPI:
+    """Класс для тестирования API метрик фоновых задач."""
+
+    url = '/api/v1/admin/jobs/'
+
+    async def test_admin_can_get_jobs_metrics(self, admin_client: AsyncClient):
+        """Тест для проверки получения метрик задач администратором."""
+        response = await admin_client.get(self.url)
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert 'queue_depth' in response.json()
+
+    @pytest.mark.parametrize(
+        'parametrized_client, expected_status',
+        (
+            (lf('client'), HTTPStatus.UNAUTHORIZED),
+            (lf('customer_client'), HTTPStatus.FORBIDDEN),
+            (lf('supplier_1_client'), HTTPStatus.FORBIDDEN)
+        ),
+        ids=('anon_user', 'customer', 'supplier')
+    )
+    async def test_another_users_cant_get_jobs_metrics(
+        self,
+        parametrized_client: AsyncClient,
+        expected_status: int
+    ):
+        """
+        Тест для проверки невозможности получения
+        метрик задач другими пользователями.
+        """
+        response = await parametrized_client.get(self.url)
+        assert response.status_code == expected_status
@@ -0,0 +1,281 @@
+"""Модуль создания тестов для таблиц лидеров."""
+
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from pytest_lazy_fixtures import lf
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.leaderboards import (
+    LeaderboardRefresher,
+    get_bayesian_ratings,
+    leaderboard_cache
+)
+from app.crud import product_ranking_crud, rating_histogram_crud
+from app.models import (
+    Category,
+    LeaderboardState,
+    Product,
+    ProductRanking,
+    RatingHistogram,
+    Review
+)
+
+PRIOR_WEIGHT = 10
+
+
+def create_refresher() -> LeaderboardRefresher:
+    """Функция для создания задачи пересчета, как в новом процессе."""
+    return LeaderboardRefresher(
+        prior_weight=PRIOR_WEIGHT,
+        prior_tolerance=0.01,
+        trending_days=7,
+        batch_size=1
+    )
+
+
+@pytest.fixture
+def refresher() -> LeaderboardRefresher:
+    """Фикстура для создания задачи пересчета с пустым кэшем."""
+    leaderboard_cache.clear()
+    yield create_refresher()
+    leaderboard_cache.clear()
+
+
+@pytest.fixture
+async def reviews(
+    test_db_session: AsyncSession,
+    review_1: Review,
+    review_2: Review,
+    review_3: Review
+) -> list[Review]:
+    """Фикстура для создания отзывов и их гистограмм оценок."""
+    await rating_histogram_crud.rebuild(test_db_session)
+    return [review_1, review_2, review_3]
+
+
+def get_expected_rating(grades: list[int], prior_mean: float) -> float:
+    """Функция для вычисления ожидаемой байесовской оценки."""
+    return (
+        (sum(grades) + PRIOR_WEIGHT * prior_mean) /
+        (len(grades) + PRIOR_WEIGHT)
+    )
+
+
+class TestBayesianRatings:
+    """Класс для тестирования байесовской оценки."""
+
+    def test_many_reviews_outrank_single_top_grade(self):
+        """
+        Тест для проверки, что один отзыв 10 не обгоняет
+        тысячу отзывов 9.
+        """
+        counts = np.zeros((2, 10), dtype=np.int64)
+        counts[0, 9] = 1
+        counts[1, 8] = 1000
+        single, many = get_bayesian_ratings(counts, 5.5, PRIOR_WEIGHT)
+        assert many > single
+        assert single == pytest.approx(get_expected_rating([10], 5.5))
+
+
+class TestLeaderboardAPI:
+    """Класс для тестирования API таблиц лидеров."""
+
+    top_rated_url = '/api/v1/leaderboards/top-rated/'
+    trending_url = '/api/v1/leaderboards/trending/'
+    refresh_url = '/api/v1/admin/leaderboards/refresh/'
+
+    async def test_top_rated(
+        self,
+        client: AsyncClient,
+        test_db_session: AsyncSession,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review],
+        product_1: Product,
+        product_2: Product
+    ):
+        """Тест для проверки порядка и оценок продуктов за все время."""
+        report = await refresher.refresh(test_db_session)
+        assert report == {'ratings': 2, 'trending': 2}
+        prior_mean = (1 + 5 + 10) / 3
+        response = await client.get(self.top_rated_url)
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.headers['Cache-Control'].startswith('public')
+        assert response.json() == [
+            {
+                'product_slug': product_1.slug,
+                'name': product_1.name,
+                'rating': pytest.approx(
+                    get_expected_rating([1, 10], prior_mean)
+                ),
+                'reviews_count': 2
+            },
+            {
+                'product_slug': product_2.slug,
+                'name': product_2.name,
+                'rating': pytest.approx(get_expected_rating([5], prior_mean)),
+                'reviews_count': 1
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        'category, expected_count',
+        (
+            (lf('category_1'), 2),
+            (lf('parent_category'), 0)
+        ),
+        ids=('category', 'category_without_products')
+    )
+    async def test_top_rated_by_category(
+        self,
+        client: AsyncClient,
+        test_db_session: AsyncSession,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review],
+        category: Category,
+        expected_count: int
+    ):
+        """Тест для проверки таблицы лидеров категории."""
+        await refresher.refresh(test_db_session)
+        response = await client.get(
+            self.top_rated_url, params={'category_slug': category.slug}
+        )
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert len(response.json()) == expected_count
+
+    async def test_top_rated_by_nonexistent_category(
+        self,
+        client: AsyncClient,
+        refresher: LeaderboardRefresher
+    ):
+        """Тест для проверки ответа 404 для несуществующей категории."""
+        response = await client.get(
+            self.top_rated_url, params={'category_slug': 'nonexistent'}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    async def test_trending_excludes_old_reviews(
+        self,
+        client: AsyncClient,
+        test_db_session: AsyncSession,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review],
+        review_2: Review,
+        product_1: Product
+    ):
+        """
+        Тест для проверки, что в таблицу лидеров за период
+        попадают только продукты с отзывами за период.
+        """
+        await refresher.refresh(test_db_session)
+        assert len((await client.get(self.trending_url)).json()) == 2
+        await test_db_session.execute(
+            update(Review).
+            where(Review.id == review_2.id).
+            values(created_at=review_2.created_at - timedelta(days=8))
+        )
+        await test_db_session.commit()
+        await refresher.refresh(test_db_session)
+        response = await client.get(self.trending_url)
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert [
+            ranking['product_slug'] for ranking in response.json()
+        ] == [product_1.slug]
+        assert response.json()[0]['reviews_count'] == 2
+
+    async def test_refresh_is_incremental_and_clears_cache(
+        self,
+        client: AsyncClient,
+        customer_client: AsyncClient,
+        test_db_session: AsyncSession,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review],
+        product_2: Product
+    ):
+        """
+        Тест для проверки пересчета только измененных продуктов
+        новым процессом и отдачи закэшированной таблицы лидеров
+        до пересчета.
+        """
+        await test_db_session.execute(
+            update(RatingHistogram).
+            values(updated_at=datetime(2000, 1, 1))
+        )
+        await test_db_session.commit()
+        await refresher.refresh(test_db_session)
+        refresher = create_refresher()
+        refresher.prior_tolerance = 1
+        cached = (await client.get(self.top_rated_url)).json()
+        response = await customer_client.post(
+            f'/api/v1/products/{product_2.slug}/reviews/',
+            json={'text': 'текст', 'grade': 5}
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        assert (await client.get(self.top_rated_url)).json() == cached
+        report = await refresher.refresh(test_db_session)
+        assert report['ratings'] == 1
+        rankings = (await client.get(self.top_rated_url)).json()
+        assert rankings != cached
+        assert {
+            ranking['product_slug']: ranking['reviews_count']
+            for ranking in rankings
+        }[product_2.slug] == 2
+
+    async def test_refresh_is_skipped_when_locked(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        test_db_session: AsyncSession,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review]
+    ):
+        """
+        Тест для проверки пропуска пересчета, пока его выполняет
+        другой процесс.
+        """
+
+        async def try_lock(session: AsyncSession) -> bool:
+            return False
+
+        monkeypatch.setattr(product_ranking_crud, 'try_lock', try_lock)
+        assert await refresher.refresh(test_db_session) is None
+        for model in (ProductRanking, LeaderboardState):
+            assert await test_db_session.scalar(select(model.id)) is None
+
+    async def test_admin_can_refresh_leaderboards(
+        self,
+        admin_client: AsyncClient,
+        refresher: LeaderboardRefresher,
+        reviews: list[Review]
+    ):
+        """Тест для проверки пересчета рейтингов администратором."""
+        response = await admin_client.post(
+            self.refresh_url, params={'full': True}
+        )
+        assert response.status_code == HTTPStatus.ACCEPTED
+        response = await admin_client.get(self.top_rated_url)
+        assert len(response.json()) == 2
+
+    @pytest.mark.parametrize(
+        'parametrized_client, expected_status',
+        (
+            (lf('client'), HTTPStatus.UNAUTHORIZED),
+            (lf('customer_client'), HTTPStatus.FORBIDDEN),
+            (lf('supplier_1_client'), HTTPStatus.FORBIDDEN)
+        ),
+        ids=('anon_user', 'customer', 'supplier')
+    )
+    async def test_another_users_cant_refresh_leaderboards(
+        self,
+        parametrized_client: AsyncClient,
+        expected_status: int
+    ):
+        """
+        Тест для проверки невозможности пересчета
+        рейтингов другими пользователями.
+        """
+        response = await parametrized_client.post(self.refresh_url)
+        assert response.status_code == expected_status
@@ -0,0 +1,131 @@
+"""Модуль создания тестов для метрик Prometheus."""
+
+import os
+import subprocess
+import sys
+from http import HTTPStatus
+from pathlib import Path
+
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.models import Product, User
+from .fixtures.fixture_users import TEST_PASSWORD
+
+# Режим сбора метрик выбирается при импорте prometheus_client,
+# поэтому метрики воркера проверяются в отдельном процессе.
+MULTIPROCESS_SCRIPT = """
+import asyncio
+import sys
+
+from prometheus_client import generate_latest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.endpoints.metrics import get_registry
+from app.core.db import InstrumentedPool
+
+
+async def main():
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{sys.argv[1]}', poolclass=InstrumentedPool
+    )
+    async with engine.connect():
+        sys.stdout.write(generate_latest(get_registry()).decode())
+    await engine.dispose()
+
+
+asyncio.run(main())
+"""
+
+
+def get_sample(name: str, **labels) -> float:
+    """Функция для получения значения метрики или 0."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetricsAPI:
+    """Класс для тестирования метрик Prometheus."""
+
+    url = '/metrics'
+    products_url = '/api/v1/products/'
+    product_url = products_url + '{product_slug}/'
+
+    async def test_metrics_in_prometheus_format(self, client: AsyncClient):
+        """Тест для проверки формата метрик и метрик пула соединений."""
+        response = await client.get(self.url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'].startswith('text/plain')
+        for name in ('db_pool_size', 'db_pool_checked_out',
+                     'db_pool_overflow', 'http_request_duration_seconds'):
+            assert f'# TYPE {name} ' in response.text
+
+    async def test_request_metrics_by_route_template(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки метрик запросов и SQL-запросов
+        по шаблону маршрута, а не по фактическому пути.
+        """
+        labels = {'method': 'GET', 'route': self.product_url}
+        requests = get_sample(
+            'http_requests_total', status='200', **labels
+        )
+        not_found = get_sample(
+            'http_requests_total', status='404', **labels
+        )
+        statements = get_sample(
+            'db_statements_total', route=self.product_url
+        )
+        await client.get(self.product_url.format(product_slug=product_1.slug))
+        await client.get(self.product_url.format(product_slug='not-found'))
+        assert get_sample(
+            'http_requests_total', status='200', **labels
+        ) == requests + 1
+        assert get_sample(
+            'http_requests_total', status='404', **labels
+        ) == not_found + 1
+        assert get_sample(
+            'http_request_duration_seconds_count', **labels
+        ) >= 2
+        assert get_sample(
+            'db_statements_total', route=self.product_url
+        ) >= statements + 2
+
+    async def test_bcrypt_queue_time(
+        self,
+        client: AsyncClient,
+        customer: User
+    ):
+        """Тест для проверки учета времени ожидания bcrypt при входе."""
+        count = get_sample('bcrypt_queue_seconds_count')
+        response = await client.post(
+            '/api/v1/auth/login/',
+            data={'username': customer.username, 'password': TEST_PASSWORD}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert get_sample('bcrypt_queue_seconds_count') == count + 1
+
+    def test_pool_metrics_with_multiple_workers(self, tmp_path: Path):
+        """
+        Тест для проверки метрик пула соединений при сборе метрик
+        из файлов всех воркеров.
+        """
+        directory = tmp_path / 'prometheus'
+        directory.mkdir()
+        result = subprocess.run(
+            (sys.executable, '-c', MULTIPROCESS_SCRIPT,
+             str(tmp_path / 'test.db')),
+            env={**os.environ, 'PROMETHEUS_MULTIPROC_DIR': str(directory)},
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        samples = dict(
+            line.rsplit(' ', 1) for line in result.stdout.splitlines()
+            if line.startswith('db_pool_')
+        )
+        assert float(samples['db_pool_size']) == 5
+        assert float(samples['db_pool_checked_out']) == 1
+        assert float(samples['db_pool_overflow']) == 0
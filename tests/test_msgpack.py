@@ -0,0 +1,103 @@
+"""Модуль создания тестов для формата MessagePack."""
+
+from http import HTTPStatus
+from typing import Any
+
+import msgpack
+import pytest
+from httpx import AsyncClient
+
+from app.api.responses import negotiate_media_type
+from app.models import Product, Review
+
+MSGPACK_HEADERS = {
+    'Accept': 'application/msgpack',
+    'Content-Type': 'application/msgpack'
+}
+
+
+class TestMsgPackAPI:
+    """Класс для тестирования API в формате MessagePack."""
+
+    products_url = '/api/v1/products/'
+    product_url = products_url + '{slug}/'
+    review_url = product_url + 'reviews/{id}/'
+
+    @pytest.mark.parametrize('accept, media_type', [
+        ('application/msgpack', 'application/msgpack'),
+        ('application/x-msgpack, */*', 'application/msgpack'),
+        ('application/json, application/msgpack;q=0.5', 'application/json'),
+        ('application/msgpack;q=0', 'application/json'),
+        ('*/*', 'application/json'),
+        ('', 'application/json')
+    ])
+    def test_negotiate_media_type(self, accept: str, media_type: str):
+        """Тест для проверки выбора формата ответа."""
+        assert negotiate_media_type(accept) == media_type
+
+    @pytest.mark.parametrize('url', [
+        products_url,
+        product_url,
+        review_url,
+        '/api/v1/reviews/',
+        '/api/v1/categories/'
+    ])
+    async def test_read_endpoints_round_trip(
+        self,
+        client: AsyncClient,
+        url: str,
+        product_1: Product,
+        review_1: Review
+    ):
+        """Тест для проверки совпадения ответов MessagePack и JSON."""
+        url = url.format(slug=product_1.slug, id=review_1.id)
+        json_response = await client.get(url)
+        response = await client.get(
+            url, headers={'Accept': 'application/msgpack'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'] == 'application/msgpack'
+        assert response.headers['vary'] == 'Accept'
+        assert msgpack.unpackb(response.content) == json_response.json()
+
+    async def test_create_product_from_msgpack_body(
+        self,
+        supplier_1_client: AsyncClient,
+        product_request_data: dict[str, Any],
+        product_response_data: dict[str, Any]
+    ):
+        """Тест для проверки создания продукта из тела MessagePack."""
+        response = await supplier_1_client.post(
+            self.products_url,
+            content=msgpack.packb(product_request_data),
+            headers=MSGPACK_HEADERS
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        data = msgpack.unpackb(response.content)
+        assert data.items() >= product_response_data.items()
+
+    async def test_update_review_from_msgpack_body(
+        self,
+        customer_client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки изменения отзыва из тела MessagePack."""
+        response = await customer_client.patch(
+            self.review_url.format(
+                slug=review_1.product_slug, id=review_1.id
+            ),
+            content=msgpack.packb({'text': 'новый текст', 'grade': 3}),
+            headers={'Content-Type': 'application/msgpack'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json()['text'] == 'новый текст'
+
+    async def test_invalid_msgpack_body(self, supplier_1_client: AsyncClient):
+        """Тест для проверки ошибки 400 при невалидном теле MessagePack."""
+        response = await supplier_1_client.post(
+            self.products_url,
+            content=b'\xc1',
+            headers=MSGPACK_HEADERS
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -7,11 +7,18 @@ from typing import Any
 import pytest
 from httpx import AsyncClient
 from pytest_lazy_fixtures import lf
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Product, Review, User
-from .utils import check_db_data, check_db_fields, check_json_data
+from .database import test_engine
+from .utils import (
+    assert_num_queries,
+    capture_queries,
+    check_db_data,
+    check_db_fields,
+    check_json_data
+)
 
 
 class TestProductAPI:
@@ -25,16 +32,79 @@ class TestProductAPI:
         response = await client.get(self.list_url)
         assert response.status_code == HTTPStatus.OK
 
-    async def test_anon_user_can_get_product(
+    async def test_products_list_serialized_by_schema(
         self,
         client: AsyncClient,
         product_1: Product,
         product_fields: tuple[str, ...]
     ):
-        """Тест для проверки получения продукта анонимным пользователем."""
+        """Тест для проверки данных продуктов в списке."""
+        with assert_num_queries(3):
+            response = await client.get(self.list_url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'] == 'application/json'
+        data = response.json()
+        assert len(data) == 1
+        assert data[0].keys() == {*product_fields, 'version'}
+        assert data[0]['slug'] == product_1.slug
+
+    @pytest.mark.parametrize('url', (list_url, detail_url))
+    async def test_products_sparse_fields(
+        self,
+        client: AsyncClient,
+        url: str,
+        product_1: Product
+    ):
+        """
+        Тест для проверки, что с параметром fields в ответе и в SELECT
+        есть только запрошенные поля, а рейтинг не вычисляется.
+        """
+        with capture_queries(test_engine) as queries:
+            response = await client.get(
+                url.format(slug=product_1.slug),
+                params={'fields': 'price,slug,name'}
+            )
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        data = data[0] if isinstance(data, list) else data
+        assert list(data) == ['name', 'slug', 'price']
+        assert data['slug'] == product_1.slug
+        assert len(queries) == 1
+        assert 'description' not in queries[0]
+        assert 'avg' not in queries[0].lower()
+
+    async def test_products_sparse_fields_with_rating(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """Тест для проверки получения рейтинга в списке полей."""
         response = await client.get(
-            self.detail_url.format(slug=product_1.slug)
+            self.list_url, params={'fields': 'slug,rating'}
         )
+        assert response.json() == [{'slug': product_1.slug, 'rating': 0}]
+
+    @pytest.mark.parametrize('fields', ('slug,unknown', ',', ''))
+    async def test_products_unknown_fields(
+        self,
+        client: AsyncClient,
+        fields: str
+    ):
+        """Тест для проверки ошибки 400 при неизвестных полях."""
+        response = await client.get(self.list_url, params={'fields': fields})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    async def test_anon_user_can_get_product(
+        self,
+        client: AsyncClient,
+        product_1: Product,
+        product_fields: tuple[str, ...]
+    ):
+        """Тест для проверки получения продукта анонимным пользователем."""
+        with assert_num_queries(3):
+            response = await client.get(
+                self.detail_url.format(slug=product_1.slug)
+            )
         assert response.status_code == HTTPStatus.OK
         expected_data = {f: getattr(product_1, f) for f in product_fields}
         check_json_data(response, expected_data)
@@ -119,14 +189,90 @@ class TestProductAPI:
         Тест для проверки изменения продукта
         поставщиком или администратором.
         """
-        response = await parametrized_client.patch(
-            self.detail_url.format(slug=product_1.slug),
-            json=product_request_data
-        )
+        with assert_num_queries(6):
+            response = await parametrized_client.patch(
+                self.detail_url.format(slug=product_1.slug),
+                json=product_request_data
+            )
         assert response.status_code == HTTPStatus.OK
         check_json_data(response, product_response_data)
         check_db_data(response, product_response_data, product_1)
 
+    async def test_get_product_returns_etag(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """Тест для проверки наличия ETag с версией продукта."""
+        response = await client.get(
+            self.detail_url.format(slug=product_1.slug)
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['ETag'] == f'"{product_1.version}"'
+        assert response.json()['version'] == product_1.version
+
+    async def test_patch_product_with_if_match(
+        self,
+        supplier_1_client: AsyncClient,
+        product_1: Product
+    ):
+        """Тест для проверки изменения продукта с актуальной версией."""
+        response = await supplier_1_client.patch(
+            self.detail_url.format(slug=product_1.slug),
+            json={'name': product_1.name, 'stock': 5},
+            headers={'If-Match': f'"{product_1.version}"'}
+        )
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.json()['version'] == 2
+        assert response.headers['ETag'] == '"2"'
+        assert product_1.stock == 5
+
+    async def test_patch_product_with_outdated_if_match(
+        self,
+        supplier_1_client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки ошибки 412 при изменении
+        продукта с устаревшей версией.
+        """
+        stock = product_1.stock
+        response = await supplier_1_client.patch(
+            self.detail_url.format(slug=product_1.slug),
+            json={'name': product_1.name, 'stock': 5},
+            headers={'If-Match': '2'}
+        )
+        assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+        assert product_1.stock == stock
+
+    async def test_patch_product_changed_concurrently(
+        self,
+        supplier_1_client: AsyncClient,
+        test_db_session: AsyncSession,
+        product_1: Product
+    ):
+        """
+        Тест для проверки ошибки 412, если продукт изменили
+        между его получением и сохранением.
+        """
+        product_id, version = product_1.id, product_1.version
+        await test_db_session.execute(
+            update(Product.__table__).
+            where(Product.id == product_id).
+            values(version=Product.version + 1)
+        )
+        await test_db_session.commit()
+        response = await supplier_1_client.patch(
+            self.detail_url.format(slug=product_1.slug),
+            json={'name': product_1.name, 'stock': 5},
+            headers={'If-Match': f'"{version}"'}
+        )
+        assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+        stock = await test_db_session.scalar(
+            select(Product.stock).where(Product.id == product_id)
+        )
+        assert stock == 1
+
     async def test_product_not_found_for_patching(
         self,
         supplier_1_client: AsyncClient,
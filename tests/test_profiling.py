@@ -0,0 +1,136 @@
+"""Модуль создания тестов для профилирования запросов."""
+
+import os
+import time
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from pytest_lazy_fixtures import lf
+
+from app.core.profiling import SamplingProfiler, get_category
+from app.models import Product
+
+
+def busy_loop(seconds: float) -> None:
+    """Функция для загрузки процессора на заданное время."""
+    finish = time.perf_counter() + seconds
+    while time.perf_counter() < finish:
+        pass
+
+
+class TestSamplingProfiler:
+    """Класс для тестирования сэмплирующего профилировщика."""
+
+    def test_collapsed_stacks(self):
+        """Тест для проверки свернутого формата профиля."""
+        with SamplingProfiler(interval=0.001) as profiler:
+            busy_loop(0.1)
+        collapsed = profiler.get_collapsed()
+        assert 'busy_loop (' in collapsed
+        stack, count = collapsed.splitlines()[0].rsplit(' ', 1)
+        assert ';' in stack and int(count) >= 1
+        assert sum(profiler.get_breakdown().values()) == pytest.approx(
+            profiler.duration
+        )
+
+    @pytest.mark.parametrize(
+        'filenames, expected_category',
+        (
+            (['pydantic/main.py', 'app/api/responses.py'], 'serialization'),
+            (['sqlalchemy/engine/result.py', 'sqlalchemy/orm/loading.py'],
+             'orm_hydration'),
+            (['asyncpg/connection.py', 'sqlalchemy/engine/base.py'], 'sql'),
+            (['selectors.py', 'asyncio/base_events.py'], 'wait'),
+            (['app/main.py'], 'other')
+        )
+    )
+    def test_sample_category(self, filenames, expected_category):
+        """Тест для проверки категории снимка стека."""
+        filenames = [
+            os.sep + filename.replace('/', os.sep) for filename in filenames
+        ]
+        assert get_category(filenames) == expected_category
+
+
+class TestProfilingAPI:
+    """Класс для тестирования профилирования запроса по заголовку."""
+
+    product_url = '/api/v1/products/{product_slug}/'
+    profiles_url = '/api/v1/admin/profiles/'
+
+    async def test_admin_can_profile_request(
+        self,
+        admin_client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки профилирования запроса администратора
+        и получения сохраненного профиля.
+        """
+        url = self.product_url.format(product_slug=product_1.slug)
+        response = await admin_client.get(url)
+        assert 'x-profile-id' not in response.headers
+        response = await admin_client.get(url, headers={'X-Profile': '1'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['slug'] == product_1.slug
+        profile_id = response.headers['x-profile-id']
+        assert 'x-profile-breakdown' in response.headers
+        profiles = (await admin_client.get(self.profiles_url)).json()
+        assert profiles[0]['id'] == profile_id
+        assert profiles[0]['path'] == self.product_url
+        response = await admin_client.get(
+            self.profiles_url + 'collapsed/',
+            params={'profile_id': profile_id}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'].startswith('text/plain')
+        response = await admin_client.get(
+            self.profiles_url + 'collapsed/',
+            params={'profile_id': 'not-found'}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    @pytest.mark.parametrize(
+        'parametrized_client, expected_status',
+        (
+            (lf('client'), HTTPStatus.UNAUTHORIZED),
+            (lf('customer_client'), HTTPStatus.FORBIDDEN),
+            (lf('supplier_1_client'), HTTPStatus.FORBIDDEN)
+        ),
+        ids=('anon_user', 'customer', 'supplier')
+    )
+    async def test_another_users_cant_profile_request(
+        self,
+        parametrized_client: AsyncClient,
+        expected_status: int,
+        product_1: Product
+    ):
+        """
+        Тест для проверки невозможности профилирования
+        запроса другими пользователями.
+        """
+        response = await parametrized_client.get(
+            self.product_url.format(product_slug=product_1.slug),
+            headers={'X-Profile': '1'}
+        )
+        assert response.status_code == expected_status
+        assert 'x-profile-id' not in response.headers
+
+    @pytest.mark.parametrize('value', ('0', ''), ids=('zero', 'empty'))
+    async def test_request_is_not_profiled_without_enabled_header(
+        self,
+        client: AsyncClient,
+        value: str,
+        product_1: Product
+    ):
+        """
+        Тест для проверки, что заголовок X-Profile со значением
+        кроме 1 не включает профилирование и проверку прав.
+        """
+        response = await client.get(
+            self.product_url.format(product_slug=product_1.slug),
+            headers={'X-Profile': value}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert 'x-profile-id' not in response.headers
@@ -0,0 +1,65 @@
+"""Модуль создания тестов для контроля количества SQL-запросов."""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.instrumentation import fingerprint
+from app.middlewares import QueryBudgetMiddleware
+from .database import test_engine
+from .utils import assert_num_queries
+
+
+async def n_plus_one(request):
+    """Эндпоинт, выполняющий N+1 запросов."""
+    async with test_engine.connect() as conn:
+        await conn.execute(text('SELECT count(*) FROM users'))
+        for number in range(3):
+            await conn.execute(text('SELECT :number'), {'number': number})
+    return PlainTextResponse('ok')
+
+
+app = QueryBudgetMiddleware(
+    Starlette(routes=[Route('/n-plus-one', n_plus_one)]),
+    budget=2
+)
+
+
+class TestQueryBudget:
+    """Класс для тестирования контроля количества SQL-запросов."""
+
+    @pytest.mark.parametrize('statement, expected', [
+        ('SELECT a FROM t WHERE t.id IN ($1::INTEGER, $2::INTEGER)',
+         'SELECT a FROM t WHERE t.id IN (...)'),
+        ("SELECT a\n FROM t WHERE t.b = 'x' AND t.c = 10 LIMIT ?",
+         'SELECT a FROM t WHERE t.b = ? AND t.c = ? LIMIT ?'),
+        ('SELECT t1.a FROM t1 WHERE t1.a IN (?, ?, ?)',
+         'SELECT t1.a FROM t1 WHERE t1.a IN (...)')
+    ])
+    def test_fingerprint(self, statement: str, expected: str):
+        """Тест для проверки отпечатков SQL-запросов."""
+        assert fingerprint(statement) == expected
+
+    async def test_budget_exceeded_warning(
+        self,
+        caplog: pytest.LogCaptureFixture
+    ):
+        """
+        Тест для проверки предупреждения с повторяющимися
+        запросами при превышении бюджета.
+        """
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url='http://test'
+        ) as client:
+            with caplog.at_level(logging.WARNING), assert_num_queries(4):
+                await client.get('/n-plus-one')
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert 'выполнил 4 SQL-запросов при бюджете 2' in message
+        assert '3 x SELECT ?' in message
@@ -0,0 +1,173 @@
+"""Модуль создания тестов для гистограммы оценок продукта."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from pytest_lazy_fixtures import lf
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import REVIEW_GRADES
+from app.crud import rating_histogram_crud
+from app.models import Product, Review
+from .utils import assert_num_queries
+
+
+def get_expected_grades(**counts: int) -> dict[str, int]:
+    """Функция для получения ожидаемых счетчиков в ответе."""
+    return {
+        str(grade): counts.get(f'grade_{grade}', 0) for grade in REVIEW_GRADES
+    }
+
+
+class TestRatingHistogramAPI:
+    """Класс для тестирования API гистограммы оценок."""
+
+    url = '/api/v1/products/{slug}/rating-histogram/'
+    reviews_url = '/api/v1/products/{slug}/reviews/'
+    rebuild_url = '/api/v1/admin/rating-histograms/rebuild/'
+
+    async def get_grades(self, client: AsyncClient, slug: str) -> dict:
+        """Метод для получения счетчиков гистограммы продукта."""
+        response = await client.get(self.url.format(slug=slug))
+        assert response.status_code == HTTPStatus.OK, response.json()
+        return response.json()['grades']
+
+    async def test_anon_user_can_get_rating_histogram(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки получения нулевой гистограммы продукта
+        без отзывов одним SQL-запросом.
+        """
+        with assert_num_queries(1):
+            response = await client.get(self.url.format(slug=product_1.slug))
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.json() == {
+            'product_slug': product_1.slug,
+            'grades': get_expected_grades(),
+            'total': 0
+        }
+
+    async def test_rating_histogram_of_nonexistent_product(
+        self,
+        client: AsyncClient
+    ):
+        """Тест для проверки ответа 404 для несуществующего продукта."""
+        response = await client.get(self.url.format(slug='nonexistent'))
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    async def test_review_changes_update_rating_histogram(
+        self,
+        client: AsyncClient,
+        customer_client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки изменения гистограммы при создании,
+        изменении оценки и удалении отзыва.
+        """
+        response = await customer_client.post(
+            self.reviews_url.format(slug=product_1.slug),
+            json={'text': 'текст', 'grade': 7}
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        detail_url = (
+            self.reviews_url.format(slug=product_1.slug) +
+            f'{response.json()["id"]}/'
+        )
+        assert await self.get_grades(client, product_1.slug) == (
+            get_expected_grades(grade_7=1)
+        )
+        response = await customer_client.patch(detail_url, json={'grade': 3})
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert await self.get_grades(client, product_1.slug) == (
+            get_expected_grades(grade_3=1)
+        )
+        response = await customer_client.delete(detail_url)
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert await self.get_grades(client, product_1.slug) == (
+            get_expected_grades()
+        )
+
+    async def test_user_deletion_updates_rating_histogram(
+        self,
+        client: AsyncClient,
+        customer_client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки вычитания отзывов удаленного
+        пользователя из гистограммы.
+        """
+        response = await customer_client.post(
+            self.reviews_url.format(slug=product_1.slug),
+            json={'text': 'текст', 'grade': 9}
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        response = await customer_client.delete('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert await self.get_grades(client, product_1.slug) == (
+            get_expected_grades()
+        )
+
+    async def test_rebuild_matches_reviews(
+        self,
+        client: AsyncClient,
+        test_db_session: AsyncSession,
+        review_1: Review,
+        review_2: Review,
+        review_3: Review
+    ):
+        """
+        Тест для проверки пересчета гистограмм по отзывам,
+        загруженным в обход CRUD.
+        """
+        assert await rating_histogram_crud.rebuild(test_db_session) == 2
+        reviews = await test_db_session.execute(
+            select(Review.product_slug, Review.grade, func.count()).
+            group_by(Review.product_slug, Review.grade)
+        )
+        expected = {}
+        for slug, grade, count in reviews:
+            expected.setdefault(slug, get_expected_grades())[str(grade)] = (
+                count
+            )
+        for slug, grades in expected.items():
+            assert await self.get_grades(client, slug) == grades
+
+    async def test_admin_can_rebuild_rating_histograms(
+        self,
+        admin_client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки пересчета гистограмм администратором."""
+        response = await admin_client.post(self.rebuild_url)
+        assert response.status_code == HTTPStatus.ACCEPTED
+        assert await self.get_grades(admin_client, review_1.product_slug) == (
+            get_expected_grades(grade_1=1)
+        )
+
+    @pytest.mark.parametrize(
+        'parametrized_client, expected_status',
+        (
+            (lf('client'), HTTPStatus.UNAUTHORIZED),
+            (lf('customer_client'), HTTPStatus.FORBIDDEN),
+            (lf('supplier_1_client'), HTTPStatus.FORBIDDEN)
+        ),
+        ids=('anon_user', 'customer', 'supplier')
+    )
+    async def test_another_users_cant_rebuild_rating_histograms(
+        self,
+        parametrized_client: AsyncClient,
+        expected_status: int
+    ):
+        """
+        Тест для проверки невозможности пересчета
+        гистограмм другими пользователями.
+        """
+        response = await parametrized_client.post(self.rebuild_url)
+        assert response.status_code == expected_status
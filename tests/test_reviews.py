@@ -9,8 +9,14 @@ from pytest_lazy_fixtures import lf
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Product, Review, User
-from .utils import check_db_data, check_db_fields, check_json_data
+from app.crud import rating_histogram_crud
+from app.models import Product, RatingHistogram, Review, User
+from .utils import (
+    assert_num_queries,
+    check_db_data,
+    check_db_fields,
+    check_json_data
+)
 
 
 class TestReviewAPI:
@@ -30,21 +36,74 @@ class TestReviewAPI:
         review_1: Review,
         review_fields: tuple[str, ...]
     ):
-        """Тест для проверки получения отзыва анонимным пользователем."""
-        response = await client.get(
-            self.detail_url.format(slug=review_1.product.slug, id=review_1.id)
-        )
+        """
+        Тест для проверки получения отзыва анонимным пользователем
+        одним SQL-запросом вместе с проверкой продукта.
+        """
+        with assert_num_queries(1):
+            response = await client.get(
+                self.detail_url.format(
+                    slug=review_1.product.slug, id=review_1.id
+                )
+            )
         assert response.status_code == HTTPStatus.OK, response.json()
         expected_data = {f: getattr(review_1, f) for f in review_fields}
         check_json_data(response, expected_data)
 
-    async def test_review_not_found_for_getting(self, client: AsyncClient):
+    async def test_reviews_sparse_fields(
+        self,
+        client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки получения только запрошенных полей отзывов."""
+        response = await client.get(
+            'api/v1/reviews/', params={'fields': 'grade,id'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == [{'id': review_1.id, 'grade': 1}]
+
+    @pytest.mark.parametrize(
+        'product_slug, review_id, expected_detail',
+        (
+            ('product', lf('review_1.id'), 'Такого продукта не существует.'),
+            (lf('product_1.slug'), 0, 'Такого отзыва не существует.'),
+            (lf('product_1.slug'), lf('review_2.id'),
+             'Такого отзыва не существует.')
+        ),
+        ids=(
+            'product_not_found', 'review_not_found', 'review_of_other_product'
+        )
+    )
+    async def test_review_not_found_for_getting(
+        self,
+        client: AsyncClient,
+        product_slug: str,
+        review_id: int,
+        expected_detail: str
+    ):
         """
-        Тест для проверки наличия ошибки 404
-        при получении несуществующего отзыва.
+        Тест для проверки наличия ошибки 404 при получении
+        несуществующего отзыва или отзыва другого продукта.
         """
         response = await client.get(
-            self.detail_url.format(slug='product', id=1)
+            self.detail_url.format(slug=product_slug, id=review_id)
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.json()['detail'] == expected_detail
+
+    async def test_cant_patch_review_of_other_product(
+        self,
+        admin_client: AsyncClient,
+        product_1: Product,
+        review_2: Review
+    ):
+        """
+        Тест для проверки невозможности изменить отзыв
+        по адресу другого продукта.
+        """
+        response = await admin_client.patch(
+            self.detail_url.format(slug=product_1.slug, id=review_2.id),
+            json={'grade': 3}
         )
         assert response.status_code == HTTPStatus.NOT_FOUND
 
@@ -203,6 +262,60 @@ class TestReviewAPI:
         check_json_data(response, data)
         check_db_data(response, data, review)
 
+    async def test_get_review_returns_etag(
+        self,
+        client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки наличия ETag с версией отзыва."""
+        response = await client.get(
+            self.detail_url.format(slug=review_1.product_slug, id=review_1.id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['ETag'] == f'"{review_1.version}"'
+
+    async def test_patch_review_with_if_match(
+        self,
+        customer_client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки изменения отзыва с актуальной версией."""
+        response = await customer_client.patch(
+            self.detail_url.format(slug=review_1.product_slug, id=review_1.id),
+            json={'grade': 3},
+            headers={'If-Match': f'"{review_1.version}"'}
+        )
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.headers['ETag'] == '"2"'
+        assert review_1.grade == 3
+
+    async def test_patch_review_with_outdated_if_match(
+        self,
+        customer_client: AsyncClient,
+        test_db_session: AsyncSession,
+        review_1: Review
+    ):
+        """
+        Тест для проверки ошибки 412 при изменении отзыва
+        с устаревшей версией без изменения гистограммы оценок.
+        """
+        await rating_histogram_crud.rebuild(test_db_session)
+        histogram_query = (
+            select(RatingHistogram.grade_1, RatingHistogram.grade_3).
+            where(RatingHistogram.product_slug == review_1.product_slug)
+        )
+        histogram = (await test_db_session.execute(histogram_query)).one()
+        response = await customer_client.patch(
+            self.detail_url.format(slug=review_1.product_slug, id=review_1.id),
+            json={'grade': 3},
+            headers={'If-Match': '2'}
+        )
+        assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+        assert review_1.grade == 1
+        assert (
+            await test_db_session.execute(histogram_query)
+        ).one() == histogram
+
     async def test_anon_user_cant_patch_review(
         self,
         client: AsyncClient,
@@ -317,6 +430,106 @@ class TestReviewAPI:
         assert count == 1
 
 
+class TestProductReviewsPagination:
+    """Класс для тестирования постраничной выдачи отзывов продукта."""
+
+    url = '/api/v1/products/{slug}/reviews/'
+    grades = (3, 7, 7, 1, 9)
+
+    @pytest.fixture
+    async def reviews(
+        self,
+        test_db_session: AsyncSession,
+        product_1: Product,
+        customer: User
+    ) -> list[Review]:
+        """Фикстура для создания отзывов продукта с одним временем."""
+        reviews = [
+            Review(
+                grade=grade,
+                user_username=customer.username,
+                product_slug=product_1.slug
+            )
+            for grade in self.grades
+        ]
+        test_db_session.add_all(reviews)
+        await test_db_session.commit()
+        return reviews
+
+    @pytest.mark.parametrize(
+        'sort, sort_key',
+        (
+            ('newest', lambda review: (review.created_at, review.id)),
+            ('highest', lambda review: (review.grade, review.id)),
+            ('lowest', lambda review: (-review.grade, -review.id))
+        )
+    )
+    async def test_pages_follow_sort_order(
+        self,
+        client: AsyncClient,
+        product_1: Product,
+        reviews: list[Review],
+        sort: str,
+        sort_key
+    ):
+        """
+        Тест для проверки, что страницы по ссылкам Link содержат
+        все отзывы без повторов в порядке сортировки и каждая
+        страница загружается одним SQL-запросом.
+        """
+        url = self.url.format(slug=product_1.slug)
+        params = {'sort': sort, 'limit': 2}
+        ids = []
+        while url and len(ids) <= len(reviews):
+            with assert_num_queries(1):
+                response = await client.get(url, params=params)
+            assert response.status_code == HTTPStatus.OK
+            ids.extend(review['id'] for review in response.json())
+            url = response.links.get('next', {}).get('url')
+            params = None
+        expected = sorted(reviews, key=sort_key, reverse=True)
+        assert ids == [review.id for review in expected]
+
+    async def test_empty_and_missing_product(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """
+        Тест для проверки пустой страницы у продукта без отзывов
+        и ошибки 404 для несуществующего продукта.
+        """
+        response = await client.get(self.url.format(slug=product_1.slug))
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == []
+        assert 'link' not in response.headers
+        response = await client.get(self.url.format(slug='product'))
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    @pytest.mark.parametrize(
+        'params',
+        (
+            {'cursor': 'invalid'},
+            {'sort': 'oldest'},
+            {'limit': 0}
+        ),
+        ids=('cursor', 'sort', 'limit')
+    )
+    async def test_invalid_params(
+        self,
+        client: AsyncClient,
+        product_1: Product,
+        params: dict
+    ):
+        """Тест для проверки ошибки при невалидных параметрах."""
+        response = await client.get(
+            self.url.format(slug=product_1.slug), params=params
+        )
+        assert response.status_code in (
+            HTTPStatus.BAD_REQUEST, HTTPStatus.UNPROCESSABLE_ENTITY
+        )
+
+
 class TestReviewModel:
     """Класс для тестирования модели отзыва."""
 
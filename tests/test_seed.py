@@ -0,0 +1,99 @@
+"""Модуль создания тестов для генерации синтетического каталога."""
+
+from http import HTTPStatus
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cli import seed
+from app.models import Category, Product, RatingHistogram, Review, User
+from .database import test_engine
+
+PLAN = {
+    'customers': 200,
+    'suppliers': 10,
+    'root_categories': 3,
+    'depth': 3,
+    'max_fanout': 4,
+    'products': 300,
+    'reviews': 3000,
+    'passwords': 2,
+    'batch_size': 100,
+    'seed': 7
+}
+
+
+def generate(plan: seed.SeedPlan) -> dict[str, list[tuple]]:
+    """Функция для генерации всех пачек каталога без загрузки в БД."""
+    layout = seed.SeedLayout(plan, ['hash-0', 'hash-1'])
+    seed.init_worker(layout)
+    return {
+        'users': [
+            record for batch in layout.get_user_batches()
+            for record in seed.generate_users(batch)
+        ],
+        'products': [
+            record for batch in layout.get_product_batches()
+            for record in seed.generate_products(batch)
+        ],
+        'reviews': [
+            record for batch in layout.get_review_batches()
+            for record in seed.generate_reviews(batch)
+        ]
+    }
+
+
+class TestSeed:
+    """Класс для тестирования генерации синтетического каталога."""
+
+    def test_generation_is_deterministic(self):
+        """Тест для проверки повторяемости генерации при одном seed."""
+        data = generate(seed.SeedPlan(**PLAN))
+        assert data == generate(seed.SeedPlan(**PLAN))
+        assert data != generate(seed.SeedPlan(**{**PLAN, 'seed': 8}))
+
+    def test_reviews_are_skewed_and_unique(self):
+        """
+        Тест для проверки распределения отзывов по популярности
+        и уникальности пары пользователь-продукт.
+        """
+        counts = seed.get_review_counts(1000, 50_000, 0.8, 500)
+        assert sum(counts) == 50_000
+        assert counts == sorted(counts, reverse=True)
+        assert sum(counts[:100]) > sum(counts[100:]) / 2
+        reviews = generate(seed.SeedPlan(**PLAN))['reviews']
+        assert len(reviews) == PLAN['reviews']
+        pairs = {(username, slug) for _, _, username, slug in reviews}
+        assert len(pairs) == len(reviews)
+
+    async def test_seed_catalog(
+        self,
+        client: AsyncClient,
+        test_db_session: AsyncSession
+    ):
+        """
+        Тест для проверки загрузки каталога в БД и входа
+        пользователя с паролем из набора заранее вычисленных хэшей.
+        """
+        plan = seed.SeedPlan(**PLAN)
+        report = await seed.seed_catalog(test_engine, plan, processes=0)
+        for model, rows in (
+            (User, PLAN['customers'] + PLAN['suppliers']),
+            (Category, report.rows['categories']),
+            (Product, PLAN['products']),
+            (Review, PLAN['reviews']),
+            (RatingHistogram, PLAN['products'])
+        ):
+            assert await test_db_session.scalar(
+                select(func.count()).select_from(model)
+            ) == rows == report.rows[model.__tablename__]
+        assert report.rows['categories'] > PLAN['root_categories']
+        response = await client.post(
+            '/api/v1/auth/login/',
+            data={
+                'username': 'customer-3',
+                'password': seed.get_password(3, plan.passwords)
+            }
+        )
+        assert response.status_code == HTTPStatus.CREATED
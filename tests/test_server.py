@@ -0,0 +1,46 @@
+"""Модуль создания тестов для настроек production-сервера."""
+
+import os
+
+import pytest
+
+from app.core.config import settings
+from app.server import ProductionWorker, get_options
+
+
+class TestServerOptions:
+    """Класс для тестирования настроек gunicorn."""
+
+    def test_worker_options(self):
+        """
+        Тест для проверки предзагрузки приложения, цикла событий
+        воркера и перезапуска воркеров со случайным разбросом.
+        """
+        options = get_options()
+        assert options['preload_app'] is True
+        assert options['worker_class'] is ProductionWorker
+        assert ProductionWorker.CONFIG_KWARGS['loop'] == 'uvloop'
+        assert ProductionWorker.CONFIG_KWARGS['http'] == 'httptools'
+        assert options['max_requests'] == settings.SERVER_MAX_REQUESTS
+        assert options['max_requests_jitter'] > 0
+        assert options['bind'] == (
+            f'{settings.SERVER_HOST}:{settings.SERVER_PORT}'
+        )
+
+    @pytest.mark.parametrize(
+        'server_workers, expected_workers',
+        (
+            (3, 3),
+            (0, len(os.sched_getaffinity(0)))
+        ),
+        ids=('from_settings', 'from_cpu_affinity')
+    )
+    def test_workers_count(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        server_workers: int,
+        expected_workers: int
+    ):
+        """Тест для проверки числа воркеров."""
+        monkeypatch.setattr(settings, 'SERVER_WORKERS', server_workers)
+        assert get_options()['workers'] == expected_workers
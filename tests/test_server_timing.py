@@ -0,0 +1,70 @@
+"""Модуль создания тестов для заголовка Server-Timing."""
+
+from http import HTTPStatus
+
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.instrumentation import RequestStats, measure, request_stats
+from app.core.security import create_access_token
+from app.models import Product, User
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    """Функция для разбора заголовка Server-Timing."""
+    metrics = {}
+    for metric in header.split(', '):
+        name, duration, *_ = metric.split(';')
+        metrics[name] = float(duration.removeprefix('dur='))
+    return metrics
+
+
+class TestServerTiming:
+    """Класс для тестирования заголовка Server-Timing."""
+
+    async def test_auth_and_permission_stages(
+        self,
+        client: AsyncClient,
+        admin: User
+    ):
+        """
+        Тест для проверки времени проверки токена, загрузки
+        пользователя и разрешения в заголовке.
+        """
+        token = create_access_token(admin.username, settings.TOKEN_EXPIRE)
+        response = await client.get(
+            '/api/v1/admin/jobs/',
+            headers={'Authorization': f'Bearer {token}'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        metrics = parse_server_timing(response.headers['server-timing'])
+        assert {'jwt', 'user', 'permission', 'db', 'total'} <= set(metrics)
+        assert metrics['total'] >= metrics['jwt'] + metrics['user']
+
+    async def test_serialization_and_db_stages(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """Тест для проверки времени SQL-запросов и сериализации."""
+        response = await client.get(f'/api/v1/products/{product_1.slug}/')
+        header = response.headers['server-timing']
+        assert 'desc="3 queries"' in header
+        assert {'serialization', 'db', 'total'} <= set(
+            parse_server_timing(header)
+        )
+
+    def test_measure_without_server_timing(self):
+        """Тест для проверки, что этапы не замеряются без Server-Timing."""
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        try:
+            with measure('jwt'):
+                pass
+            assert stats.timings is None
+            stats.timings = {}
+            with measure('jwt'):
+                pass
+            assert set(stats.timings) == {'jwt'}
+        finally:
+            request_stats.reset(token)
@@ -0,0 +1,123 @@
+"""Модуль создания тестов для похожих продуктов."""
+
+import math
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from scipy import sparse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cli import similar_products
+from app.models import Product, Review, User
+from .database import test_engine
+from .utils import assert_num_queries, create_db_obj
+
+
+@pytest.fixture
+async def co_review(
+    test_db_session: AsyncSession,
+    product_2: Product,
+    customer: User
+) -> Review:
+    """Фикстура для создания отзыва покупателя на второй продукт."""
+    review = Review(
+        grade=4,
+        text='нормальный товар',
+        user_username=customer.username,
+        product_slug=product_2.slug
+    )
+    return await create_db_obj(test_db_session, review)
+
+
+class TestSimilarity:
+    """Класс для тестирования расчета близости продуктов."""
+
+    @pytest.mark.parametrize('chunk_size', (1, 7, 100))
+    def test_neighbours_match_dense_cosine(self, chunk_size: int):
+        """
+        Тест для проверки, что пачки дают top_k ближайших продуктов
+        по косинусной близости всей матрицы.
+        """
+        top_k = 3
+        items = sparse.random(
+            30, 50, density=0.2, format='csr', random_state=0
+        )
+        norms = np.sqrt(np.asarray(items.multiply(items).sum(axis=1)))
+        items = (sparse.diags(1 / norms.ravel()) @ items).tocsr()
+        dense = (items @ items.T).toarray()
+        np.fill_diagonal(dense, 0)
+        similar_products.init_worker(items, top_k)
+        neighbours = {}
+        for chunk in similar_products.get_chunks(30, chunk_size):
+            for product, neighbour, score in zip(
+                *similar_products.get_neighbours(chunk)
+            ):
+                neighbours.setdefault(product, {})[neighbour] = score
+        for product in range(30):
+            expected = {
+                neighbour: dense[product, neighbour]
+                for neighbour in np.argsort(-dense[product])[:top_k]
+                if dense[product, neighbour] > 0
+            }
+            assert neighbours.get(product, {}).keys() == expected.keys()
+            for neighbour, score in expected.items():
+                assert neighbours[product][neighbour] == pytest.approx(score)
+
+
+class TestSimilarProductsAPI:
+    """Класс для тестирования API похожих продуктов."""
+
+    url = '/api/v1/products/{slug}/similar/'
+
+    async def test_similar_products(
+        self,
+        client: AsyncClient,
+        review_1: Review,
+        review_2: Review,
+        review_3: Review,
+        co_review: Review,
+        product_1: Product,
+        product_2: Product
+    ):
+        """
+        Тест для проверки расчета похожих продуктов по общим
+        отзывам и их получения одним SQL-запросом.
+        """
+        for _ in range(2):
+            report = await similar_products.build_similar_products(
+                test_engine, processes=0
+            )
+        assert (report.reviews, report.products, report.pairs) == (4, 2, 2)
+        with assert_num_queries(1):
+            response = await client.get(self.url.format(slug=product_1.slug))
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.json() == [{
+            'product_slug': product_2.slug,
+            'name': product_2.name,
+            'score': pytest.approx(
+                review_1.grade * co_review.grade / math.sqrt(
+                    (review_1.grade ** 2 + review_3.grade ** 2) *
+                    (review_2.grade ** 2 + co_review.grade ** 2)
+                )
+            )
+        }]
+
+    async def test_product_without_similar_products(
+        self,
+        client: AsyncClient,
+        product_1: Product
+    ):
+        """Тест для проверки пустого списка до расчета."""
+        response = await client.get(self.url.format(slug=product_1.slug))
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.json() == []
+
+    async def test_similar_products_of_nonexistent_product(
+        self,
+        client: AsyncClient
+    ):
+        """Тест для проверки ответа 404 для несуществующего продукта."""
+        response = await client.get(self.url.format(slug='nonexistent'))
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,120 @@
+"""Модуль создания тестов для журнала медленных SQL-запросов."""
+
+import logging
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from pytest_lazy_fixtures import lf
+
+from app.core.instrumentation import SlowQueryLog, slow_query_log
+from app.models import Product
+
+
+class TestSlowQueryLog:
+    """Класс для тестирования журнала медленных SQL-запросов."""
+
+    def test_statements_are_grouped_and_bounded(self):
+        """
+        Тест для проверки группировки по отпечатку и вытеснения
+        отпечатка с наименьшим суммарным временем.
+        """
+        log = SlowQueryLog(limit=2, threshold=10)
+        for number in range(100):
+            log.observe(f'SELECT * FROM products WHERE id = {number}',
+                        number / 1000)
+        log.observe("SELECT * FROM users WHERE username = 'a'", 1)
+        log.observe('SELECT count(*) FROM reviews', 0.001)
+        top = log.get_top(10)
+        assert [item['fingerprint'] for item in top] == [
+            'SELECT * FROM products WHERE id = ?',
+            'SELECT count(*) FROM reviews'
+        ]
+        assert top[0]['count'] == 100
+        assert top[0]['p95_seconds'] == pytest.approx(0.094)
+        assert top[0]['max_seconds'] == pytest.approx(0.099)
+
+    def test_repeated_new_statements_survive_in_full_log(self):
+        """
+        Тест для проверки, что повторяющиеся новые отпечатки
+        не вытесняют друг друга из заполненного журнала.
+        """
+        log = SlowQueryLog(limit=3, threshold=10)
+        for table in ('products', 'reviews', 'users'):
+            log.observe(f'SELECT * FROM {table}', 0.01)
+        for _ in range(1000):
+            log.observe('SELECT * FROM slow_a', 1)
+            log.observe('SELECT * FROM slow_b', 1)
+        top = {item['fingerprint']: item for item in log.get_top(10)}
+        assert len(top) == 3
+        for table in ('slow_a', 'slow_b'):
+            statement_stats = top[f'SELECT * FROM {table}']
+            assert statement_stats['count'] >= 1000
+            assert statement_stats['total_seconds'] - (
+                statement_stats['error_seconds']
+            ) == pytest.approx(1000)
+
+    def test_slow_statement_is_logged(self, caplog):
+        """Тест для проверки записи в лог запроса дольше порога."""
+        log = SlowQueryLog(limit=10, threshold=0.5)
+        with caplog.at_level(logging.WARNING):
+            log.observe('SELECT 1', 0.1)
+            log.observe('SELECT 2', 0.6)
+        assert len(caplog.records) == 1
+        assert 'SELECT 2' in caplog.records[0].getMessage()
+
+
+class TestSlowQueriesAPI:
+    """Класс для тестирования API журнала медленных SQL-запросов."""
+
+    url = '/api/v1/admin/slow-queries/'
+    product_url = '/api/v1/products/{product_slug}/'
+
+    async def test_admin_can_get_and_reset_slow_queries(
+        self,
+        admin_client: AsyncClient,
+        product_1: Product,
+        monkeypatch,
+        caplog
+    ):
+        """
+        Тест для проверки получения статистики SQL-запросов
+        и записи медленного запроса в лог с маршрутом.
+        """
+        response = await admin_client.delete(self.url)
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        monkeypatch.setattr(slow_query_log, 'threshold', 0)
+        with caplog.at_level(logging.WARNING):
+            await admin_client.get(
+                self.product_url.format(product_slug=product_1.slug)
+            )
+        assert f'GET {self.product_url}' in caplog.text
+        response = await admin_client.get(
+            self.url, params={'order_by': 'count', 'limit': 2}
+        )
+        assert response.status_code == HTTPStatus.OK, response.json()
+        top = response.json()
+        assert len(top) == 2
+        assert top[0]['count'] >= top[1]['count'] >= 1
+        assert {'fingerprint', 'total_seconds', 'p95_seconds'} <= set(top[0])
+
+    @pytest.mark.parametrize(
+        'parametrized_client, expected_status',
+        (
+            (lf('client'), HTTPStatus.UNAUTHORIZED),
+            (lf('customer_client'), HTTPStatus.FORBIDDEN),
+            (lf('supplier_1_client'), HTTPStatus.FORBIDDEN)
+        ),
+        ids=('anon_user', 'customer', 'supplier')
+    )
+    async def test_another_users_cant_get_slow_queries(
+        self,
+        parametrized_client: AsyncClient,
+        expected_status: int
+    ):
+        """
+        Тест для проверки невозможности получения
+        статистики SQL-запросов другими пользователями.
+        """
+        response = await parametrized_client.get(self.url)
+        assert response.status_code == expected_status
@@ -0,0 +1,130 @@
+"""Модуль создания тестов для распределенной трассировки."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+    OTLPSpanExporter
+)
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter
+)
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.tracing import configure_tracing, get_exporter
+from app.models import Review
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_SPAN_ID = '00f067aa0ba902b7'
+
+exporter = InMemorySpanExporter()
+
+
+@pytest.fixture(scope='module', autouse=True)
+def tracer_provider():
+    """Фикстура для записи всех трасс в память."""
+    configure_tracing(SimpleSpanProcessor(exporter), sample_ratio=1.0)
+
+
+@pytest.fixture(autouse=True)
+def clear_spans():
+    """Фикстура для очистки записанных span'ов перед тестом."""
+    exporter.clear()
+
+
+class TestTracing:
+    """Класс для тестирования трассировки запросов."""
+
+    def test_otlp_exporter(self):
+        """Тест для проверки создания экспортера OTLP."""
+        assert isinstance(get_exporter('otlp'), OTLPSpanExporter)
+
+    url = '/api/v1/products/{product_slug}/reviews/{review_id}/'
+
+    async def test_spans_for_dependencies_validators_crud_and_sql(
+        self,
+        client: AsyncClient,
+        review_1: Review
+    ):
+        """
+        Тест для проверки span'ов зависимостей, валидаторов,
+        методов CRUD и SQL-запросов в одной трассе запроса.
+        """
+        token = create_access_token(
+            review_1.user_username, settings.TOKEN_EXPIRE
+        )
+        response = await client.patch(
+            self.url.format(
+                product_slug=review_1.product_slug, review_id=review_1.id
+            ),
+            json={'grade': 5},
+            headers={'Authorization': f'Bearer {token}'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        root = spans[f'PATCH {self.url}']
+        assert root.parent is None
+        assert root.attributes['http.response.status_code'] == 200
+        for name in (
+            'get_current_user',
+            'validate_and_decode_token',
+            'CRUDUser.get_user_by_username',
+            'BasePermission.__call__',
+            'IsOwnerOrAdminPermission.get_object',
+            'get_review_for_product_or_not_found',
+            'CRUDReview.get_for_product',
+            'CRUDBase.update',
+            'SELECT',
+            'UPDATE'
+        ):
+            assert spans[name].context.trace_id == root.context.trace_id
+        validator = spans['get_review_for_product_or_not_found']
+        assert validator.parent.span_id == (
+            spans['IsOwnerOrAdminPermission.get_object'].context.span_id
+        )
+        assert spans['UPDATE'].attributes['db.statement'].startswith(
+            'UPDATE reviews'
+        )
+
+    async def test_trace_context_propagation(
+        self,
+        client: AsyncClient,
+        review_1: Review
+    ):
+        """Тест для проверки продолжения трассы из заголовка traceparent."""
+        response = await client.get(
+            self.url.format(
+                product_slug=review_1.product_slug, review_id=review_1.id
+            ),
+            headers={'traceparent': f'00-{TRACE_ID}-{PARENT_SPAN_ID}-01'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        root = next(
+            span for span in exporter.get_finished_spans()
+            if span.name.startswith('GET ')
+        )
+        assert format(root.context.trace_id, '032x') == TRACE_ID
+        assert format(root.parent.span_id, '016x') == PARENT_SPAN_ID
+        assert response.headers['traceresponse'].split('-')[1] == TRACE_ID
+
+    async def test_unsampled_parent_is_not_recorded(
+        self,
+        client: AsyncClient,
+        review_1: Review
+    ):
+        """
+        Тест для проверки, что решение о выборке вызывающей
+        стороны соблюдается и трасса не записывается.
+        """
+        response = await client.get(
+            self.url.format(
+                product_slug=review_1.product_slug, review_id=review_1.id
+            ),
+            headers={'traceparent': f'00-{TRACE_ID}-{PARENT_SPAN_ID}-00'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert 'traceresponse' not in response.headers
+        assert not exporter.get_finished_spans()
@@ -8,7 +8,7 @@ from httpx import AsyncClient
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import bcrypt_context
+from app.core.hashing import bcrypt_context
 from app.models import RoleEnum, User
 from .fixtures.fixture_users import TEST_PASSWORD
 from .utils import check_db_data, check_db_fields, check_json_data
@@ -0,0 +1,81 @@
+"""Модуль создания тестов для прогрева и остановки приложения."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+import app.main
+from app.core.db import Base
+from app.core.warmup import open_connections, warm_statements
+
+
+@pytest.fixture
+async def file_engine(tmp_path: Path):
+    """Фикстура для создания движка SQLite с пулом соединений."""
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "warmup.db"}'
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class TestWarmUp:
+    """Класс для тестирования прогрева приложения."""
+
+    async def test_connections_are_opened_up_to_pool_size(self, file_engine):
+        """Тест для проверки открытия соединений не больше размера пула."""
+        opened = await open_connections(
+            file_engine, file_engine.pool.size() + 10
+        )
+        assert opened == file_engine.pool.size()
+        assert file_engine.pool.checkedin() == opened
+        assert file_engine.pool.checkedout() == 0
+
+    async def test_statements_are_cached(self, test_db_session: AsyncSession):
+        """
+        Тест для проверки, что повторный прогрев берет
+        все SQL-запросы из кэша компиляции.
+        """
+        cached = []
+        engine = test_db_session.bind.sync_engine
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def collect(conn, cursor, statement, parameters, context, many):
+            cached.append(context.cache_hit == context.cache_hit.CACHE_HIT)
+
+        try:
+            await warm_statements(test_db_session)
+            cold = list(cached)
+            cached.clear()
+            await warm_statements(test_db_session)
+        finally:
+            event.remove(engine, 'before_cursor_execute', collect)
+        assert len(cached) == len(cold) == 17
+        assert all(cached)
+
+    async def test_lifespan_warms_up_and_disposes_engine(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        file_engine
+    ):
+        """
+        Тест для проверки прогрева соединений при запуске
+        и закрытия соединений при остановке.
+        """
+        monkeypatch.setattr(app.main, 'engine', file_engine)
+        monkeypatch.setattr(
+            app.main,
+            'async_session_maker',
+            async_sessionmaker(file_engine, class_=AsyncSession)
+        )
+        async with app.main.lifespan(app.main.app):
+            assert file_engine.pool.checkedin() > 0
+        assert file_engine.pool.checkedin() == 0
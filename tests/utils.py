@@ -1,5 +1,12 @@
 """Модуль для создания утилит."""
 
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.core.instrumentation import fingerprint
+from .database import test_engine
+
 
 def check_json_data(response, expected_data):
     """Функция для проверки полей и значений для json-формата."""
@@ -47,3 +54,35 @@ async def create_db_obj(test_db_session, model_obj):
     await test_db_session.commit()
     await test_db_session.refresh(model_obj)
     return model_obj
+
+
+@contextmanager
+def capture_queries(engine):
+    """Контекстный менеджер для сбора SQL-запросов к движку."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute',
+                 before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute',
+                     before_cursor_execute)
+
+
+@contextmanager
+def assert_num_queries(expected, engine=test_engine):
+    """
+    Контекстный менеджер для проверки количества SQL-запросов.
+
+    По умолчанию считаются запросы к тестовой БД.
+    """
+    with capture_queries(engine) as queries:
+        yield queries
+    assert len(queries) == expected, (
+        f'Ожидалось SQL-запросов: {expected}, выполнено: {len(queries)}\n'
+        + '\n'.join(fingerprint(query) for query in queries)
+    )